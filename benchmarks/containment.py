@@ -0,0 +1,92 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scaling benchmark for package/file containment resolution.
+
+Builds synthetic documents with a growing number of files, each contained in
+one of the packages, and times the containment index, the verification codes
+of all packages and the relationship scans of the tag-value and
+JSON/YAML/XML writers. The time per file should stay roughly constant:
+
+    python -m benchmarks.containment --files 1000 10000 100000
+"""
+
+import argparse
+import time
+
+from spdx import utils
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.document import Document
+from spdx.file import File
+from spdx.package import Package
+from spdx.relationship import Relationship
+from spdx.writers import tagvalue
+from spdx.writers.jsonyamlxml import Writer
+
+
+def create_document(number_of_files, files_per_package):
+    document = Document(spdx_id="SPDXRef-DOCUMENT")
+    number_of_packages = max(1, number_of_files // files_per_package)
+    for package_number in range(number_of_packages):
+        document.add_package(Package(name="package{}".format(package_number),
+                                     spdx_id="SPDXRef-Package{}".format(package_number)))
+        document.add_relationship(
+            Relationship("SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package{}".format(package_number)))
+    for file_number in range(number_of_files):
+        file = File("./file{}".format(file_number), spdx_id="SPDXRef-File{}".format(file_number))
+        file.set_checksum(Checksum(ChecksumAlgorithm.SHA1, "{:040x}".format(file_number)))
+        document.add_file(file)
+        package_number = file_number % number_of_packages
+        if file_number % 2:
+            relationship = "SPDXRef-Package{} CONTAINS SPDXRef-File{}".format(package_number, file_number)
+        else:
+            relationship = "SPDXRef-File{} CONTAINED_BY SPDXRef-Package{}".format(file_number, package_number)
+        document.add_relationship(Relationship(relationship))
+    return document
+
+
+def verification_codes(document):
+    containment_index = utils.ContainmentIndex.from_document(document)
+    return [utils.calc_verif_code(containment_index.files_in_package(package.spdx_id))
+            for package in document.packages]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    argument_parser.add_argument("--files-per-package", type=int, default=100)
+    arguments = argument_parser.parse_args()
+
+    benchmarks = [
+        ("index", lambda document: utils.ContainmentIndex.from_document(document)),
+        ("verif_codes", verification_codes),
+        ("tv_scan", lambda document: tagvalue.scan_relationships(document.relationships, document.packages,
+                                                                 document.files)),
+        ("json_split", lambda document: Writer(document).split_relationships()),
+    ]
+    print("{:>10} {:>12} {:>14} {:>14}".format("files", "benchmark", "seconds", "us/file"))
+    for number_of_files in arguments.files:
+        document = create_document(number_of_files, arguments.files_per_package)
+        for name, benchmark in benchmarks:
+            seconds = timed(benchmark, document)
+            print("{:>10} {:>12} {:>14.4f} {:>14.2f}".format(number_of_files, name, seconds,
+                                                             seconds / number_of_files * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scaling benchmark for the structural document diff.
+
+Builds pairs of synthetic documents with a growing number of files, where
+the new document has a changed license on every tenth file, a renamed file
+and one more package. Times the diff of the documents and the streaming diff
+of the two written as JSON. The time per file should stay roughly constant:
+
+    python -m benchmarks.document_diff --files 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.formats import git_commit
+from spdx.synthetic import create_document
+from spdx.document_diff import diff_documents, diff_files
+from spdx.license import License
+from spdx.package import Package
+from spdx.writers import json as json_writer
+
+
+def create_documents(number_of_files, files_per_package):
+    parameters = {"packages": max(1, number_of_files // files_per_package), "files_per_package": files_per_package,
+                  "snippets": 10, "relationships": 10, "annotations": 10}
+    old_document, new_document = create_document(**parameters), create_document(**parameters)
+    for file in new_document.files[::10]:
+        file.conc_lics = License.from_identifier("MIT")
+    new_document.files[-1].spdx_id = "SPDXRef-Renamed"
+    new_document.add_package(Package(name="new-package", spdx_id="SPDXRef-NewPackage"))
+    return old_document, new_document
+
+
+def count_differences(diff):
+    return sum(len(diff.added[kind]) + len(diff.removed[kind]) + len(diff.changed[kind]) for kind in diff.added)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_benchmarks(file_counts, files_per_package=100):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        old_file_name, new_file_name = os.path.join(directory, "old.json"), os.path.join(directory, "new.json")
+        for number_of_files in file_counts:
+            old_document, new_document = create_documents(number_of_files, files_per_package)
+            for document, file_name in ((old_document, old_file_name), (new_document, new_file_name)):
+                with open(file_name, "w") as out:
+                    json_writer.write_document(document, out, validate=False)
+            benchmarks = {
+                "documents": lambda: diff_documents(old_document, new_document),
+                "streaming": lambda: diff_files(old_file_name, new_file_name, streaming=True),
+            }
+            for name, benchmark in benchmarks.items():
+                diff, seconds = timed(benchmark)
+                results.append({"files": len(old_document.files), "benchmark": name, "seconds": seconds,
+                                "differences": count_differences(diff)})
+    return {"commit": git_commit(), "files_per_package": files_per_package, "results": results}
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    argument_parser.add_argument("--files-per-package", type=int, default=100)
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    arguments = argument_parser.parse_args()
+
+    report = run_benchmarks(arguments.files, arguments.files_per_package)
+
+    print("{:>10} {:>12} {:>12} {:>12} {:>10}".format("files", "benchmark", "differences", "seconds", "us/file"))
+    for result in report["results"]:
+        print("{:>10} {:>12} {:>12} {:>12.4f} {:>10.2f}".format(result["files"], result["benchmark"],
+                                                                result["differences"], result["seconds"],
+                                                                result["seconds"] / result["files"] * 1e6))
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark validation, writing and parsing of a synthetic document in every format.
+
+Each operation is timed, then run again under tracemalloc to record its peak
+memory. Results are printed as a table and can be written as JSON, to compare
+them with the results of another commit:
+
+    python -m benchmarks.formats --packages 100 --files-per-package 100 --output new.json
+    python -m benchmarks.formats --packages 100 --files-per-package 100 --compare old.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from spdx.synthetic import create_document
+from spdx.parsers.parse_anything import parse_file
+from spdx.writers import write_anything
+
+FORMATS = ["json", "yaml", "xml", "spdx", "rdf.xml"]
+
+
+def measure(function, memory):
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    peak_bytes = None
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, seconds, peak_bytes
+
+
+def element_counts(document):
+    return {"packages": len(document.packages), "files": len(document.files), "snippets": len(document.snippet),
+            "relationships": len(document.relationships), "annotations": len(document.annotations)}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              universal_newlines=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmarks(parameters, formats, memory=True):
+    document = create_document(**parameters)
+    results = []
+    _, seconds, peak_bytes = measure(document.validate, memory)
+    results.append({"operation": "validate", "format": None, "seconds": seconds, "peak_bytes": peak_bytes})
+
+    with tempfile.TemporaryDirectory() as directory:
+        for out_format in formats:
+            file_path = os.path.join(directory, "document." + out_format)
+            _, seconds, peak_bytes = measure(lambda: write_anything.write_file(document, file_path, validate=False),
+                                             memory)
+            results.append({"operation": "write", "format": out_format, "seconds": seconds,
+                            "peak_bytes": peak_bytes, "file_bytes": os.path.getsize(file_path)})
+
+            # the parsers print their error messages
+            with contextlib.redirect_stdout(io.StringIO()):
+                (parsed_document, error), seconds, peak_bytes = measure(lambda: parse_file(file_path), memory)
+            results.append({"operation": "parse", "format": out_format, "seconds": seconds,
+                            "peak_bytes": peak_bytes, "error": bool(error),
+                            "elements": element_counts(parsed_document)})
+
+    return {"commit": git_commit(), "python": platform.python_version(), "parameters": parameters,
+            "elements": element_counts(document), "results": results}
+
+
+def result_key(result):
+    return result["operation"], result["format"]
+
+
+def print_results(report, baseline=None):
+    baseline_results = {result_key(result): result for result in baseline["results"]} if baseline else {}
+    print("{:>10} {:>8} {:>10} {:>12} {:>10}".format("operation", "format", "seconds", "peak MiB", "vs base"))
+    for result in report["results"]:
+        peak = "-" if result["peak_bytes"] is None else "{:.2f}".format(result["peak_bytes"] / 2 ** 20)
+        base = baseline_results.get(result_key(result))
+        ratio = "{:.2f}x".format(result["seconds"] / base["seconds"]) if base and base["seconds"] else ""
+        print("{:>10} {:>8} {:>10.4f} {:>12} {:>10}".format(result["operation"], result["format"] or "-",
+                                                            result["seconds"], peak, ratio))
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--packages", type=int, default=10)
+    argument_parser.add_argument("--files-per-package", type=int, default=10)
+    argument_parser.add_argument("--snippets", type=int, default=10)
+    argument_parser.add_argument("--relationships", type=int, default=10)
+    argument_parser.add_argument("--annotations", type=int, default=10)
+    argument_parser.add_argument("--license-depth", type=int, default=3)
+    argument_parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS)
+    argument_parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc runs")
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    argument_parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    arguments = argument_parser.parse_args()
+
+    parameters = {"packages": arguments.packages, "files_per_package": arguments.files_per_package,
+                  "snippets": arguments.snippets, "relationships": arguments.relationships,
+                  "annotations": arguments.annotations, "license_depth": arguments.license_depth}
+    report = run_benchmarks(parameters, arguments.formats, memory=not arguments.no_memory)
+
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+    print_results(report, baseline)
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the import time of spdx.config and the time and memory of the first
+license lookup, compared with parsing licenses.json and exceptions.json.
+
+Each measurement runs in a fresh interpreter, once for the time and once under
+tracemalloc for the memory still allocated afterwards:
+
+    python -m benchmarks.license_lists --repeat 10
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+MEASUREMENTS = {
+    # spdx is imported first, so that only the spdx.config module itself is timed
+    "import_config": """
+import spdx, time, tracemalloc
+TRACE
+start = time.perf_counter()
+import spdx.config
+""",
+    "first_lookup": """
+import spdx.config, time, tracemalloc
+TRACE
+start = time.perf_counter()
+spdx.config.LICENSE_MAP["MIT"]
+spdx.config.EXCEPTION_MAP["Bison-exception-2.2"]
+""",
+    "load_json_lists": """
+import spdx.config, time, tracemalloc
+TRACE
+start = time.perf_counter()
+spdx.config.load_license_list(spdx.config._licenses)
+spdx.config.load_exception_list(spdx.config._exceptions)
+""",
+}
+
+REPORT = """
+seconds = time.perf_counter() - start
+print(seconds, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def run(code):
+    return subprocess.run([sys.executable, "-c", code + REPORT], stdout=subprocess.PIPE, check=True,
+                          universal_newlines=True).stdout.split()
+
+
+def measure(code):
+    seconds, _ = run(code.replace("TRACE", ""))
+    _, allocated_bytes = run(code.replace("TRACE", "tracemalloc.start()"))
+    return float(seconds), int(allocated_bytes)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    arguments = argument_parser.parse_args()
+
+    results = []
+    print("{:>16} {:>12} {:>14}".format("measurement", "best ms", "retained KiB"))
+    for name, code in MEASUREMENTS.items():
+        runs = [measure(code) for _ in range(arguments.repeat)]
+        seconds = min(run[0] for run in runs)
+        allocated_bytes = min(run[1] for run in runs)
+        results.append({"measurement": name, "seconds": seconds, "retained_bytes": allocated_bytes})
+        print("{:>16} {:>12.3f} {:>14.1f}".format(name, seconds * 1000, allocated_bytes / 1024))
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
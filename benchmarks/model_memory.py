@@ -0,0 +1,151 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the memory held per element of the high-cardinality model classes.
+
+For each class, `count` elements are created and filled the way the parsers
+fill them, then validated. The memory still allocated while they are alive,
+as traced by tracemalloc, is reported per element. MinimalFile are files with
+only a name, an SPDX id, a SHA1 and shared licenses, FileTable the same files
+in a FileTable. Results can be written as JSON, to compare them with the
+results of another commit:
+
+    python -m benchmarks.model_memory --count 100000 --output new.json
+    python -m benchmarks.model_memory --count 100000 --compare old.json
+"""
+
+import argparse
+import json
+import tracemalloc
+
+from benchmarks.formats import git_commit
+from spdx.synthetic import DATE, LICENSE_IDS, checksum_value, license_expression
+from spdx.annotation import Annotation
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.creationinfo import Tool
+from spdx.file import File, FileType
+from spdx.file_table import FileTable
+from spdx.license import License
+from spdx.parsers.loggers import ErrorMessages
+from spdx.relationship import Relationship
+from spdx.snippet import Snippet
+from spdx.utils import NoAssert
+
+# shared by all elements, as the parsed values of a document mostly are
+LICENSE_EXPRESSION = license_expression(3)
+FILE_LICENSES = [License.from_identifier(license_id) for license_id in LICENSE_IDS]
+TOOL = Tool("spdx-benchmarks")
+
+
+def create_file(number):
+    file = File("./package/file{}.c".format(number), spdx_id="SPDXRef-File{}".format(number))
+    file.set_checksum(Checksum(ChecksumAlgorithm.SHA1, checksum_value(40, number)))
+    file.file_types.append(FileType.SOURCE)
+    file.conc_lics = LICENSE_EXPRESSION
+    file.add_lics(FILE_LICENSES[number % len(FILE_LICENSES)])
+    file.copyright = "Copyright {} Synthetic".format(number)
+    return file
+
+
+def create_minimal_file(number):
+    file = File("./src/module{}/file{}.c".format(number // 100, number), spdx_id="SPDXRef-File{}".format(number))
+    file.set_checksum(Checksum(ChecksumAlgorithm.SHA1, checksum_value(40, number)))
+    file.conc_lics = FILE_LICENSES[0]
+    file.add_lics(FILE_LICENSES[0])
+    file.copyright = NoAssert()
+    return file
+
+
+def create_snippet(number):
+    snippet = Snippet(spdx_id="SPDXRef-Snippet{}".format(number), snip_from_file_spdxid="SPDXRef-File{}".format(number),
+                      conc_lics=LICENSE_EXPRESSION, copyright="Copyright {} Synthetic".format(number))
+    snippet.byte_range = (number, number + 100)
+    snippet.add_lics(FILE_LICENSES[number % len(FILE_LICENSES)])
+    return snippet
+
+
+def create_relationship(number):
+    return Relationship("SPDXRef-Package DEPENDS_ON SPDXRef-File{}".format(number))
+
+
+def create_checksum(number):
+    return Checksum(ChecksumAlgorithm.SHA1, checksum_value(40, number))
+
+
+def create_annotation(number):
+    return Annotation(annotator=TOOL, annotation_date=DATE, comment="Annotation {}".format(number),
+                      annotation_type="OTHER", spdx_id="SPDXRef-File{}".format(number))
+
+
+ELEMENT_FACTORIES = {
+    "File": create_file,
+    "Snippet": create_snippet,
+    "Relationship": create_relationship,
+    "Checksum": create_checksum,
+    "Annotation": create_annotation,
+    "MinimalFile": create_minimal_file,
+    "FileTable": create_minimal_file,
+}
+# the elements are kept in a list unless given here
+CONTAINERS = {"FileTable": FileTable}
+
+
+def measure(create_element, count, container=list, validate=True):
+    tracemalloc.start()
+    try:
+        elements = container(create_element(number) for number in range(count))
+        if validate:
+            for element in elements:
+                if hasattr(element, "validate"):
+                    element.validate(ErrorMessages())
+        allocated_bytes = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return allocated_bytes / count
+
+
+def run_benchmarks(count, classes=tuple(ELEMENT_FACTORIES)):
+    results = [{"class": name, "bytes_per_element": measure(ELEMENT_FACTORIES[name], count,
+                                                            CONTAINERS.get(name, list))}
+               for name in classes]
+    return {"commit": git_commit(), "count": count, "results": results}
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--count", type=int, default=100000)
+    argument_parser.add_argument("--classes", nargs="+", choices=list(ELEMENT_FACTORIES),
+                                 default=list(ELEMENT_FACTORIES))
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    argument_parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    arguments = argument_parser.parse_args()
+
+    report = run_benchmarks(arguments.count, arguments.classes)
+
+    baseline_results = {}
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline_results = {result["class"]: result for result in json.load(baseline_file)["results"]}
+    print("{:>14} {:>12} {:>12} {:>10}".format("class", "bytes", "base bytes", "vs base"))
+    for result in report["results"]:
+        base = baseline_results.get(result["class"])
+        base_bytes = "{:.0f}".format(base["bytes_per_element"]) if base else ""
+        ratio = "{:.2f}x".format(result["bytes_per_element"] / base["bytes_per_element"]) if base else ""
+        print("{:>14} {:>12.0f} {:>12} {:>10}".format(result["class"], result["bytes_per_element"], base_bytes,
+                                                      ratio))
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
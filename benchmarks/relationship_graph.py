@@ -0,0 +1,94 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scaling benchmark for the relationship graph.
+
+Builds the graph of a growing number of relationships: packages that each
+DEPENDS_ON the next one and CONTAINS files, half of them stated as
+CONTAINED_BY. Times building the graph, the transitive dependencies of the
+first package, the transitive dependents of the last one, everything the
+first package transitively depends on or contains, and the cycle detection. The time per relationship should stay roughly constant:
+
+    python -m benchmarks.relationship_graph --relationships 10000 100000 1000000
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.formats import git_commit
+from spdx.relationship import Relationship
+from spdx.relationship_graph import RelationshipGraph
+
+
+def create_relationships(number_of_relationships, files_per_package):
+    number_of_packages = max(2, number_of_relationships // (files_per_package + 1))
+    relationships = [Relationship("SPDXRef-Package{} DEPENDS_ON SPDXRef-Package{}".format(
+        package_number, package_number + 1)) for package_number in range(number_of_packages - 1)]
+    for file_number in range(number_of_relationships - len(relationships)):
+        package_number = file_number % number_of_packages
+        if file_number % 2:
+            relationship = "SPDXRef-Package{} CONTAINS SPDXRef-File{}".format(package_number, file_number)
+        else:
+            relationship = "SPDXRef-File{} CONTAINED_BY SPDXRef-Package{}".format(file_number, package_number)
+        relationships.append(Relationship(relationship))
+    return relationships, number_of_packages
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_benchmarks(relationship_counts, files_per_package=10):
+    results = []
+    for number_of_relationships in relationship_counts:
+        relationships, number_of_packages = create_relationships(number_of_relationships, files_per_package)
+        graph, build_seconds = timed(lambda: RelationshipGraph(relationships))
+        last_package = "SPDXRef-Package{}".format(number_of_packages - 1)
+        benchmarks = {
+            "build": (None, build_seconds),
+            "dependencies": timed(lambda: graph.reachable("SPDXRef-Package0", ["DEPENDS_ON"])),
+            "dependents": timed(lambda: graph.reachable(last_package, ["DEPENDS_ON"], reverse=True)),
+            "closure": timed(lambda: graph.reachable("SPDXRef-Package0", ["DEPENDS_ON", "CONTAINS"])),
+            "cycles": timed(lambda: graph.find_cycles()),
+        }
+        for name, (result, seconds) in benchmarks.items():
+            results.append({"relationships": len(relationships), "benchmark": name, "seconds": seconds,
+                            "reached": None if result is None else len(result)})
+    return {"commit": git_commit(), "files_per_package": files_per_package, "results": results}
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--relationships", type=int, nargs="+", default=[10000, 100000, 1000000])
+    argument_parser.add_argument("--files-per-package", type=int, default=10)
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    arguments = argument_parser.parse_args()
+
+    report = run_benchmarks(arguments.relationships, arguments.files_per_package)
+
+    print("{:>14} {:>14} {:>10} {:>12} {:>18}".format("relationships", "benchmark", "reached", "seconds",
+                                                     "us/relationship"))
+    for result in report["results"]:
+        reached = "" if result["reached"] is None else result["reached"]
+        print("{:>14} {:>14} {:>10} {:>12.4f} {:>18.3f}".format(
+            result["relationships"], result["benchmark"], reached, result["seconds"],
+            result["seconds"] / result["relationships"] * 1e6))
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the line-oriented tag-value lexer with the PLY lexer.
+
+A synthetic document is written as tag-value to a temporary file, which each
+lexer tokenizes from the file object, once for the time and once under
+tracemalloc for the peak memory. The token streams are checked to be equal:
+
+    python -m benchmarks.tagvalue_lexer --packages 20 --files-per-package 200
+"""
+
+import argparse
+import json
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+
+from spdx.synthetic import create_document
+from spdx.parsers.lexers.tagvalue import Lexer, LineLexer
+from spdx.writers import tagvalue
+
+LEXERS = {"ply": Lexer, "line": LineLexer}
+
+
+def tokenize(lexer_class, file_name):
+    lexer = lexer_class()
+    lexer.build(reflags=re.UNICODE)
+    with open(file_name) as file:
+        lexer.input(file)
+        return [(token.type, token.value, token.lineno) for token in iter(lexer.token, None)]
+
+
+def measure(lexer_class, file_name, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = tokenize(lexer_class, file_name)
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        # count the tokens instead of keeping them, as the parser does
+        lexer = lexer_class()
+        lexer.build(reflags=re.UNICODE)
+        with open(file_name) as file:
+            lexer.input(file)
+            for _ in iter(lexer.token, None):
+                pass
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return tokens, min(seconds), peak_bytes
+
+
+def run_benchmarks(parameters, repeat=3):
+    document = create_document(**parameters)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "document.spdx")
+        with open(file_name, "w") as out:
+            tagvalue.write_document(document, out, validate=False)
+        file_bytes = os.path.getsize(file_name)
+        token_streams = {}
+        for name, lexer_class in LEXERS.items():
+            token_streams[name], seconds, peak_bytes = measure(lexer_class, file_name, repeat)
+            results.append({"lexer": name, "seconds": seconds, "peak_bytes": peak_bytes,
+                            "tokens": len(token_streams[name])})
+    return {"parameters": parameters, "file_bytes": file_bytes,
+            "same_tokens": token_streams["ply"] == token_streams["line"], "results": results}
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--packages", type=int, default=10)
+    argument_parser.add_argument("--files-per-package", type=int, default=100)
+    argument_parser.add_argument("--snippets", type=int, default=10)
+    argument_parser.add_argument("--relationships", type=int, default=10)
+    argument_parser.add_argument("--annotations", type=int, default=10)
+    argument_parser.add_argument("--license-depth", type=int, default=3)
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    arguments = argument_parser.parse_args()
+
+    parameters = {"packages": arguments.packages, "files_per_package": arguments.files_per_package,
+                  "snippets": arguments.snippets, "relationships": arguments.relationships,
+                  "annotations": arguments.annotations, "license_depth": arguments.license_depth}
+    report = run_benchmarks(parameters, arguments.repeat)
+
+    print("{} bytes, same tokens: {}".format(report["file_bytes"], report["same_tokens"]))
+    print("{:>6} {:>10} {:>10} {:>12}".format("lexer", "tokens", "seconds", "peak MiB"))
+    for result in report["results"]:
+        print("{:>6} {:>10} {:>10.4f} {:>12.2f}".format(result["lexer"], result["tokens"], result["seconds"],
+                                                        result["peak_bytes"] / 2 ** 20))
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
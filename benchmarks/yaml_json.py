@@ -0,0 +1,145 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare writing and parsing a synthetic document as YAML with JSON.
+
+YAML is written and parsed with the libyaml based C dumper and loader (if
+PyYAML was built with them), with the pure-Python ones, and in streaming
+mode, which writes and parses one element at a time:
+
+    python -m benchmarks.yaml_json --packages 10 --files-per-package 100
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+from benchmarks.formats import element_counts
+from spdx.synthetic import create_document
+from spdx.parsers import jsonparser, yamlparser
+from spdx.parsers.jsonyamlxmlbuilders import Builder
+from spdx.parsers.loggers import StandardLogger
+from spdx.writers import json as json_writer
+from spdx.writers import yaml as yaml_writer
+
+
+@contextlib.contextmanager
+def pure_python_yaml():
+    """
+    Use the pure-Python YAML loader and dumper, as if PyYAML was built
+    without libyaml.
+    """
+    loader, dumper = yamlparser.SafeLoader, yaml_writer.SafeDumper
+    yamlparser.SafeLoader, yaml_writer.SafeDumper = yaml.SafeLoader, yaml.SafeDumper
+    try:
+        yield
+    finally:
+        yamlparser.SafeLoader, yaml_writer.SafeDumper = loader, dumper
+
+
+# variant name: (file extension, writer, parser module, streaming, use the pure-Python YAML classes)
+VARIANTS = {
+    "json": (".json", json_writer, jsonparser, False, False),
+    "json-streaming": (".json", json_writer, jsonparser, True, False),
+    "yaml-c": (".yaml", yaml_writer, yamlparser, False, False),
+    "yaml-python": (".yaml", yaml_writer, yamlparser, False, True),
+    "yaml-streaming": (".yaml", yaml_writer, yamlparser, True, False),
+}
+
+
+def measure(function, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, min(seconds), peak_bytes
+
+
+def run_variant(document, file_name, writer_module, parser_module, streaming, repeat):
+    def write():
+        with open(file_name, "w") as out:
+            writer_module.write_document(document, out, validate=False, streaming=streaming)
+
+    def parse():
+        with open(file_name) as file:
+            return parser_module.Parser(Builder(), StandardLogger()).parse(file, incremental=streaming)
+
+    _, write_seconds, write_peak_bytes = measure(write, repeat)
+    # the parsers print their error messages
+    with contextlib.redirect_stdout(io.StringIO()):
+        (parsed_document, error), parse_seconds, parse_peak_bytes = measure(parse, repeat)
+    return {"write_seconds": write_seconds, "write_peak_bytes": write_peak_bytes, "parse_seconds": parse_seconds,
+            "parse_peak_bytes": parse_peak_bytes, "file_bytes": os.path.getsize(file_name), "error": bool(error),
+            "elements": element_counts(parsed_document)}
+
+
+def run_benchmarks(parameters, variants=tuple(VARIANTS), repeat=3):
+    document = create_document(**parameters)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in variants:
+            extension, writer_module, parser_module, streaming, pure_python = VARIANTS[name]
+            file_name = os.path.join(directory, name + extension)
+            with pure_python_yaml() if pure_python else contextlib.ExitStack():
+                result = run_variant(document, file_name, writer_module, parser_module, streaming, repeat)
+            result["variant"] = name
+            results.append(result)
+    return {"parameters": parameters, "libyaml": yaml.__with_libyaml__, "elements": element_counts(document),
+            "results": results}
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--packages", type=int, default=10)
+    argument_parser.add_argument("--files-per-package", type=int, default=10)
+    argument_parser.add_argument("--snippets", type=int, default=10)
+    argument_parser.add_argument("--relationships", type=int, default=10)
+    argument_parser.add_argument("--annotations", type=int, default=10)
+    argument_parser.add_argument("--license-depth", type=int, default=3)
+    argument_parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--output", help="write the results as JSON to this file")
+    arguments = argument_parser.parse_args()
+
+    parameters = {"packages": arguments.packages, "files_per_package": arguments.files_per_package,
+                  "snippets": arguments.snippets, "relationships": arguments.relationships,
+                  "annotations": arguments.annotations, "license_depth": arguments.license_depth}
+    report = run_benchmarks(parameters, arguments.variants, arguments.repeat)
+
+    print("libyaml: {}".format(report["libyaml"]))
+    print("{:>15} {:>10} {:>10} {:>10} {:>10} {:>10}".format("variant", "MiB", "write s", "write MiB", "parse s",
+                                                             "parse MiB"))
+    for result in report["results"]:
+        print("{:>15} {:>10.2f} {:>10.4f} {:>10.2f} {:>10.4f} {:>10.2f}".format(
+            result["variant"], result["file_bytes"] / 2 ** 20, result["write_seconds"],
+            result["write_peak_bytes"] / 2 ** 20, result["parse_seconds"], result["parse_peak_bytes"] / 2 ** 20))
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Regenerate spdx/license_list_data.py from licenses.json and exceptions.json.
+
+spdx.config loads the license and exception lists from this module instead of
+parsing the JSON files. Regenerate it whenever the JSON files are updated:
+
+    python -m spdx._build_license_lists
+"""
+
+import codecs
+import json
+import os
+
+# spdx.config imports the generated module, so it is not imported here
+_base_dir = os.path.dirname(__file__)
+LICENSES_FILE = os.path.join(_base_dir, "licenses.json")
+EXCEPTIONS_FILE = os.path.join(_base_dir, "exceptions.json")
+LICENSE_LIST_DATA_FILE = os.path.join(_base_dir, "license_list_data.py")
+
+HEADER = '''# Generated by "python -m spdx._build_license_lists" from licenses.json and
+# exceptions.json, do not edit.
+# (identifier, name) pairs of the non-deprecated licenses and exceptions.
+'''
+
+
+def _read_list(file_name, object_type, id_attribute):
+    with codecs.open(file_name, "rb", encoding="utf-8") as lics:
+        licenses = json.load(lics)
+    entries = tuple(
+        (lic[id_attribute], lic["name"])
+        for lic in licenses[object_type]
+        if not lic.get("isDeprecatedLicenseId")
+    )
+    return licenses["licenseListVersion"], entries
+
+
+def _format_entries(name, entries):
+    lines = ["{} = (".format(name)]
+    lines.extend("    ({!r}, {!r}),".format(identifier, full_name) for identifier, full_name in entries)
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def generate_license_list_data(licenses_file=LICENSES_FILE, exceptions_file=EXCEPTIONS_FILE):
+    """
+    Return the source of the license list data module.
+    """
+    license_list_version, licenses = _read_list(licenses_file, "licenses", "licenseId")
+    exception_list_version, exceptions = _read_list(exceptions_file, "exceptions", "licenseExceptionId")
+    assert license_list_version == exception_list_version
+    return "\n".join([
+        HEADER,
+        "LICENSE_LIST_VERSION = {!r}\n".format(license_list_version),
+        _format_entries("LICENSES", licenses),
+        _format_entries("EXCEPTIONS", exceptions),
+    ])
+
+
+def build_license_list_data():
+    with codecs.open(LICENSE_LIST_DATA_FILE, "w", encoding="utf-8") as data_file:
+        data_file.write(generate_license_list_data())
+
+
+if __name__ == "__main__":
+    build_license_list_data()
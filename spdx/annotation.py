@@ -12,11 +12,12 @@
 from datetime import datetime
 from functools import total_ordering
 
+from spdx.change_tracking import ChangeTracked, IndexedAttribute
 from spdx.utils import datetime_iso_format
 
 
 @total_ordering
-class Annotation(object):
+class Annotation(ChangeTracked):
 
     """
     Document annotation information.
@@ -35,6 +36,10 @@ class Annotation(object):
     Type: str.
     """
 
+    __slots__ = ("annotator", "annotation_date", "comment", "annotation_type", "_spdx_id")
+
+    spdx_id = IndexedAttribute()
+
     def __init__(
         self,
         annotator=None,
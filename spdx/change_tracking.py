@@ -0,0 +1,197 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import operator
+from typing import Dict, Optional, Tuple
+
+
+class ChangeTracked(object):
+    """
+    Base class of the document elements whose changes are detected by the
+    incremental validation of spdx.document.Document, which compares their
+    change_key to the one they had when they were validated. Assigning
+    another value to any attribute counts as a change, and so does adding or
+    removing an item of one of the lists or dicts named in
+    collection_attributes. Changing a value, or an item of such a list or
+    dict, in place is not detected, call mark_changed after it.
+
+    The attributes the SPDX id indexes of spdx.document.Document are keyed
+    by are IndexedAttributes, see there for how the indexes detect that
+    they changed.
+    """
+
+    __slots__ = ("_change_count", "_index_changes")
+
+    # attributes holding lists or dicts, possibly empty or not set
+    collection_attributes = ()
+
+    def mark_changed(self) -> None:
+        self._change_count = getattr(self, "_change_count", 0) + 1
+
+    def change_key(self) -> Tuple:
+        """
+        Return the state of the element for is_unchanged: the names and
+        values of its attributes, the lengths of the collection_attributes
+        and the number of calls of mark_changed. Empty collections count as
+        not set, as they are created when first read.
+        """
+        attributes = [(name, getattr(self, name, None)) for name in _slot_names(type(self))]
+        attributes.extend(getattr(self, "__dict__", {}).items())
+        names, counts, values = [], [getattr(self, "_change_count", 0)], []
+        for name, value in attributes:
+            if name in self.collection_attributes:
+                counts.append(len(value) if value else 0)
+                value = value if value else None
+            names.append(name)
+            values.append(value)
+        return tuple(names), tuple(counts), tuple(values)
+
+
+_slot_names_by_class: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slot_names(cls) -> Tuple[str, ...]:
+    """
+    Return the slots of cls and of its bases, except those of ChangeTracked.
+    """
+    names = _slot_names_by_class.get(cls)
+    if names is None:
+        names = tuple(name for klass in reversed(cls.__mro__) if klass is not ChangeTracked
+                      for name in klass.__dict__.get("__slots__", ()) if not name.startswith("__"))
+        _slot_names_by_class[cls] = names
+    return names
+
+
+def change_key(element) -> Optional[Tuple]:
+    """
+    Return the change key of element, or None if its changes are not tracked.
+    """
+    if isinstance(element, ChangeTracked):
+        return element.change_key()
+    return None
+
+
+def is_unchanged(element, key: Optional[Tuple]) -> bool:
+    """
+    Return whether the changes of element are tracked and it did not change
+    since change_key returned key. The attribute values are compared by
+    identity, so that comparing them is cheap and can not fail.
+    """
+    if key is None or not isinstance(element, ChangeTracked):
+        return False
+    names, counts, values = element.change_key()
+    return names == key[0] and counts == key[1] and all(map(operator.is_, values, key[2]))
+
+
+class ChangeCounter(object):
+    """
+    Number of changes of a document that its indexes depend on, see
+    IndexedAttribute.
+    """
+
+    __slots__ = ("changes",)
+
+    def __init__(self):
+        self.changes = 0
+
+
+class IndexedAttribute(object):
+    """
+    Descriptor of an attribute of a ChangeTracked class that the indexes of
+    spdx.document.Document are keyed by, such as spdx_id, stored in the
+    slot of the same name with a leading underscore. Replacing its value,
+    but not setting it for the first time as the parsers do, is counted in
+    the ChangeCounter of the document the element was last indexed in, see
+    track_index_changes.
+    """
+
+    def __set_name__(self, owner, name):
+        self.slot_name = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.slot_name, None)
+
+    def __set__(self, instance, value):
+        if getattr(instance, self.slot_name, None) is not None:
+            index_changes = getattr(instance, "_index_changes", None)
+            if index_changes is not None:
+                index_changes.changes += 1
+        setattr(instance, self.slot_name, value)
+
+
+def track_index_changes(element, index_changes: ChangeCounter) -> None:
+    """
+    Count the replacements of the IndexedAttributes of element in
+    index_changes from now on, if its changes are tracked.
+    """
+    if isinstance(element, ChangeTracked):
+        element._index_changes = index_changes
+
+
+class TrackedList(list):
+    """
+    List that counts the calls of its modifying methods in `changes`, so that
+    the document indexes of its items can detect that it was modified.
+    """
+
+    def __init__(self, items=()):
+        super(TrackedList, self).__init__(items)
+        self.changes = 0
+
+    def __setitem__(self, index, value):
+        self.changes += 1
+        super(TrackedList, self).__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.changes += 1
+        super(TrackedList, self).__delitem__(index)
+
+    def __iadd__(self, items):
+        self.changes += 1
+        return super(TrackedList, self).__iadd__(items)
+
+    def __imul__(self, count):
+        self.changes += 1
+        return super(TrackedList, self).__imul__(count)
+
+    def append(self, item):
+        self.changes += 1
+        super(TrackedList, self).append(item)
+
+    def extend(self, items):
+        self.changes += 1
+        super(TrackedList, self).extend(items)
+
+    def insert(self, index, item):
+        self.changes += 1
+        super(TrackedList, self).insert(index, item)
+
+    def pop(self, index=-1):
+        self.changes += 1
+        return super(TrackedList, self).pop(index)
+
+    def remove(self, item):
+        self.changes += 1
+        super(TrackedList, self).remove(item)
+
+    def clear(self):
+        self.changes += 1
+        super(TrackedList, self).clear()
+
+    def sort(self, *args, **kwargs):
+        self.changes += 1
+        super(TrackedList, self).sort(*args, **kwargs)
+
+    def reverse(self):
+        self.changes += 1
+        super(TrackedList, self).reverse()
@@ -0,0 +1,141 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent cache of file checksums, stored in a local SQLite database.
+
+Entries are keyed by the identity of a file: its absolute path, size,
+modification time in nanoseconds and inode. A file that was modified, replaced
+or moved gets a new identity and is hashed again. Enable the cache for
+File.calculate_checksum and utils.calc_verif_code with:
+
+    with ChecksumCache("~/.cache/spdx-checksums.sqlite") as cache:
+        hashing.set_checksum_cache(cache)
+        ...
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from spdx.checksum import ChecksumAlgorithm
+
+
+class FileIdentity(NamedTuple):
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+def file_identity(path: str) -> FileIdentity:
+    stat_result = os.stat(path)
+    return FileIdentity(os.path.abspath(path), stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino)
+
+
+class ChecksumCache(object):
+    """
+    SQLite backed checksum cache.
+    - cache_path: database file, created if missing.
+    - max_age: entries not used for more than max_age seconds are evicted.
+    - max_entries: number of (file, algorithm) entries kept, least recently used
+      entries are evicted first.
+    - force: ignore cached checksums, but store the recomputed ones.
+    - hits, misses: number of lookups served from the cache or not.
+    New entries are committed by flush and close, eviction runs on close.
+    """
+
+    def __init__(self, cache_path: str, max_age: Optional[float] = None, max_entries: Optional[int] = None,
+                 force: bool = False):
+        self.cache_path = os.path.expanduser(cache_path)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.force = force
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS checksums ("
+            "path TEXT NOT NULL, algorithm TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "inode INTEGER NOT NULL, value TEXT NOT NULL, last_used REAL NOT NULL, "
+            "PRIMARY KEY (path, algorithm))"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS checksums_last_used ON checksums (last_used)")
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, identity: FileIdentity, algorithms: Iterable[ChecksumAlgorithm]) \
+            -> Optional[Dict[ChecksumAlgorithm, str]]:
+        """
+        Return the cached checksums of the file for all algorithms, or None if
+        one of them is missing or force is set.
+        """
+        algorithms = list(algorithms)
+        with self.lock:
+            if self.force:
+                self.misses += 1
+                return None
+            rows = self.connection.execute(
+                "SELECT algorithm, value FROM checksums WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                identity,
+            ).fetchall()
+            cached = dict(rows)
+            if not all(algorithm.name in cached for algorithm in algorithms):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.connection.execute("UPDATE checksums SET last_used = ? WHERE path = ?", (time.time(), identity.path))
+        return {algorithm: cached[algorithm.name] for algorithm in algorithms}
+
+    def put(self, identity: FileIdentity, checksums: Dict[ChecksumAlgorithm, str]) -> None:
+        """
+        Store the checksums of the file, replacing entries of an older identity
+        of the same path.
+        """
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM checksums WHERE path = ? AND NOT (size = ? AND mtime_ns = ? AND inode = ?)", identity)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(identity.path, algorithm.name, identity.size, identity.mtime_ns, identity.inode, value, now)
+                 for algorithm, value in checksums.items()],
+            )
+
+    def evict(self) -> None:
+        """
+        Remove entries older than max_age and the least recently used entries
+        beyond max_entries.
+        """
+        with self.lock:
+            if self.max_age is not None:
+                self.connection.execute("DELETE FROM checksums WHERE last_used < ?", (time.time() - self.max_age,))
+            if self.max_entries is not None:
+                self.connection.execute(
+                    "DELETE FROM checksums WHERE rowid NOT IN "
+                    "(SELECT rowid FROM checksums ORDER BY last_used DESC LIMIT ?)", (self.max_entries,))
+            self.connection.commit()
+
+    def flush(self) -> None:
+        with self.lock:
+            self.connection.commit()
+
+    def close(self) -> None:
+        self.evict()
+        self.connection.close()
@@ -0,0 +1,224 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batch conversion of many SPDX documents on a pool of worker processes.
+"""
+
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from spdx import config, utils
+from spdx.parsers import tagvalue, tagvaluebuilders
+from spdx.parsers.parse_anything import create_parser, get_parser_modules
+from spdx.writers.write_anything import write_file
+
+# input extensions per --from format, longest first so that ".rdf.xml" wins over ".xml"
+INPUT_EXTENSIONS = {
+    "tag": [".tag", ".spdx"],
+    "rdf": [".rdf.xml", ".rdf"],
+    "json": [".json"],
+    "yaml": [".yaml", ".yml"],
+    "xml": [".xml"],
+}
+OUTPUT_EXTENSIONS = {"json": ".json", "rdf": ".rdf", "yaml": ".yaml", "xml": ".xml", "tag": ".tag"}
+
+# built parser by parsing module, reused for all the files converted by a process
+_parsers = {}
+
+
+def split_extension(file_name: str, from_: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    Return the file name without its SPDX input extension and the extension,
+    or the file name and None if it has no input extension (of format from_).
+    """
+    formats = [from_] if from_ else INPUT_EXTENSIONS.keys()
+    extensions = sorted((extension for input_format in formats for extension in INPUT_EXTENSIONS[input_format]),
+                        key=len, reverse=True)
+    for extension in extensions:
+        if file_name.endswith(extension):
+            return file_name[:-len(extension)], extension
+    return file_name, None
+
+
+def read_manifest(manifest: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Yield (input file, output file or None) pairs from a manifest with one input
+    file per line, optionally followed by a tab and the output file. Empty lines
+    and lines starting with # are skipped.
+    """
+    with open(manifest) as manifest_file:
+        for line in manifest_file:
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            infile, _, outfile = line.partition("\t")
+            yield infile, outfile or None
+
+
+def collect_conversions(sources: Iterable[str], outdir: str, to: str, from_: Optional[str] = None,
+                        manifest: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Return (input file, output file) pairs for all sources. A source is a
+    directory, searched recursively for SPDX files, a glob pattern or a file.
+    Files found in a directory keep their path relative to it below outdir,
+    other files are written to outdir directly. Raise a ValueError if an
+    output file is also an input file or the output of another input file.
+    """
+    conversions = []
+
+    def add(infile, relative_name):
+        stem, _ = split_extension(relative_name)
+        conversions.append((infile, os.path.join(outdir, stem + OUTPUT_EXTENSIONS[to])))
+
+    for source in sources:
+        if os.path.isdir(source):
+            for directory, _, file_names in os.walk(source):
+                for file_name in sorted(file_names):
+                    if split_extension(file_name, from_)[1] is not None:
+                        infile = os.path.join(directory, file_name)
+                        add(infile, os.path.relpath(infile, source))
+        elif glob.has_magic(source):
+            for infile in sorted(glob.glob(source, recursive=True)):
+                if os.path.isfile(infile):
+                    add(infile, os.path.basename(infile))
+        else:
+            add(source, os.path.basename(source))
+
+    if manifest is not None:
+        for infile, outfile in read_manifest(manifest):
+            if outfile is None:
+                add(infile, os.path.basename(infile))
+            else:
+                conversions.append((infile, outfile))
+
+    check_conversions(conversions)
+    return conversions
+
+
+def check_conversions(conversions: List[Tuple[str, str]]) -> None:
+    """
+    Raise a ValueError listing the output files that would overwrite an input
+    file or that more than one input file would be written to.
+    """
+    def normalized(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    infiles = {normalized(infile) for infile, _ in conversions}
+    infiles_by_outfile = {}
+    for infile, outfile in conversions:
+        infiles_by_outfile.setdefault(normalized(outfile), []).append(infile)
+    problems = []
+    for infile, outfile in conversions:
+        if normalized(outfile) in infiles:
+            problems.append("{0} would overwrite an input file".format(outfile))
+    for outfile, outfile_infiles in infiles_by_outfile.items():
+        if len(outfile_infiles) > 1:
+            problems.append("{0} is the output of {1}".format(outfile, ", ".join(outfile_infiles)))
+    if problems:
+        raise ValueError("Conflicting output files: " + "; ".join(problems))
+
+
+def get_parser(parsing_module, builder_module):
+    """
+    Return the parser of parsing_module of this process, built on first use.
+    """
+    parser = _parsers.get(parsing_module)
+    if parser is None:
+        parser = _parsers[parsing_module] = create_parser(parsing_module, builder_module)
+    return parser
+
+
+def parse_with_cached_parser(infile: str):
+    """
+    Parse infile like parse_anything.parse_file, with the parser of its
+    format of this process rather than a newly built one.
+    """
+    parser = get_parser(*get_parser_modules(infile))
+    # a parse that raised an exception may have left the builder in the middle of an element
+    parser.builder.reset()
+    with open(infile) as file:
+        return parser.parse(file)
+
+
+def warm_up_worker() -> None:
+    """
+    Build the tag/value parser, which loads the parse tables, and load the
+    license lists once per worker process, so that the conversions do not
+    pay for them. The parsers are kept for all the conversions of the process.
+    """
+    get_parser(tagvalue, tagvaluebuilders)
+    utils.get_license_list_parser()
+    len(config.LICENSE_MAP)
+    len(config.EXCEPTION_MAP)
+
+
+def convert_file(conversion: Tuple[str, str], force: bool = False) -> Dict:
+    """
+    Convert one file and return the result as a json-serializable dict with
+    the status "ok", "parse_error" or "error", the messages printed by the
+    parser and the time taken.
+    """
+    infile, outfile = conversion
+    start = time.perf_counter()
+    result = {"infile": infile, "outfile": outfile}
+    # the parsers print their messages, keep them with the result instead
+    messages = io.StringIO()
+    writing = False
+    try:
+        with contextlib.redirect_stdout(messages):
+            doc, errors = parse_with_cached_parser(infile)
+            if errors and not force:
+                result["status"] = "parse_error"
+            else:
+                output_directory = os.path.dirname(outfile)
+                if output_directory:
+                    os.makedirs(output_directory, exist_ok=True)
+                writing = True
+                write_file(doc, outfile)
+                result["status"] = "ok"
+    except Exception as err:
+        result["status"] = "error"
+        result["error"] = "{}: {}".format(type(err).__name__, err)
+        # do not leave a partially written document behind
+        if writing and os.path.exists(outfile):
+            os.remove(outfile)
+    result["messages"] = messages.getvalue().splitlines()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _convert_file_forced(conversion):
+    return convert_file(conversion, force=True)
+
+
+def convert_files(conversions: List[Tuple[str, str]], jobs: Optional[int] = None, force: bool = False) \
+        -> Iterator[Dict]:
+    """
+    Convert all (input file, output file) pairs on `jobs` worker processes,
+    one per CPU by default, and yield the result of each conversion as soon
+    as it is done.
+    """
+    convert = _convert_file_forced if force else convert_file
+    if jobs == 1 or len(conversions) <= 1:
+        warm_up_worker()
+        for conversion in conversions:
+            yield convert(conversion)
+        return
+
+    with multiprocessing.Pool(processes=jobs, initializer=warm_up_worker) as pool:
+        for result in pool.imap_unordered(convert, conversions):
+            yield result
@@ -11,7 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
+import sys
+
+from spdx.cli_tools import batch
 from spdx.parsers.builderexceptions import FileTypeError
 from spdx.parsers.parse_anything import parse_file
 from spdx.writers.write_anything import write_file
@@ -84,13 +88,23 @@ def determine_infile_and_outfile(infile, outfile, src, from_, to):
     "from_",
     type=click.Choice(["tag", "rdf"], case_sensitive=False))
 @click.option("--force", is_flag=True, help="convert even if there are some parsing errors or inconsistencies")
-def main(infile, outfile, src, from_, to, force):
+@click.option("--batch", "batch_mode", is_flag=True,
+              help="convert all files in the SRC directories, globs and --manifest to --outdir")
+@click.option("--manifest", help="file listing one input file per line, optionally a tab and the output file")
+@click.option("--outdir", help="output directory of the batch mode")
+@click.option("--jobs", "-j", type=int, help="number of worker processes of the batch mode, one per CPU by default")
+def main(infile, outfile, src, from_, to, force, batch_mode, manifest, outdir, jobs):
     """
     CLI-TOOL for converting a RDF or TAG file to RDF, JSON, YAML, TAG or XML format.
 
     To use : run 'pyspdxtools_convertor -f <from_TYPE> <input file> -t <to_TYPE> <output_file>' command on terminal or use ' pyspdxtools_convertor --infile <input file name> --outfile <output file name> '
 
+    To convert many files : run 'pyspdxtools_convertor --batch -t <to_TYPE> --outdir <output directory> <directories, globs or files>', the result of each conversion is printed as a line of JSON.
+
     """
+    if batch_mode:
+        return convert_batch(src, manifest, outdir, from_, to, force, jobs)
+
     try:
         infile, outfile = determine_infile_and_outfile(infile, outfile, src, from_, to)
     except ValueError as err:
@@ -107,5 +121,26 @@ def main(infile, outfile, src, from_, to, force):
     write_file(doc, outfile)
 
 
+def convert_batch(src, manifest, outdir, from_, to, force, jobs):
+    if to is None or outdir is None or not (src or manifest):
+        print("The batch mode needs --to, --outdir and input files or --manifest.")
+        print_help_msg(main)
+        return
+
+    try:
+        conversions = batch.collect_conversions(src, outdir, to.lower(), from_ and from_.lower(), manifest)
+    except ValueError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
+    failed = 0
+    for result in batch.convert_files(conversions, jobs, force):
+        if result["status"] != "ok":
+            failed += 1
+        click.echo(json.dumps(result))
+    print("Converted {0} of {1} files.".format(len(conversions) - failed, len(conversions)), file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#    http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from spdx.document_diff import diff_documents, diff_files
+from spdx.parsers.parse_anything import parse_file
+
+import click
+
+
+@click.command()
+@click.argument("old_file")
+@click.argument("new_file")
+@click.option("--streaming", is_flag=True,
+              help="compare JSON, YAML or XML files one element at a time instead of parsing them")
+@click.option("--json", "as_json", is_flag=True, help="print the differences as JSON")
+@click.option("--force", is_flag=True, help="compare the documents even if there are some parsing errors")
+@click.pass_context
+def main(ctx, old_file, new_file, streaming, as_json, force):
+    """
+    COMMAND-LINE TOOL for comparing two SPDX documents.
+
+    To use : run `pyspdxtools_diff <old file> <new file>` to print the added (+), removed (-) and
+    changed (~) packages, files, snippets, relationships and document fields. Like diff, it exits
+    with 0 if the documents are the same, 1 if they differ and 2 if they could not be parsed.
+    """
+    if streaming:
+        diff = diff_files(old_file, new_file, streaming=True)
+    else:
+        documents = []
+        for file in (old_file, new_file):
+            doc, errors = parse_file(file)
+            if errors:
+                print("Errors while parsing {0}".format(file))
+                if not force:
+                    ctx.exit(2)
+            documents.append(doc)
+        diff = diff_documents(*documents)
+
+    if as_json:
+        click.echo(json.dumps(diff.to_dict(), indent=2, default=str))
+    else:
+        for line in diff.iter_lines():
+            click.echo(line)
+    ctx.exit(1 if diff else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#    http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spdx.parsers.parse_anything import parse_file
+from spdx.relationship import RelationshipType
+from spdx.relationship_graph import RelationshipGraph
+
+import click
+
+
+@click.command()
+@click.option("--file", prompt="File name", help="The file to be parsed")
+@click.option("--id", "spdx_id", help="print the SPDX ids reachable from this SPDX id")
+@click.option("--type", "relationship_types", multiple=True,
+              type=click.Choice([relationship_type.name for relationship_type in RelationshipType]),
+              help="only follow relationships of this type, can be given more than once")
+@click.option("--reverse", is_flag=True, help="print the SPDX ids from which --id is reachable instead")
+@click.option("--max-depth", type=int, help="only follow this many relationships from --id")
+@click.option("--cycles", is_flag=True, help="print the cycles of relationships, one per line")
+@click.option("--force", is_flag=True, help="print information even if there are some parsing errors")
+def main(file, spdx_id, relationship_types, reverse, max_depth, cycles, force):
+    """
+    COMMAND-LINE TOOL for querying the relationships of an SPDX document.
+
+    To use : run `pyspdxtools_graph --file <file name> --id <SPDX id> --type DEPENDS_ON` to print everything
+    the element transitively depends on, add `--reverse` for everything that depends on it, or run
+    `pyspdxtools_graph --file <file name> --cycles` to print the cycles of relationships.
+    """
+    if not spdx_id and not cycles:
+        raise click.UsageError("Give an SPDX id with --id or --cycles.")
+    doc, errors = parse_file(file)
+    if errors:
+        print("Errors while parsing: ", errors)
+        if not force:
+            return 1
+
+    graph = RelationshipGraph.from_document(doc)
+    relationship_types = relationship_types or None
+    if spdx_id:
+        if spdx_id not in graph:
+            print("No relationships of {0}".format(spdx_id))
+            return 1
+        for reachable_id in graph.reachable(spdx_id, relationship_types, reverse=reverse, max_depth=max_depth):
+            print(reachable_id)
+    if cycles:
+        for cycle in graph.find_cycles(relationship_types):
+            print(" ".join(cycle))
+
+
+if __name__ == "__main__":
+    main()
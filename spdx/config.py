@@ -10,9 +10,10 @@
 # limitations under the License.
 
 import codecs
-import json
 import os
+from collections.abc import MutableMapping
 
+from spdx import license_list_data
 from spdx.version import Version
 
 
@@ -27,6 +28,9 @@ def _load_list(file_name, object_type="licenses", id_attribute="licenseId"):
     name->id and id->name loaded from a JSON file
     from https://github.com/spdx/license-list-data
     """
+    # imported here, importing json takes longer than loading the packaged lists
+    import json
+
     licenses_map = {}
     with codecs.open(file_name, "rb", encoding="utf-8") as lics:
         licenses = json.load(lics)
@@ -61,11 +65,53 @@ def load_exception_list(file_name):
     )
 
 
-(_lmajor, _lminor), LICENSE_MAP = load_license_list(_licenses)
-LICENSE_LIST_VERSION = Version(major=_lmajor, minor=_lminor)
+class LazyLicenseMap(MutableMapping):
+    """
+    Mapping of licenses or exceptions name->id and id->name, built from
+    (identifier, name) pairs on first access.
+    """
+
+    def __init__(self, entries):
+        self._entries = entries
+        self._map = None
+
+    @property
+    def _licenses_map(self):
+        if self._map is None:
+            licenses_map = {}
+            for identifier, name in self._entries:
+                licenses_map[name] = identifier
+                licenses_map[identifier] = name
+            self._map = licenses_map
+        return self._map
+
+    @property
+    def loaded(self):
+        return self._map is not None
+
+    def __getitem__(self, key):
+        return self._licenses_map[key]
 
-(_emajor, _eminor), EXCEPTION_MAP = load_exception_list(_exceptions)
-EXCEPTION_LIST_VERSION = Version(major=_emajor, minor=_eminor)
+    def __setitem__(self, key, value):
+        self._licenses_map[key] = value
 
-assert LICENSE_LIST_VERSION == EXCEPTION_LIST_VERSION
-del _emajor, _eminor, EXCEPTION_LIST_VERSION
+    def __delitem__(self, key):
+        del self._licenses_map[key]
+
+    def __contains__(self, key):
+        return key in self._licenses_map
+
+    def __iter__(self):
+        return iter(self._licenses_map)
+
+    def __len__(self):
+        return len(self._licenses_map)
+
+    def __repr__(self):
+        return repr(self._licenses_map)
+
+
+_lmajor, _lminor = license_list_data.LICENSE_LIST_VERSION.split(".")
+LICENSE_LIST_VERSION = Version(major=_lmajor, minor=_lminor)
+LICENSE_MAP = LazyLicenseMap(license_list_data.LICENSES)
+EXCEPTION_MAP = LazyLicenseMap(license_list_data.EXCEPTIONS)
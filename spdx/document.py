@@ -8,12 +8,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Optional, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from spdx.file import File
+from spdx.change_tracking import ChangeCounter, TrackedList, change_key, is_unchanged, track_index_changes
+from spdx.file_table import FileTable
 from spdx.license import ExtractedLicense
-from spdx.parsers.loggers import ErrorMessages
+from spdx.parsers.loggers import ErrorLimitReached, ErrorMessages, ErrorRecord
 
 import warnings
 
@@ -22,6 +25,57 @@ from spdx.relationship import Relationship
 
 from spdx.relationship import Relationship
 
+# element lists that Document.validate can validate in parallel and incrementally
+VALIDATED_ELEMENT_LISTS = ("files", "packages", "snippet", "annotations", "relationships")
+# element lists that Document indexes by SPDX id
+INDEXED_LISTS = ("packages", "files", "snippet", "annotations", "relationships")
+
+
+def _list_state(items) -> Tuple[int, int]:
+    """
+    Return the identity and change count of a TrackedList or FileTable, or
+    the identity and length of another list.
+    """
+    changes = getattr(items, "changes", None)
+    return id(items), len(items) if changes is None else changes
+
+
+def _index_of(items: List, item) -> int:
+    """
+    Return the position of the item itself in items, without comparing it to
+    the other items. It is searched from both ends, as items are mostly
+    removed from the ones added first or last. Raise ValueError if it is not
+    in items.
+    """
+    last = len(items) - 1
+    for offset in range((last + 2) // 2):
+        if items[offset] is item:
+            return offset
+        if items[last - offset] is item:
+            return last - offset
+    raise ValueError("item is not in the list")
+
+
+def _validate_elements(elements: List, context: Tuple[str, ...],
+                       max_errors: Optional[int] = None) -> List[Optional[List[ErrorRecord]]]:
+    """
+    Return the error records of each element, validated with the given
+    context, or None for the elements after the one that reached max_errors.
+    """
+    messages = ErrorMessages(max_errors)
+    messages.context = list(context)
+    element_records = []
+    for element in elements:
+        record_count = len(messages.records)
+        try:
+            element.validate(messages)
+        except ErrorLimitReached:
+            element_records.append(messages.records[record_count:])
+            break
+        element_records.append(messages.records[record_count:])
+    element_records.extend([None] * (len(elements) - len(element_records)))
+    return element_records
+
 
 @total_ordering
 class ExternalDocumentRef(object):
@@ -101,6 +155,22 @@ class Document(object):
     - snippet: Snippet information. Optional zero or more. Type: Snippet.
     - relationships: Relationship between two SPDX elements. Optional zero or more.
       Type: Relationship. 
+
+    Packages, files, snippets, annotations and relationships added through the
+    add_* methods are indexed by SPDX id, see get_element, get_annotations,
+    get_relationships_from and get_relationships_to. Elements added without an
+    SPDX id are indexed as soon as it is set. The indexes are rebuilt on their
+    next lookup after an SPDX id or relationship of an indexed element is
+    replaced, see change_tracking.IndexedAttribute, or one of the lists is
+    modified directly. The lists the document creates are
+    change_tracking.TrackedLists, which count all their modifications; of
+    another list assigned to it, which is kept as it is, only the changes
+    of its length are detected, call rebuild_indexes after replacing its
+    items in place. Use remove_relationship and replace_relationship to
+    change the relationships without rebuilding the indexes.
+
+    With file_table, the files are kept in a file_table.FileTable instead of
+    a list, for documents with very many files.
     """
 
     def __init__(
@@ -113,6 +183,7 @@ class Document(object):
         comment=None,
         package=None,
         license_list_version=None,
+        file_table=False,
     ):
         # avoid recursive import
         from spdx.creationinfo import CreationInfo
@@ -125,15 +196,20 @@ class Document(object):
         self.comment = comment
         self.namespace = namespace
         self.creation_info = CreationInfo()
-        self.files: List['File'] = []
-        self.packages = []
+        self.files: List['File'] = FileTable() if file_table else TrackedList()
+        self.packages = TrackedList()
         if package is not None:
             self.packages.append(package)
         self.extracted_licenses = []
         self.reviews = []
-        self.annotations = []
-        self.relationships: List[Relationship] = []
-        self.snippet = []
+        self.annotations = TrackedList()
+        self.relationships: List[Relationship] = TrackedList()
+        self.snippet = TrackedList()
+        # replacements of the SPDX ids and relationships of the indexed elements
+        self._index_changes = ChangeCounter()
+        self.rebuild_indexes()
+        # (element, change key) of the elements that passed the last incremental validation by id, see validate
+        self._validated_elements: Dict[int, Tuple[object, Tuple]] = {}
 
         # due to backwards compatibility write input argument for license list version to creation info
         if license_list_version:
@@ -144,9 +220,40 @@ class Document(object):
 
     def add_annotation(self, annotation):
         self.annotations.append(annotation)
+        self._record_append("annotations")
+        track_index_changes(annotation, self._index_changes)
+        self._unindexed_annotations.append(annotation)
 
     def add_relationship(self, relationship):
         self.relationships.append(relationship)
+        if self._record_append("relationships"):
+            self._index_relationship(relationship)
+            track_index_changes(relationship, self._index_changes)
+
+    def remove_relationship(self, relationship: Relationship) -> None:
+        """
+        Remove the relationship, the same object, from the relationships and
+        from the indexes. Raise ValueError if it is not in the document.
+        """
+        indexed = self._is_indexed("relationships")
+        del self.relationships[_index_of(self.relationships, relationship)]
+        if indexed:
+            self._unindex_relationship(relationship)
+            self._record_indexed("relationships")
+
+    def replace_relationship(self, relationship: Relationship, new_relationship: Relationship) -> None:
+        """
+        Replace the relationship, the same object, with new_relationship in
+        the relationships and in the indexes. Raise ValueError if it is not in
+        the document.
+        """
+        indexed = self._is_indexed("relationships")
+        self.relationships[_index_of(self.relationships, relationship)] = new_relationship
+        if indexed:
+            self._unindex_relationship(relationship)
+            self._index_relationship(new_relationship)
+            track_index_changes(new_relationship, self._index_changes)
+            self._record_indexed("relationships")
 
     def add_extr_lic(self, lic):
         self.extracted_licenses.append(lic)
@@ -156,12 +263,149 @@ class Document(object):
 
     def add_snippet(self, snip):
         self.snippet.append(snip)
+        self._record_append("snippet")
+        track_index_changes(snip, self._index_changes)
+        self._unindexed_elements.append(snip)
 
     def add_package(self, package):
         self.packages.append(package)
+        self._record_append("packages")
+        track_index_changes(package, self._index_changes)
+        self._unindexed_elements.append(package)
 
     def add_file(self, file: 'File') -> None:
         self.files.append(file)
+        self._record_append("files")
+        track_index_changes(file, self._index_changes)
+
+    def rebuild_indexes(self) -> None:
+        """
+        Rebuild the SPDX id indexes from the element, annotation and relationship lists.
+        """
+        self._elements_by_spdx_id: Dict[str, object] = {}
+        self._annotations_by_spdx_id: Dict[str, List] = {}
+        self._relationships_from: Dict[str, List[Relationship]] = {}
+        self._relationships_to: Dict[str, List[Relationship]] = {}
+        self._unindexed_elements = self.packages + self.snippet
+        # files are indexed by position, a FileTable only creates their views when indexing
+        self._files_to_index_from = 0
+        self._unindexed_annotations = list(self.annotations)
+        # (list, its change count) by list name and the element changes the indexes are up to date with
+        self._indexed_states = {list_name: _list_state(getattr(self, list_name)) for list_name in INDEXED_LISTS}
+        self._indexed_changes = self._index_changes.changes
+        for element in self._unindexed_elements + self._unindexed_annotations:
+            track_index_changes(element, self._index_changes)
+        for relationship in self.relationships:
+            self._index_relationship(relationship)
+            track_index_changes(relationship, self._index_changes)
+
+    def _is_indexed(self, list_name: str) -> bool:
+        """
+        Return whether the indexes are up to date with the list and with the
+        SPDX ids and relationships of the elements.
+        """
+        return self._indexed_states[list_name] == _list_state(getattr(self, list_name)) and \
+            self._indexed_changes == self._index_changes.changes
+
+    def _record_indexed(self, list_name: str) -> None:
+        self._indexed_states[list_name] = _list_state(getattr(self, list_name))
+
+    def _record_append(self, list_name: str) -> bool:
+        """
+        Record that an add_* method appended an item to the list, which it
+        indexes itself, unless the list was modified directly since it was
+        indexed, and return whether it was recorded.
+        """
+        items, changes = self._indexed_states[list_name]
+        if (items, changes + 1) != _list_state(getattr(self, list_name)):
+            return False
+        self._indexed_states[list_name] = (items, changes + 1)
+        return True
+
+    def _index_relationship(self, relationship: Relationship) -> None:
+        relationship_parts = relationship.relationship.split(" ") if relationship.relationship else []
+        if len(relationship_parts) < 3:
+            # malformed relationships are reported by validate_relationships
+            return
+        self._relationships_from.setdefault(relationship_parts[0], []).append(relationship)
+        self._relationships_to.setdefault(relationship_parts[2], []).append(relationship)
+
+    def _unindex_relationship(self, relationship: Relationship) -> None:
+        relationship_parts = relationship.relationship.split(" ") if relationship.relationship else []
+        if len(relationship_parts) < 3:
+            return
+        for index, spdx_id in ((self._relationships_from, relationship_parts[0]),
+                               (self._relationships_to, relationship_parts[2])):
+            relationships = index[spdx_id]
+            del relationships[_index_of(relationships, relationship)]
+            if not relationships:
+                del index[spdx_id]
+
+    def _update_indexes(self) -> None:
+        """
+        Index the elements and annotations whose SPDX id was set after they were
+        added, and rebuild the indexes if one of the lists was modified directly
+        or an SPDX id or relationship was replaced.
+        """
+        if self._indexed_changes != self._index_changes.changes or \
+                any(state != _list_state(getattr(self, list_name)) for list_name, state in self._indexed_states.items()):
+            self.rebuild_indexes()
+        if self._files_to_index_from < len(self.files):
+            files = self.files[self._files_to_index_from:]
+            for file in files:
+                track_index_changes(file, self._index_changes)
+            self._unindexed_elements.extend(files)
+            self._files_to_index_from = len(self.files)
+        if self._unindexed_elements:
+            unindexed_elements = []
+            for element in self._unindexed_elements:
+                if element.spdx_id is None:
+                    unindexed_elements.append(element)
+                else:
+                    self._elements_by_spdx_id.setdefault(element.spdx_id, element)
+            self._unindexed_elements = unindexed_elements
+        if self._unindexed_annotations:
+            unindexed_annotations = []
+            for annotation in self._unindexed_annotations:
+                if annotation.spdx_id is None:
+                    unindexed_annotations.append(annotation)
+                else:
+                    self._annotations_by_spdx_id.setdefault(annotation.spdx_id, []).append(annotation)
+            self._unindexed_annotations = unindexed_annotations
+
+    def get_element(self, spdx_id: str):
+        """
+        Return the package, file or snippet with the given SPDX id, or None.
+        If several elements share the id, the first one indexed is returned.
+        """
+        self._update_indexes()
+        element = self._elements_by_spdx_id.get(spdx_id)
+        if element is not None and element.spdx_id != spdx_id:
+            self.rebuild_indexes()
+            self._update_indexes()
+            element = self._elements_by_spdx_id.get(spdx_id)
+        return element
+
+    def get_annotations(self, spdx_id: str) -> List:
+        """
+        Return the annotations of the element with the given SPDX id.
+        """
+        self._update_indexes()
+        return list(self._annotations_by_spdx_id.get(spdx_id, []))
+
+    def get_relationships_from(self, spdx_id: str) -> List[Relationship]:
+        """
+        Return the relationships whose spdx_element_id is the given SPDX id.
+        """
+        self._update_indexes()
+        return list(self._relationships_from.get(spdx_id, []))
+
+    def get_relationships_to(self, spdx_id: str) -> List[Relationship]:
+        """
+        Return the relationships whose related_spdx_element is the given SPDX id.
+        """
+        self._update_indexes()
+        return list(self._relationships_to.get(spdx_id, []))
 
     # For backwards compatibility with older versions, we support a
     # mode where the first package in a document may be referred to as
@@ -192,34 +436,111 @@ class Document(object):
     def has_comment(self):
         return self.comment is not None
 
-    def validate(self, messages=None):
+    def validate(self, messages=None, max_workers: Optional[int] = None, incremental: bool = False):
         """
         Validate all fields of the document and update the
         messages list with user friendly error messages for display.
+
+        With max_workers > 1, the files, packages, snippets, annotations and
+        relationships are validated on that many worker processes. The messages
+        are the same, in the same order, as when validating serially.
+
+        With incremental=True, these elements are only validated if they did
+        not pass the last incremental validation or were changed since, so that
+        validating again after adding or changing elements only validates
+        those, see spdx.change_tracking.ChangeTracked for the detected changes.
         """
         if isinstance(messages, list):
             raise TypeError("messages should be None or an instance of ErrorMessages")
         if messages is None:
             messages = ErrorMessages()
 
-        messages.push_context(self.name)
-        self.validate_version(messages)
-        self.validate_data_lics(messages)
-        self.validate_name(messages)
-        self.validate_spdx_id(messages)
-        self.validate_namespace(messages)
-        self.validate_ext_document_references(messages)
-        self.validate_creation_info(messages)
-        self.validate_files(messages)
-        self.validate_packages(messages)
-        self.validate_extracted_licenses(messages)
-        self.validate_reviews(messages)
-        self.validate_snippet(messages)
-        self.validate_annotations(messages)
-        self.validate_relationships(messages)
-        messages.pop_context()
+        context = list(messages.context)
+        try:
+            messages.push_context(self.name)
+            element_records = None
+            if incremental or (max_workers is not None and max_workers > 1):
+                element_records = self._validate_element_lists(tuple(messages.context), max_workers, incremental,
+                                                               messages.max_errors)
+            self.validate_version(messages)
+            self.validate_data_lics(messages)
+            self.validate_name(messages)
+            self.validate_spdx_id(messages)
+            self.validate_namespace(messages)
+            self.validate_ext_document_references(messages)
+            self.validate_creation_info(messages)
+            self._validate_element_list("files", messages, element_records)
+            self._validate_element_list("packages", messages, element_records)
+            self.validate_extracted_licenses(messages)
+            self.validate_reviews(messages)
+            self._validate_element_list("snippet", messages, element_records)
+            self._validate_element_list("annotations", messages, element_records)
+            self._validate_element_list("relationships", messages, element_records)
+        except ErrorLimitReached:
+            pass
+        messages.context[:] = context
         return messages
 
+    def _validate_element_list(self, list_name: str, messages: ErrorMessages,
+                               element_records: Optional[Dict[str, List[ErrorRecord]]]) -> None:
+        if element_records is None:
+            getattr(self, "validate_" + list_name)(messages)
+        else:
+            messages.extend(element_records[list_name])
+
+    def _validate_element_lists(self, context: Tuple[str, ...], max_workers: Optional[int], incremental: bool,
+                                max_errors: Optional[int]) -> Dict[str, List[ErrorRecord]]:
+        """
+        Validate the elements of VALIDATED_ELEMENT_LISTS, only the ones that did
+        not pass the last validation if incremental, and return the error
+        records of each list.
+        """
+        validated_elements = {}
+        elements_to_validate = []
+        for list_name in VALIDATED_ELEMENT_LISTS:
+            for element in getattr(self, list_name):
+                validated = self._validated_elements.get(id(element)) if incremental else None
+                if validated is not None and validated[0] is element and is_unchanged(element, validated[1]):
+                    validated_elements[id(element)] = validated
+                else:
+                    elements_to_validate.append((list_name, element))
+
+        elements = [element for _, element in elements_to_validate]
+        if max_workers is not None and max_workers > 1 and len(elements) > 1:
+            # a few chunks per worker, so that a slow chunk does not hold up the others
+            chunk_size = -(-len(elements) // (max_workers * 4))
+            chunks = [elements[start:start + chunk_size] for start in range(0, len(elements), chunk_size)]
+            with ProcessPoolExecutor(max_workers) as executor:
+                chunk_records = executor.map(_validate_elements, chunks, [context] * len(chunks),
+                                             [max_errors] * len(chunks))
+                element_records = [records for chunk in chunk_records for records in chunk]
+        else:
+            element_records = _validate_elements(elements, context, max_errors)
+
+        records_by_list: Dict[str, List[ErrorRecord]] = {list_name: [] for list_name in VALIDATED_ELEMENT_LISTS}
+        for (list_name, element), records in zip(elements_to_validate, element_records):
+            if records is None:
+                # not validated after reaching max_errors, ErrorMessages stops before these
+                continue
+            records_by_list[list_name].extend(records)
+            key = change_key(element) if incremental and not records else None
+            if key is not None:
+                validated_elements[id(element)] = (element, key)
+        if incremental:
+            # also forgets the elements that were removed from the document
+            self._validated_elements = validated_elements
+        return records_by_list
+
+    def invalidate_validation(self, element=None) -> None:
+        """
+        Validate element, or all elements if None, again in the next
+        incremental validation.
+        """
+        if element is None:
+            self._validated_elements = {}
+        else:
+            self._validated_elements.pop(id(element), None)
+
     def validate_version(self, messages):
         if self.version is None:
             messages.append("Document has no version.")
@@ -0,0 +1,287 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Structural diff between two SPDX documents.
+
+Both documents are compared as records in their JSON/YAML/XML form, one per
+package, file, snippet and relationship, plus one record of the
+document-level fields. Packages, files and snippets are matched by SPDX id,
+and packages and files that are left over by their checksums, so that a file
+whose SPDX id changed is reported as changed rather than removed and added.
+Relationships are matched by "SPDX_ID TYPE SPDX_ID". The hasFiles and
+documentDescribes fields of serialized documents are compared as the CONTAINS
+and DESCRIBES relationships they stand for.
+
+The old document is read twice, first for a digest of each record and then
+for the records that turned out to be changed, and the new document once, so
+that the diff takes time linear in the size of the documents and streamed
+files are never held in memory as a whole.
+"""
+
+import hashlib
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from spdx.parsers import jsonparser, xmlparser, yamlparser
+from spdx.parsers.parse_anything import parse_file
+from spdx.writers.jsonyamlxml import Writer
+
+DOCUMENT = "document"
+ELEMENT_KINDS = ("packages", "files", "snippets", "relationships")
+# kinds of records, in the order of the reports
+KINDS = (DOCUMENT,) + ELEMENT_KINDS
+# kinds of elements that are matched by checksum if their SPDX id is not found
+CHECKSUM_KINDS = ("packages", "files")
+
+Record = Dict[str, object]
+
+
+class DocumentDiff(object):
+    """
+    Differences between two SPDX documents, by kind of record: the keys of
+    the added and removed elements, and for each changed record, by key in
+    the new document, the changed fields as (old value, new value) pairs.
+    Values are in their JSON/YAML/XML form, None if the field is missing.
+    """
+
+    def __init__(self):
+        self.added: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self.removed: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self.changed: Dict[str, Dict[str, Dict[str, Tuple[object, object]]]] = {kind: {} for kind in KINDS}
+
+    def __bool__(self):
+        return any(self.added[kind] or self.removed[kind] or self.changed[kind] for kind in KINDS)
+
+    def to_dict(self) -> Dict:
+        """
+        Return the differences as a json-serializable dict.
+        """
+        return {
+            "added": {kind: keys for kind, keys in self.added.items() if keys},
+            "removed": {kind: keys for kind, keys in self.removed.items() if keys},
+            "changed": {kind: {key: {field: {"old": old_value, "new": new_value}
+                                     for field, (old_value, new_value) in changes.items()}
+                               for key, changes in changed.items()}
+                        for kind, changed in self.changed.items() if changed},
+        }
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yield the differences as lines of text: "+ kind key" for added
+        elements, "- kind key" for removed ones and "~ kind key field: old ->
+        new" for each changed field.
+        """
+        for kind in KINDS:
+            for key in self.added[kind]:
+                yield "+ {0} {1}".format(kind, key)
+            for key in self.removed[kind]:
+                yield "- {0} {1}".format(kind, key)
+            for key, changes in self.changed[kind].items():
+                for field, (old_value, new_value) in changes.items():
+                    yield "~ {0} {1} {2}: {3} -> {4}".format(kind, key, field, canonical_json(old_value),
+                                                             canonical_json(new_value))
+
+
+def canonical_json(value) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def record_digest(record: Record) -> bytes:
+    return hashlib.blake2b(canonical_json(record).encode("utf-8"), digest_size=16).digest()
+
+
+def record_key(kind: str, record: Record) -> str:
+    if kind == "relationships":
+        return "{0} {1} {2}".format(record.get("spdxElementId"), record.get("relationshipType"),
+                                    record.get("relatedSpdxElement"))
+    return record.get("SPDXID")
+
+
+def checksum_keys(record: Record) -> List[Tuple[str, str]]:
+    checksums = record.get("checksums") or []
+    if isinstance(checksums, dict):
+        checksums = [checksums]
+    return [(checksum.get("algorithm"), str(checksum.get("checksumValue")).lower()) for checksum in checksums
+            if isinstance(checksum, dict)]
+
+
+def diff_fields(old_record: Record, new_record: Record) -> Dict[str, Tuple[object, object]]:
+    changes = {}
+    for field in list(old_record) + [field for field in new_record if field not in old_record]:
+        old_value, new_value = old_record.get(field), new_record.get(field)
+        if old_value != new_value:
+            changes[field] = (old_value, new_value)
+    return changes
+
+
+def diff_records(old_records: Callable[[], Iterable[Tuple[str, Record]]],
+                 new_records: Iterable[Tuple[str, Record]]) -> DocumentDiff:
+    """
+    Return the differences between two documents given as (kind, record)
+    pairs. old_records is a function returning them, which is called a second
+    time if there are changed records, new_records is read once. Of repeated
+    keys, the first record is compared.
+    """
+    # digest of each old record by kind and key, None once it was matched
+    old_digests = {kind: {} for kind in ELEMENT_KINDS}
+    old_document = {}
+    for kind, record in old_records():
+        if kind == DOCUMENT:
+            old_document = record
+        else:
+            old_digests[kind].setdefault(record_key(kind, record), record_digest(record))
+
+    diff = DocumentDiff()
+    changed_records = {kind: {} for kind in ELEMENT_KINDS}
+    unmatched_records = {kind: {} for kind in ELEMENT_KINDS}
+    for kind, record in new_records:
+        if kind == DOCUMENT:
+            changes = diff_fields(old_document, record)
+            if changes:
+                diff.changed[DOCUMENT][DOCUMENT] = changes
+            continue
+        key = record_key(kind, record)
+        digests = old_digests[kind]
+        if key not in digests:
+            unmatched_records[kind].setdefault(key, record)
+            continue
+        old_digest = digests[key]
+        if old_digest is not None:
+            digests[key] = None
+            if old_digest != record_digest(record):
+                changed_records[kind][key] = record
+
+    new_keys_by_checksum = {kind: {} for kind in CHECKSUM_KINDS}
+    for kind in CHECKSUM_KINDS:
+        for key, record in unmatched_records[kind].items():
+            for checksum_key in checksum_keys(record):
+                new_keys_by_checksum[kind].setdefault(checksum_key, key)
+
+    unmatched_old = any(digest is not None for kind in CHECKSUM_KINDS for digest in old_digests[kind].values())
+    if any(changed_records.values()) or (unmatched_old and any(new_keys_by_checksum.values())):
+        for kind, record in old_records():
+            if kind == DOCUMENT:
+                continue
+            key = record_key(kind, record)
+            digests = old_digests[kind]
+            if key not in digests:
+                continue
+            if digests[key] is None:
+                new_record = changed_records[kind].pop(key, None)
+                if new_record is not None:
+                    diff.changed[kind][key] = diff_fields(record, new_record)
+                continue
+            for checksum_key in checksum_keys(record) if kind in CHECKSUM_KINDS else ():
+                new_key = new_keys_by_checksum[kind].get(checksum_key)
+                if new_key is not None and new_key in unmatched_records[kind]:
+                    digests[key] = None
+                    changes = diff_fields(record, unmatched_records[kind].pop(new_key))
+                    if changes:
+                        diff.changed[kind][new_key] = changes
+                    break
+
+    for kind in ELEMENT_KINDS:
+        diff.added[kind] = list(unmatched_records[kind])
+        diff.removed[kind] = [key for key, digest in old_digests[kind].items() if digest is not None]
+    return diff
+
+
+def iter_document_records(document) -> Iterator[Tuple[str, Record]]:
+    """
+    Yield the (kind, record) pairs of a Document, creating one record at a
+    time.
+    """
+    writer = Writer(document)
+    annotations_by_spdx_id = writer.create_annotations_by_spdx_id()
+    for package in document.packages:
+        yield "packages", writer.create_package_info(package, annotations_by_spdx_id)
+    for file in document.files:
+        yield "files", writer.create_file_info(file, annotations_by_spdx_id)
+    for snippet in document.snippet:
+        yield "snippets", writer.create_snippet_object(snippet, annotations_by_spdx_id)
+    for relationship in document.relationships:
+        yield "relationships", writer.create_relationship_info(relationship)
+    yield DOCUMENT, {field: value for field, value in writer.iter_document_fields()
+                     if field not in ELEMENT_KINDS and field != "documentDescribes"}
+
+
+def iter_field_records(document_fields: Iterable[Tuple[str, object]]) -> Iterator[Tuple[str, Record]]:
+    """
+    Yield the (kind, record) pairs of a serialized document, from the (field
+    name, value) pairs of a streaming reader such as
+    jsonparser.iter_document_fields.
+    """
+    document_record = {}
+    described_ids = []
+    for field, value in document_fields:
+        if field == "documentDescribes":
+            described_ids.extend([value] if isinstance(value, str) else value)
+            continue
+        if field not in ELEMENT_KINDS:
+            document_record[field] = value
+            continue
+        for record in [value] if isinstance(value, dict) else value:
+            if field != "packages":
+                yield field, record
+                continue
+            has_files = record.pop("hasFiles", [])
+            yield field, record
+            for file_id in [has_files] if isinstance(has_files, str) else has_files:
+                yield "relationships", {"spdxElementId": record.get("SPDXID"), "relatedSpdxElement": file_id,
+                                        "relationshipType": "CONTAINS"}
+    for described_id in described_ids:
+        yield "relationships", {"spdxElementId": document_record.get("SPDXID"), "relatedSpdxElement": described_id,
+                                "relationshipType": "DESCRIBES"}
+    yield DOCUMENT, document_record
+
+
+def iter_file_records(file_name: str) -> Iterator[Tuple[str, Record]]:
+    """
+    Yield the (kind, record) pairs of a JSON, YAML or XML document, reading
+    one element at a time from the file.
+    """
+    with open(file_name) as file:
+        if file_name.endswith(".json"):
+            yield from iter_field_records(jsonparser.iter_document_fields(jsonparser.JsonStream(file)))
+        elif file_name.endswith(".yaml") or file_name.endswith(".yml"):
+            loader = yamlparser.StreamLoader(file)
+            try:
+                yield from iter_field_records(yamlparser.iter_document_fields(loader))
+            finally:
+                loader.dispose()
+        else:
+            yield from iter_field_records(xmlparser.iter_document_fields(file))
+
+
+def is_streamable(file_name: str) -> bool:
+    return file_name.endswith((".json", ".yaml", ".yml", ".xml")) and not file_name.endswith(".rdf.xml")
+
+
+def diff_documents(old_document, new_document) -> DocumentDiff:
+    """
+    Return the differences between two Documents.
+    """
+    return diff_records(lambda: iter_document_records(old_document), iter_document_records(new_document))
+
+
+def diff_files(old_file_name: str, new_file_name: str, streaming: bool = False) -> DocumentDiff:
+    """
+    Return the differences between the SPDX documents in two files. With
+    streaming, JSON, YAML and XML files are compared as they are serialized,
+    reading one element at a time, so both should be in the same format.
+    Otherwise, and for the other formats, the documents are parsed first.
+    """
+    if streaming and is_streamable(old_file_name) and is_streamable(new_file_name):
+        return diff_records(lambda: iter_file_records(old_file_name), iter_file_records(new_file_name))
+    old_document, _ = parse_file(old_file_name)
+    new_document, _ = parse_file(new_file_name)
+    return diff_documents(old_document, new_document)
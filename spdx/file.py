@@ -9,13 +9,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import hashlib
 import warnings
 from enum import Enum, auto
 from functools import total_ordering
-from typing import Optional
+from typing import Dict, List, Optional
 
-from spdx import utils
+from spdx import hashing, utils
+from spdx.change_tracking import ChangeTracked, IndexedAttribute
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.license import License
 from spdx.parsers.builderexceptions import SPDXValueError
@@ -52,7 +52,7 @@ def file_type_to_rdf(file_type: FileType) -> str:
 
 
 @total_ordering
-class File(object):
+class File(ChangeTracked):
     """
     Represent an SPDX file.
     Fields:
@@ -78,26 +78,54 @@ class File(object):
     -attribution_text: optional string.
     """
 
+    __slots__ = (
+        "name",
+        "_spdx_id",
+        "comment",
+        "_file_types",
+        "_checksums",
+        "conc_lics",
+        "_licenses_in_file",
+        "license_comment",
+        "copyright",
+        "notice",
+        "attribution_text",
+        "_contributors",
+        "_dependencies",
+        "_artifact_of_project_name",
+        "_artifact_of_project_home",
+        "_artifact_of_project_uri",
+    )
+
+    collection_attributes = ("_file_types", "_checksums", "_licenses_in_file", "_contributors", "_dependencies",
+                             "_artifact_of_project_name", "_artifact_of_project_home", "_artifact_of_project_uri")
+    spdx_id = IndexedAttribute()
+
+    # created on first access, most files have no value for most of them
+    file_types = utils.LazyCollection()
+    checksums = utils.LazyCollection(dict)
+    licenses_in_file = utils.LazyCollection()
+    contributors = utils.LazyCollection()
+    dependencies = utils.LazyCollection()
+    artifact_of_project_name = utils.LazyCollection()
+    artifact_of_project_home = utils.LazyCollection()
+    artifact_of_project_uri = utils.LazyCollection()
+
     def __init__(self, name, spdx_id=None):
         self.name = name
         self.spdx_id = spdx_id
         self.comment = None
-        self.file_types = []
-        self.checksums = {}
         self.conc_lics = None
-        self.licenses_in_file = []
         self.license_comment = None
         self.copyright = None
         self.notice = None
         self.attribution_text = None
-        self.contributors = []
-        self.dependencies = []
-        self.artifact_of_project_name = []
-        self.artifact_of_project_home = []
-        self.artifact_of_project_uri = []
 
     def __eq__(self, other):
-        return isinstance(other, File) and self.name == other.name
+        if not isinstance(other, File):
+            # e.g. a file_table.FileView, which compares by name as well
+            return NotImplemented
+        return self.name == other.name
 
     def __lt__(self, other):
         return self.name < other.name
@@ -173,8 +201,10 @@ class File(object):
         return messages
 
     def validate_artifacts(self, messages):
-        if len(self.artifact_of_project_home) < max(
-            len(self.artifact_of_project_uri), len(self.artifact_of_project_name)
+        # read the slots, validating should not create the lists
+        if len(getattr(self, "_artifact_of_project_home", ())) < max(
+            len(getattr(self, "_artifact_of_project_uri", ())),
+            len(getattr(self, "_artifact_of_project_name", ())),
         ):
             messages.append(
                 "File must have as much artifact of project as uri or homepage"
@@ -183,7 +213,7 @@ class File(object):
         return messages
 
     def validate_licenses_in_file(self, messages):
-        for license_in_file in self.licenses_in_file:
+        for license_in_file in getattr(self, "_licenses_in_file", ()):
             if not isinstance(
                 license_in_file, (utils.SPDXNone, utils.NoAssert, License)
             ):
@@ -208,13 +238,13 @@ class File(object):
         return messages
 
     def validate_file_types(self, messages):
-        for file_type in self.file_types:
+        for file_type in getattr(self, "_file_types", ()):
             if not isinstance(file_type, FileType):
                 messages.append(f"{file_type} is not of type FileType.")
         return messages
 
     def validate_checksums(self, messages: ErrorMessages):
-        for checksum in self.checksums.values():
+        for checksum in getattr(self, "_checksums", {}).values():
             if not isinstance(checksum, Checksum):
                 messages.append("File checksum must be instance of spdx.checksum.Checksum.")
 
@@ -222,28 +252,32 @@ class File(object):
             messages.append("At least one file checksum algorithm must be SHA1")
 
     def calculate_checksum(self, hash_algorithm='SHA1'):
-        if hash_algorithm not in ChecksumAlgorithm.__members__:
-            raise ValueError
-        BUFFER_SIZE = 65536
-
-        file_hash = hashlib.new(hash_algorithm.lower())
-        with open(self.name, "rb") as file_handle:
-            while True:
-                data = file_handle.read(BUFFER_SIZE)
-                if not data:
-                    break
-                file_hash.update(data)
+        """
+        Return the hex digest of the file content for hash_algorithm, a
+        ChecksumAlgorithm or its name.
+        """
+        if isinstance(hash_algorithm, str):
+            if hash_algorithm not in ChecksumAlgorithm.__members__:
+                raise ValueError
+            hash_algorithm = ChecksumAlgorithm[hash_algorithm]
+        return self.calculate_checksums([hash_algorithm])[hash_algorithm]
 
-        return file_hash.hexdigest()
+    def calculate_checksums(self, hash_algorithms: List[ChecksumAlgorithm]) -> Dict[ChecksumAlgorithm, str]:
+        """
+        Return the hex digests of the file content for all hash_algorithms,
+        reading the file once.
+        """
+        return hashing.calculate_checksums(self.name, hash_algorithms)
 
     def get_checksum(self, hash_algorithm: ChecksumAlgorithm = ChecksumAlgorithm.SHA1) -> Optional[Checksum]:
-        return self.checksums.get(hash_algorithm)
+        return getattr(self, "_checksums", {}).get(hash_algorithm)
 
     def set_checksum(self, new_checksum: Checksum):
         if not isinstance(new_checksum, Checksum):
             raise SPDXValueError
 
         self.checksums[new_checksum.identifier] = new_checksum
+        self.mark_changed()
 
     def has_optional_field(self, field):
         return bool(getattr(self, field, None))
@@ -0,0 +1,441 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar storage for the files of documents with millions of them, most of
+which only have a name, an SPDX id, a SHA1 and licenses shared with many
+other files. Names and SPDX ids are packed into one buffer each, SHA1
+digests into a fixed-width buffer, and licenses, copyrights and file types
+are stored as small indexes into the list of their distinct values. The
+fields that most files do not have are kept by row only where they are set.
+"""
+
+from array import array
+from functools import total_ordering
+from typing import Dict, Iterable, Optional
+
+from spdx import utils
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.file import File
+from spdx.parsers.builderexceptions import SPDXValueError
+
+# fields stored in columns, the list fields as tuples
+COLUMN_FIELDS = ("name", "spdx_id", "conc_lics", "licenses_in_file", "copyright", "file_types")
+LIST_FIELDS = {"licenses_in_file", "file_types", "contributors", "dependencies", "artifact_of_project_name",
+               "artifact_of_project_home", "artifact_of_project_uri"}
+# fields stored by row where they are set
+SPARSE_FIELDS = ("comment", "license_comment", "notice", "attribution_text", "contributors", "dependencies",
+                 "artifact_of_project_name", "artifact_of_project_home", "artifact_of_project_uri")
+FIELDS = COLUMN_FIELDS + SPARSE_FIELDS + ("checksums",)
+
+# index widths of an InternedColumn, widened as the number of distinct values grows
+INDEX_TYPECODES = ("B", "H", "I", "Q")
+
+
+class TextColumn(object):
+    """
+    Column of strings packed as UTF-8 into one buffer. Values that are not
+    strings, and strings changed after they were packed, are kept by row.
+    The end offsets are four bytes wide until the buffer outgrows that.
+    """
+
+    __slots__ = ("data", "ends", "other_values")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.ends = array("I")
+        self.other_values = {}
+
+    def __len__(self):
+        return len(self.ends)
+
+    def append(self, value):
+        if isinstance(value, str):
+            self.data += value.encode("utf-8")
+        else:
+            self.other_values[len(self.ends)] = value
+        if len(self.data) >= 1 << (8 * self.ends.itemsize):
+            self.ends = array("Q", self.ends)
+        self.ends.append(len(self.data))
+
+    def __getitem__(self, row):
+        if row in self.other_values:
+            return self.other_values[row]
+        start = self.ends[row - 1] if row else 0
+        return self.data[start:self.ends[row]].decode("utf-8")
+
+    def __setitem__(self, row, value):
+        self.other_values[row] = value
+
+
+class DigestColumn(object):
+    """
+    Column of hex digests of `width` bytes packed into one buffer. A row
+    without a digest is recorded in `missing`.
+    """
+
+    __slots__ = ("width", "data", "missing")
+
+    def __init__(self, width):
+        self.width = width
+        self.data = bytearray()
+        self.missing = set()
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+    def append(self, hex_digest):
+        if hex_digest is None:
+            self.missing.add(len(self))
+            self.data += bytes(self.width)
+        else:
+            self.data += bytes.fromhex(hex_digest)
+
+    def __getitem__(self, row):
+        if row in self.missing:
+            return None
+        return self.data[row * self.width:(row + 1) * self.width].hex()
+
+    def __setitem__(self, row, hex_digest):
+        if hex_digest is None:
+            self.missing.add(row)
+        else:
+            self.missing.discard(row)
+            self.data[row * self.width:(row + 1) * self.width] = bytes.fromhex(hex_digest)
+
+    def is_packable(self, hex_digest):
+        """
+        Return whether hex_digest is stored unchanged, i.e. is lowercase hex
+        of the column width.
+        """
+        try:
+            return len(hex_digest) == 2 * self.width and bytes.fromhex(hex_digest).hex() == hex_digest
+        except (TypeError, ValueError):
+            return False
+
+
+def intern_key(value):
+    """
+    Return the key under which value is interned, or None if it can not be
+    shared with other rows. All NoAssert and SPDXNone values are equivalent.
+    """
+    if isinstance(value, (utils.NoAssert, utils.SPDXNone)):
+        return type(value)
+    if isinstance(value, tuple):
+        keys = tuple(map(intern_key, value))
+        return None if None in keys else (tuple, keys)
+    try:
+        hash(value)
+    except TypeError:
+        # e.g. extracted licenses, which can still change
+        return None
+    return type(value), value
+
+
+class InternedColumn(object):
+    """
+    Column of values stored as indexes into the list of distinct values, see
+    intern_key. The indexes are one byte wide until there are more distinct
+    values than that holds.
+    """
+
+    __slots__ = ("values", "value_indexes", "indexes")
+
+    def __init__(self):
+        self.values = []
+        self.value_indexes = {}
+        self.indexes = array(INDEX_TYPECODES[0])
+
+    def __len__(self):
+        return len(self.indexes)
+
+    def intern(self, value):
+        key = intern_key(value)
+        index = self.value_indexes.get(key) if key is not None else None
+        if index is None:
+            index = len(self.values)
+            self.values.append(value)
+            if key is not None:
+                self.value_indexes[key] = index
+            if index >= 1 << (8 * self.indexes.itemsize):
+                typecode = INDEX_TYPECODES[INDEX_TYPECODES.index(self.indexes.typecode) + 1]
+                self.indexes = array(typecode, self.indexes)
+        return index
+
+    def append(self, value):
+        # interning may widen the indexes
+        index = self.intern(value)
+        self.indexes.append(index)
+
+    def __getitem__(self, row):
+        return self.values[self.indexes[row]]
+
+    def __setitem__(self, row, value):
+        self.indexes[row] = self.intern(value)
+
+
+def _stored_value(field, value):
+    if field in LIST_FIELDS:
+        return tuple(value) if value else ()
+    return value
+
+
+class FileTable(object):
+    """
+    Columnar, list-like store of the files of a document, see the module
+    docstring. Files are appended as File objects and read as FileViews.
+
+    The last file appended is kept as it is until the next one is appended,
+    so that parsers can go on filling it in through doc.files[-1]. The files
+    before it are packed into the columns: the lists read from their views
+    are copies, set them or use the add_* methods of the views to change
+    them. Files can not be removed. Like spdx.change_tracking.TrackedList,
+    the table counts the files appended or replaced and the SPDX ids set
+    after they were packed in `changes`.
+    """
+
+    def __init__(self, files: Iterable[File] = ()):
+        self._columns = {"name": TextColumn(), "spdx_id": TextColumn(), "conc_lics": InternedColumn(),
+                         "licenses_in_file": InternedColumn(), "copyright": InternedColumn(),
+                         "file_types": InternedColumn()}
+        self._sha1 = DigestColumn(20)
+        # checksums other than a packed SHA1 by row
+        self._checksums: Dict[int, Dict[ChecksumAlgorithm, Checksum]] = {}
+        self._sparse_fields: Dict[str, Dict[int, object]] = {field: {} for field in SPARSE_FIELDS}
+        self._pending_file: Optional[File] = None
+        self.changes = 0
+        for file in files:
+            self.append(file)
+
+    def __len__(self):
+        return len(self._sha1) + (self._pending_file is not None)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield FileView(self, row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [FileView(self, row) for row in range(*index.indices(len(self)))]
+        return FileView(self, self._row(index))
+
+    def __setitem__(self, index, file: File):
+        row = self._row(index)
+        self.changes += 1
+        if self._is_pending(row):
+            self._pending_file = file
+            return
+        for field in FIELDS:
+            self.set_field(row, field, getattr(file, field))
+
+    def __repr__(self):
+        return "FileTable({} files)".format(len(self))
+
+    def append(self, file: File) -> None:
+        self.changes += 1
+        if self._pending_file is not None:
+            self._pack(self._pending_file)
+        self._pending_file = file
+
+    def extend(self, files: Iterable[File]) -> None:
+        for file in files:
+            self.append(file)
+
+    def flush(self) -> None:
+        """
+        Pack the last file appended into the columns as well.
+        """
+        if self._pending_file is not None:
+            self._pack(self._pending_file)
+            self._pending_file = None
+
+    def _row(self, index):
+        length = len(self)
+        row = index + length if index < 0 else index
+        if not 0 <= row < length:
+            raise IndexError("file table index out of range")
+        return row
+
+    def _is_pending(self, row):
+        return self._pending_file is not None and row == len(self._sha1)
+
+    def _pack(self, file: File) -> None:
+        row = len(self._sha1)
+        for field, column in self._columns.items():
+            column.append(_stored_value(field, getattr(file, field)))
+        self._sha1.append(None)
+        self.set_field(row, "checksums", file.checksums)
+        for field in SPARSE_FIELDS:
+            self.set_field(row, field, getattr(file, field))
+
+    def get_field(self, row: int, field: str):
+        """
+        Return the value of a File field of the file in row.
+        """
+        if self._is_pending(row):
+            return getattr(self._pending_file, field)
+        if field == "checksums":
+            checksums = {}
+            sha1 = self._sha1[row]
+            if sha1 is not None:
+                checksums[ChecksumAlgorithm.SHA1] = Checksum(ChecksumAlgorithm.SHA1, sha1)
+            checksums.update(self._checksums.get(row, {}))
+            return checksums
+        if field in self._columns:
+            value = self._columns[field][row]
+        else:
+            value = self._sparse_fields[field].get(row, () if field in LIST_FIELDS else None)
+        return list(value) if field in LIST_FIELDS else value
+
+    def set_field(self, row: int, field: str, value) -> None:
+        """
+        Set a File field of the file in row.
+        """
+        if self._is_pending(row):
+            setattr(self._pending_file, field, value)
+            return
+        if field == "spdx_id":
+            self.changes += 1
+        if field == "checksums":
+            self._set_checksums(row, value)
+            return
+        value = _stored_value(field, value)
+        if field in self._columns:
+            self._columns[field][row] = value
+        elif value is None or value == ():
+            self._sparse_fields[field].pop(row, None)
+        else:
+            self._sparse_fields[field][row] = value
+
+    def _set_checksums(self, row, checksums: Dict[ChecksumAlgorithm, Checksum]) -> None:
+        checksums = dict(checksums)
+        sha1 = checksums.get(ChecksumAlgorithm.SHA1)
+        # the SHA1 is packed if it comes first, the order of the checksums is kept
+        if sha1 is not None and next(iter(checksums)) == ChecksumAlgorithm.SHA1 and \
+                isinstance(sha1, Checksum) and self._sha1.is_packable(sha1.value):
+            self._sha1[row] = sha1.value
+            del checksums[ChecksumAlgorithm.SHA1]
+        else:
+            self._sha1[row] = None
+        if checksums:
+            self._checksums[row] = checksums
+        else:
+            self._checksums.pop(row, None)
+
+    def get_checksum(self, row: int, hash_algorithm: ChecksumAlgorithm) -> Optional[Checksum]:
+        if self._is_pending(row):
+            return self._pending_file.get_checksum(hash_algorithm)
+        if hash_algorithm == ChecksumAlgorithm.SHA1:
+            sha1 = self._sha1[row]
+            if sha1 is not None:
+                return Checksum(ChecksumAlgorithm.SHA1, sha1)
+        return self._checksums.get(row, {}).get(hash_algorithm)
+
+    def to_file(self, row: int) -> File:
+        """
+        Return a File with the fields of the file in row.
+        """
+        if self._is_pending(row):
+            return self._pending_file
+        file = File(self.get_field(row, "name"))
+        for field in FIELDS:
+            setattr(file, field, self.get_field(row, field))
+        return file
+
+
+def _unpickled_file(file):
+    return file
+
+
+def _view_field(field):
+    return property(lambda view: view._table.get_field(view._row, field),
+                    lambda view, value: view._table.set_field(view._row, field, value))
+
+
+@total_ordering
+class FileView(object):
+    """
+    A file of a FileTable, with the fields and methods of File, see
+    FileTable for how the fields can be changed.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: FileTable, row: int):
+        self._table = table
+        self._row = row
+
+    name = _view_field("name")
+    spdx_id = _view_field("spdx_id")
+    comment = _view_field("comment")
+    file_types = _view_field("file_types")
+    checksums = _view_field("checksums")
+    conc_lics = _view_field("conc_lics")
+    licenses_in_file = _view_field("licenses_in_file")
+    license_comment = _view_field("license_comment")
+    copyright = _view_field("copyright")
+    notice = _view_field("notice")
+    attribution_text = _view_field("attribution_text")
+    contributors = _view_field("contributors")
+    dependencies = _view_field("dependencies")
+    artifact_of_project_name = _view_field("artifact_of_project_name")
+    artifact_of_project_home = _view_field("artifact_of_project_home")
+    artifact_of_project_uri = _view_field("artifact_of_project_uri")
+
+    checksum = File.checksum
+    calculate_checksum = File.calculate_checksum
+    calculate_checksums = File.calculate_checksums
+    has_optional_field = File.has_optional_field
+    __lt__ = File.__lt__
+
+    def __eq__(self, other):
+        return isinstance(other, (File, FileView)) and self.name == other.name
+
+    def __repr__(self):
+        return "FileView({!r}, {})".format(self.name, self._row)
+
+    def __reduce__(self):
+        # the file, not the whole table, e.g. for validation in other processes
+        return _unpickled_file, (self.to_file(),)
+
+    def _add(self, field, value):
+        self._table.set_field(self._row, field, self._table.get_field(self._row, field) + [value])
+
+    def add_lics(self, lics):
+        self._add("licenses_in_file", lics)
+
+    def add_contrib(self, contrib):
+        self._add("contributors", contrib)
+
+    def add_depend(self, depend):
+        self._add("dependencies", depend)
+
+    def add_artifact(self, symbol, value):
+        self._add("artifact_of_project_{}".format(symbol), value)
+
+    def get_checksum(self, hash_algorithm: ChecksumAlgorithm = ChecksumAlgorithm.SHA1) -> Optional[Checksum]:
+        return self._table.get_checksum(self._row, hash_algorithm)
+
+    def set_checksum(self, new_checksum: Checksum):
+        if not isinstance(new_checksum, Checksum):
+            raise SPDXValueError
+        checksums = self.checksums
+        checksums[new_checksum.identifier] = new_checksum
+        self.checksums = checksums
+
+    def validate(self, messages):
+        return self.to_file().validate(messages)
+
+    def to_file(self) -> File:
+        return self._table.to_file(self._row)
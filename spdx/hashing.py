@@ -0,0 +1,152 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compute file checksums for several ChecksumAlgorithms with a single read of
+each file, and hash many files concurrently. hashlib releases the GIL while
+hashing large buffers, so a thread pool scales with the available cores.
+"""
+
+import hashlib
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from spdx.checksum import ChecksumAlgorithm
+from spdx.checksum_cache import file_identity
+
+if TYPE_CHECKING:
+    from spdx.checksum_cache import ChecksumCache
+
+BUFFER_SIZE = 1024 * 1024
+
+# one read buffer per thread, reused for every file hashed on that thread
+_buffers = threading.local()
+
+_checksum_cache = None
+
+# algorithms that hashlib.new knows by the lowercase enum name
+HASHLIB_NAMES = {
+    ChecksumAlgorithm.SHA1: "sha1",
+    ChecksumAlgorithm.SHA224: "sha224",
+    ChecksumAlgorithm.SHA256: "sha256",
+    ChecksumAlgorithm.SHA384: "sha384",
+    ChecksumAlgorithm.SHA512: "sha512",
+    ChecksumAlgorithm.SHA3_256: "sha3_256",
+    ChecksumAlgorithm.SHA3_384: "sha3_384",
+    ChecksumAlgorithm.SHA3_512: "sha3_512",
+    ChecksumAlgorithm.MD4: "md4",
+    ChecksumAlgorithm.MD5: "md5",
+}
+
+BLAKE2B_DIGEST_SIZES = {
+    ChecksumAlgorithm.BLAKE2B_256: 32,
+    ChecksumAlgorithm.BLAKE2B_384: 48,
+    ChecksumAlgorithm.BLAKE2B_512: 64,
+}
+
+
+class Adler32(object):
+    """
+    hashlib-like wrapper around zlib.adler32.
+    """
+
+    def __init__(self):
+        self.value = 1
+
+    def update(self, data):
+        self.value = zlib.adler32(data, self.value)
+
+    def hexdigest(self):
+        return "{:08x}".format(self.value & 0xFFFFFFFF)
+
+
+def new_hasher(algorithm: ChecksumAlgorithm):
+    """
+    Return a hashlib-like object for algorithm.
+    Raise ValueError if the algorithm is not available.
+    """
+    if algorithm in BLAKE2B_DIGEST_SIZES:
+        return hashlib.blake2b(digest_size=BLAKE2B_DIGEST_SIZES[algorithm])
+    if algorithm == ChecksumAlgorithm.ADLER32:
+        return Adler32()
+    if algorithm in HASHLIB_NAMES:
+        try:
+            return hashlib.new(HASHLIB_NAMES[algorithm])
+        except ValueError:
+            # e.g. md4 is not provided by every OpenSSL build
+            pass
+    raise ValueError(f"Checksum algorithm not supported for calculation: {algorithm.name}")
+
+
+def set_checksum_cache(cache: Optional['ChecksumCache']) -> None:
+    """
+    Consult cache (a spdx.checksum_cache.ChecksumCache) in calculate_checksums,
+    or stop using a cache if cache is None.
+    """
+    global _checksum_cache
+    _checksum_cache = cache
+
+
+def calculate_checksums(path: str, algorithms: Iterable[ChecksumAlgorithm]) -> Dict[ChecksumAlgorithm, str]:
+    """
+    Return the hex digests of the file at path for all algorithms, reading the
+    file only once. The checksum cache set with set_checksum_cache is consulted
+    first.
+    """
+    algorithms = list(algorithms)
+    cache = _checksum_cache
+    if cache is None:
+        return hash_file(path, algorithms)
+
+    identity = file_identity(path)
+    checksums = cache.get(identity, algorithms)
+    if checksums is None:
+        checksums = hash_file(path, algorithms)
+        cache.put(identity, checksums)
+    return checksums
+
+
+def hash_file(path: str, algorithms: Iterable[ChecksumAlgorithm]) -> Dict[ChecksumAlgorithm, str]:
+    hashers = {algorithm: new_hasher(algorithm) for algorithm in algorithms}
+    view = getattr(_buffers, "view", None)
+    if view is None:
+        view = _buffers.view = memoryview(bytearray(BUFFER_SIZE))
+    with open(path, "rb", buffering=0) as file_handle:
+        while True:
+            size = file_handle.readinto(view)
+            if not size:
+                break
+            for hasher in hashers.values():
+                hasher.update(view[:size])
+    return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+
+
+def calculate_files_checksums(paths: Iterable[str], algorithms: Iterable[ChecksumAlgorithm],
+                              max_workers: Optional[int] = None) -> List[Dict[ChecksumAlgorithm, str]]:
+    """
+    Return calculate_checksums for each path, in the order of paths, hashing
+    the files on a pool of max_workers threads, one per CPU by default.
+    """
+    paths = list(paths)
+    algorithms = list(algorithms)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if len(paths) <= 1 or max_workers == 1:
+        files_checksums = [calculate_checksums(path, algorithms) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            files_checksums = list(executor.map(lambda path: calculate_checksums(path, algorithms), paths))
+    if _checksum_cache is not None:
+        _checksum_cache.flush()
+    return files_checksums
@@ -10,19 +10,48 @@
 # limitations under the License.
 
 from functools import total_ordering
+from weakref import WeakValueDictionary
 
 from spdx import config
 
+# Interned licenses by class and names, or by class and operands for license
+# expressions. Entries are dropped when the license is no longer used.
+_interned_licenses = WeakValueDictionary()
+
 
 @total_ordering
 class License(object):
-    def __init__(self, full_name, identifier):
+    """
+    A license with its SPDX identifier and full name. Licenses are immutable
+    and interned: equal licenses are the same object, whose names and hash
+    are computed once.
+    """
+
+    def __new__(cls, full_name, identifier):
         """if one of the argument is None, we try to map as much as possible
         """
-        self._full_name = None
-        self._identifier = None
-        self.set_full_name(full_name)
-        self.set_identifier(identifier)
+        if identifier is None and full_name is not None:
+            identifier = config.LICENSE_MAP.get(full_name, full_name)
+        elif full_name is None and identifier is not None:
+            full_name = config.LICENSE_MAP.get(identifier, identifier)
+
+        key = (cls, full_name, identifier)
+        lic = _interned_licenses.get(key)
+        if lic is None:
+            lic = super(License, cls).__new__(cls)
+            lic._full_name = full_name
+            lic._identifier = identifier
+            lic._hash = hash(identifier)
+            lic = _interned_licenses.setdefault(key, lic)
+        return lic
+
+    def __init__(self, full_name, identifier):
+        # set by __new__, which may return an existing license
+        pass
+
+    def __reduce__(self):
+        # unpickled and copied licenses are interned as well
+        return type(self), (self._full_name, self._identifier)
 
     @classmethod
     def from_identifier(cls, identifier):
@@ -49,43 +78,12 @@ class License(object):
     def full_name(self):
         return self._full_name
 
-    @full_name.setter
-    def full_name(self, value):
-        self.set_full_name(value)
-
-    def set_full_name(self, value):
-
-        if value is None:
-            return
-        if self._identifier is None:
-            if value in config.LICENSE_MAP:
-                self._identifier = config.LICENSE_MAP[value]
-            else:
-                self._identifier = value
-        self._full_name = value
-
     @property
     def identifier(self):
         return self._identifier
 
-    @identifier.setter
-    def identifier(self, value):
-        self.set_identifier(value)
-
-    def set_identifier(self, value):
-        if value is None:
-            return
-        if self._full_name is None:
-            if value in config.LICENSE_MAP:
-                self._full_name = config.LICENSE_MAP[value]
-            else:
-                self._full_name = value
-
-        self._identifier = value
-
-
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, License)
             and self.identifier == other.identifier
             and self.full_name == other.full_name
@@ -98,69 +96,99 @@ class License(object):
         return self.identifier
 
     def __hash__(self):
-        return self.identifier.__hash__()
+        return self._hash
 
 
-class LicenseConjunction(License):
+class _LicenseExpression(License):
     """
-    A conjunction of two licenses.
+    A license expression of two licenses joined by `operator`. Expressions of
+    interned licenses are interned, their names are joined once. Expressions
+    of extracted licenses, which can change, join the names on every access.
+    The operands of type `parenthesized_type` are put in parentheses.
     """
 
+    operator = None
+    parenthesized_type = None
+
+    def __new__(cls, license_1, license_2):
+        interned = _is_interned(license_1) and _is_interned(license_2)
+        key = (cls, license_1, license_2)
+        lic = _interned_licenses.get(key) if interned else None
+        if lic is None:
+            lic = object.__new__(cls)
+            lic._license_1 = license_1
+            lic._license_2 = license_2
+            lic._full_name = lic._identifier = lic._hash = None
+            if interned:
+                lic._full_name = lic._join_names("full_name")
+                lic._identifier = lic._join_names("identifier")
+                lic._hash = hash(lic._identifier)
+                lic = _interned_licenses.setdefault(key, lic)
+        return lic
+
     def __init__(self, license_1, license_2):
-        self.license_1 = license_1
-        self.license_2 = license_2
-        super(LicenseConjunction, self).__init__(self.full_name, self.identifier)
+        # set by __new__, which may return an existing license
+        pass
+
+    def __reduce__(self):
+        return type(self), (self._license_1, self._license_2)
 
     @property
-    def full_name(self):
-        license_1_complex = type(self.license_1) == LicenseDisjunction
-        license_2_complex = type(self.license_2) == LicenseDisjunction
+    def license_1(self):
+        return self._license_1
 
-        return "{0} AND {1}".format(
-            _add_parens(license_1_complex, self.license_1.full_name),
-            _add_parens(license_2_complex, self.license_2.full_name),
+    @property
+    def license_2(self):
+        return self._license_2
+
+    def _join_names(self, name):
+        parenthesized_type = self.parenthesized_type()
+        return "{0} {1} {2}".format(
+            _add_parens(type(self._license_1) == parenthesized_type, getattr(self._license_1, name)),
+            self.operator,
+            _add_parens(type(self._license_2) == parenthesized_type, getattr(self._license_2, name)),
         )
 
+    @property
+    def full_name(self):
+        if self._full_name is None:
+            return self._join_names("full_name")
+        return self._full_name
+
     @property
     def identifier(self):
-        license_1_complex = type(self.license_1) == LicenseDisjunction
-        license_2_complex = type(self.license_2) == LicenseDisjunction
+        if self._identifier is None:
+            return self._join_names("identifier")
+        return self._identifier
 
-        return "{0} AND {1}".format(
-            _add_parens(license_1_complex, self.license_1.identifier),
-            _add_parens(license_2_complex, self.license_2.identifier),
-        )
+    def __hash__(self):
+        if self._hash is None:
+            return hash(self.identifier)
+        return self._hash
 
 
-class LicenseDisjunction(License):
+class LicenseConjunction(_LicenseExpression):
     """
-    A disjunction of two licenses.
+    A conjunction of two licenses.
     """
 
-    def __init__(self, license_1, license_2):
-        self.license_1 = license_1
-        self.license_2 = license_2
-        super(LicenseDisjunction, self).__init__(self.full_name, self.identifier)
+    operator = "AND"
 
-    @property
-    def full_name(self):
-        license_1_complex = type(self.license_1) == LicenseConjunction
-        license_2_complex = type(self.license_2) == LicenseConjunction
+    @staticmethod
+    def parenthesized_type():
+        return LicenseDisjunction
 
-        return "{0} OR {1}".format(
-            _add_parens(license_1_complex, self.license_1.full_name),
-            _add_parens(license_2_complex, self.license_2.full_name),
-        )
 
-    @property
-    def identifier(self):
-        license_1_complex = type(self.license_1) == LicenseConjunction
-        license_2_complex = type(self.license_2) == LicenseConjunction
+class LicenseDisjunction(_LicenseExpression):
+    """
+    A disjunction of two licenses.
+    """
 
-        return "{0} OR {1}".format(
-            _add_parens(license_1_complex, self.license_1.identifier),
-            _add_parens(license_2_complex, self.license_2.identifier),
-        )
+    operator = "OR"
+
+    @staticmethod
+    def parenthesized_type():
+        return LicenseConjunction
 
 
 @total_ordering
@@ -173,12 +201,51 @@ class ExtractedLicense(License):
     - full_name: license name. str or utils.NoAssert.
     """
 
+    def __new__(cls, identifier):
+        # extracted licenses are changed while parsing, they are not interned
+        return object.__new__(cls)
+
     def __init__(self, identifier):
-        super(ExtractedLicense, self).__init__(None, identifier)
+        self._full_name = None
+        self._identifier = None
+        self.set_identifier(identifier)
         self.text = None
         self.cross_ref = []
         self.comment = None
 
+    def __reduce__(self):
+        return type(self), (self._identifier,), self.__dict__
+
+    @property
+    def full_name(self):
+        return self._full_name
+
+    @full_name.setter
+    def full_name(self, value):
+        self.set_full_name(value)
+
+    def set_full_name(self, value):
+        if value is None:
+            return
+        if self._identifier is None:
+            self._identifier = config.LICENSE_MAP.get(value, value)
+        self._full_name = value
+
+    @property
+    def identifier(self):
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, value):
+        self.set_identifier(value)
+
+    def set_identifier(self, value):
+        if value is None:
+            return
+        if self._full_name is None:
+            self._full_name = config.LICENSE_MAP.get(value, value)
+        self._identifier = value
+
     def __eq__(self, other):
         return (
             isinstance(other, ExtractedLicense)
@@ -205,3 +272,8 @@ def _add_parens(required, text):
     return `text` unmodified.
     """
     return "({})".format(text) if required else text
+
+
+def _is_interned(lic):
+    return isinstance(lic, License) and not isinstance(lic, ExtractedLicense) and (
+        not isinstance(lic, _LicenseExpression) or lic._hash is not None)
@@ -17,6 +17,7 @@ from typing import Optional
 from spdx import creationinfo
 from spdx import license
 from spdx import utils
+from spdx.change_tracking import ChangeTracked, IndexedAttribute
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.parsers.builderexceptions import SPDXValueError
 from spdx.parsers.loggers import ErrorMessages
@@ -37,7 +38,7 @@ class PackagePurpose(Enum):
     OTHER = 12
 
 
-class Package(object):
+class Package(ChangeTracked):
     """
     Represent an analyzed Package.
     Fields:
@@ -81,6 +82,9 @@ class Package(object):
      - primary_package_purpose: Optional one. Type: PackagePurpose
     """
 
+    collection_attributes = ("checksums", "licenses_from_files", "verif_exc_files", "pkg_ext_refs")
+    spdx_id = IndexedAttribute()
+
     def __init__(
         self,
         name=None,
@@ -306,6 +310,7 @@ class Package(object):
             raise SPDXValueError("Package::Checksum")
 
         self.checksums[new_checksum.identifier] = new_checksum
+        self.mark_changed()
 
     def has_optional_field(self, field):
         return bool(getattr(self, field, None))
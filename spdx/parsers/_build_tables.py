@@ -0,0 +1,68 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Regenerate the PLY parse tables shipped in spdx.parsers.
+
+The tag-value and license expression parsers load their LALR tables from
+these modules instead of building them on every start. PLY compares the
+grammar signature stored in the tables with the current grammar and rebuilds
+them when they differ, but the shipped copies should be regenerated whenever
+a grammar rule changes:
+
+    python -m spdx.parsers._build_tables
+"""
+
+import importlib
+import os
+
+from ply import yacc
+
+from spdx import utils
+from spdx.parsers import tagvalue
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.tagvaluebuilders import Builder
+
+
+def _remove_table_module(module_name):
+    module_file = os.path.join(
+        os.path.dirname(__file__), module_name.rsplit(".", 1)[-1] + ".py"
+    )
+    if os.path.exists(module_file):
+        os.remove(module_file)
+    importlib.invalidate_caches()
+
+
+def tables_are_current(parser, module_name):
+    """
+    Return True if the tables in `module_name` were generated from the grammar
+    of `parser`, i.e. PLY will load them instead of rebuilding.
+    """
+    pinfo = yacc.ParserReflect({name: getattr(parser, name) for name in dir(parser)})
+    pinfo.get_all()
+    try:
+        return yacc.LRTable().read_table(module_name) == pinfo.signature()
+    except (ImportError, yacc.VersionError):
+        return False
+
+
+def build_tables():
+    _remove_table_module(tagvalue.PARSETAB_MODULE)
+    parser = tagvalue.Parser(Builder(), StandardLogger())
+    parser.build(write_tables=True)
+
+    _remove_table_module(utils.LICENSE_PARSETAB_MODULE)
+    license_parser = utils.LicenseListParser()
+    license_parser.build(write_tables=True)
+
+
+if __name__ == "__main__":
+    build_tables()
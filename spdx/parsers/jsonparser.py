@@ -9,10 +9,151 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
 import json
+import re
 
 from spdx.parsers import jsonyamlxml
 
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStream(object):
+    """
+    Incremental reader for a JSON text in a file object. Values are decoded
+    one at a time, and only the current value and one read chunk are kept
+    in memory.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        self.bytes_decoder = None
+
+    def read_more(self, size):
+        """
+        Append up to size characters from the file to the buffer, dropping the
+        consumed part. Return False if the end of the file was reached.
+        """
+        if self.eof:
+            return False
+        data = self.file.read(size)
+        if not data:
+            self.eof = True
+            return False
+        if isinstance(data, bytes):
+            if self.bytes_decoder is None:
+                self.bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+            data = self.bytes_decoder.decode(data)
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def error(self, msg):
+        return json.JSONDecodeError(msg, self.buffer, self.pos)
+
+    def peek(self):
+        """
+        Skip whitespace and return the next character without consuming it,
+        or an empty string at the end of the file.
+        """
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more(self.chunk_size):
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error("Expecting '{0}'".format(char))
+        self.pos += 1
+
+    def value(self):
+        """
+        Decode and return the next JSON value.
+        """
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # a number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.read_more(size)
+            size *= 2
+
+    def _next_member(self, closing_char):
+        char = self.peek()
+        self.pos += 1
+        if char == closing_char:
+            return False
+        if char != ",":
+            raise self.error("Expecting ',' delimiter")
+        return True
+
+    def iter_array(self):
+        """
+        Yield the elements of the array at the current position one at a time.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if not self._next_member("]"):
+                return
+
+    def iter_object_keys(self):
+        """
+        Yield the keys of the object at the current position. The value of each
+        key must be consumed with value, iter_array or iter_object_keys before
+        the next key is requested.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self.error("Expecting property name")
+            self.expect(":")
+            yield key
+            if not self._next_member("}"):
+                return
+
+
+def iter_document_fields(stream):
+    """
+    Yield the (field name, value) pairs of the SPDX document read by a
+    JsonStream, with the elements of jsonyamlxml.ELEMENT_FIELDS as iterators.
+    """
+    for key in stream.iter_object_keys():
+        char = stream.peek()
+        if key in jsonyamlxml.ELEMENT_FIELDS and char == "[":
+            elements = stream.iter_array()
+            yield key, elements
+            # skip whatever the consumer did not read
+            for _ in elements:
+                pass
+        elif key == "Document" and char == "{":
+            yield from iter_document_fields(stream)
+        else:
+            yield key, stream.value()
+
 
 class Parser(jsonyamlxml.Parser):
     """
@@ -24,6 +165,12 @@ class Parser(jsonyamlxml.Parser):
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
 
-    def parse(self, file):
+    def parse(self, file, incremental=False):
+        """
+        Parse a JSON SPDX document from file. If incremental is set, the file
+        is read one element at a time instead of being loaded as a whole.
+        """
+        if incremental:
+            return self.parse_incremental(iter_document_fields(JsonStream(file)))
         self.json_yaml_set_document(json.load(file))
         return super(Parser, self).parse()
@@ -10,20 +10,25 @@
 # limitations under the License.
 from datetime import datetime
 from enum import Enum, auto
-from typing import List, Dict, Tuple, Callable, Optional
+from collections.abc import Iterator
+from typing import List, Dict, Tuple, Callable, Optional, Iterable
 
 from spdx import document
 from spdx import utils
-from spdx.license import LicenseConjunction, LicenseDisjunction
+from spdx.license import License, LicenseConjunction, LicenseDisjunction
 from spdx.package import ExternalPackageRef, PackagePurpose, Package
 from spdx.parsers import rdf
 from spdx.parsers.builderexceptions import SPDXValueError, CardinalityError, OrderError
-from spdx.parsers.loggers import ErrorMessages
+from spdx.parsers.loggers import ErrorLimitReached, ErrorMessages
 from spdx.snippet import Snippet
 from spdx.utils import UnKnown
 
 ERROR_MESSAGES = rdf.ERROR_MESSAGES
 
+# Document fields holding lists of elements, which Parser.parse_incremental
+# accepts as iterators and parses one element at a time.
+ELEMENT_FIELDS = ("relationships", "snippets", "packages", "files")
+
 
 class BaseParser(object):
     def __init__(self, builder, logger):
@@ -331,6 +336,28 @@ class LicenseParser(BaseParser):
             )
             return license_objects[-1] if license_objects else license_object
 
+    def replace_element_licenses(self):
+        """
+        Replace the licenses of the packages, files and snippets parsed so far
+        by the matching extracted licenses. Needed when the extracted licenses
+        are only parsed after the elements referring to them.
+        """
+        def replace(license_object):
+            if isinstance(license_object, License):
+                return self.replace_license(license_object)
+            return license_object
+
+        for package in self.document.packages:
+            package.conc_lics = replace(package.conc_lics)
+            package.license_declared = replace(package.license_declared)
+            package.licenses_from_files = list(map(replace, package.licenses_from_files))
+        for file in self.document.files:
+            file.conc_lics = replace(file.conc_lics)
+            file.licenses_in_file = list(map(replace, file.licenses_in_file))
+        for snippet in self.document.snippet:
+            snippet.conc_lics = replace(snippet.conc_lics)
+            snippet.licenses_in_snippet = list(map(replace, snippet.licenses_in_snippet))
+
 
 class AnnotationParser(BaseParser):
     def __init__(self, builder, logger):
@@ -445,15 +472,22 @@ class RelationshipParser(BaseParser):
         """
         if isinstance(relationships, list):
             for relationship in relationships:
-                if isinstance(relationship, dict):
-                    if self.parse_relationship(
-                        relationship.get("spdxElementId"),
-                        relationship.get("relationshipType"),
-                        relationship.get("relatedSpdxElement"),
-                    ):
-                        self.parse_relationship_comment(relationship.get("comment"))
-                else:
-                    self.value_error("RELATIONSHIP", relationship)
+                self.parse_relationship_info(relationship)
+
+    def parse_relationship_info(self, relationship):
+        """
+        Parse a single Relationship Information entry
+        - relationship: Python dict with Relationship Information fields in it
+        """
+        if isinstance(relationship, dict):
+            if self.parse_relationship(
+                relationship.get("spdxElementId"),
+                relationship.get("relationshipType"),
+                relationship.get("relatedSpdxElement"),
+            ):
+                self.parse_relationship_comment(relationship.get("comment"))
+        else:
+            self.value_error("RELATIONSHIP", relationship)
 
     def parse_relationship(self, spdxelementid, relationshiptype, relatedspdxelement):
         """
@@ -514,28 +548,35 @@ class SnippetParser(BaseParser):
         """
         if isinstance(snippets, list):
             for snippet in snippets:
-                if isinstance(snippet, dict):
-                    if self.parse_snippet_id(snippet.get("SPDXID")):
-                        self.parse_snippet_name(snippet.get("name"))
-                        self.parse_snippet_comment(snippet.get("comment"))
-                        self.parse_snippet_copyright(snippet.get("copyrightText"))
-                        self.parse_snippet_license_comment(
-                            snippet.get("licenseComments")
-                        )
-                        self.parse_snippet_file_spdxid(snippet.get("snippetFromFile"))
-                        self.parse_snippet_concluded_license(
-                            snippet.get("licenseConcluded")
-                        )
-                        self.parse_snippet_attribution_text(
-                            snippet.get("attributionTexts")
-                        )
-                        self.parse_snippet_license_info_from_snippet(
-                            snippet.get("licenseInfoInSnippets")
-                        )
-                        self.parse_annotations(snippet.get("annotations"), spdx_id=snippet.get("SPDXID"))
-                        self.parse_snippet_ranges(snippet.get("ranges"))
-                else:
-                    self.value_error("SNIPPET", snippet)
+                self.parse_snippet(snippet)
+
+    def parse_snippet(self, snippet):
+        """
+        Parse a single Snippet Information entry
+        - snippet: Python dict with Snippet Information fields in it
+        """
+        if isinstance(snippet, dict):
+            if self.parse_snippet_id(snippet.get("SPDXID")):
+                self.parse_snippet_name(snippet.get("name"))
+                self.parse_snippet_comment(snippet.get("comment"))
+                self.parse_snippet_copyright(snippet.get("copyrightText"))
+                self.parse_snippet_license_comment(
+                    snippet.get("licenseComments")
+                )
+                self.parse_snippet_file_spdxid(snippet.get("snippetFromFile"))
+                self.parse_snippet_concluded_license(
+                    snippet.get("licenseConcluded")
+                )
+                self.parse_snippet_attribution_text(
+                    snippet.get("attributionTexts")
+                )
+                self.parse_snippet_license_info_from_snippet(
+                    snippet.get("licenseInfoInSnippets")
+                )
+                self.parse_annotations(snippet.get("annotations"), spdx_id=snippet.get("SPDXID"))
+                self.parse_snippet_ranges(snippet.get("ranges"))
+        else:
+            self.value_error("SNIPPET", snippet)
 
     def parse_snippet_id(self, snippet_id):
         """
@@ -647,9 +688,7 @@ class SnippetParser(BaseParser):
         - concluded_license: Python str/unicode
         """
         if isinstance(concluded_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
-            license_object = self.replace_license(lic_parser.parse(concluded_license))
+            license_object = self.replace_license(utils.parse_license_expression(concluded_license))
             try:
                 return self.builder.set_snip_concluded_license(
                     self.document, license_object
@@ -669,10 +708,8 @@ class SnippetParser(BaseParser):
         if isinstance(license_info_from_snippet, list):
             for lic_in_snippet in license_info_from_snippet:
                 if isinstance(lic_in_snippet, str):
-                    lic_parser = utils.LicenseListParser()
-                    lic_parser.build(write_tables=0, debug=0)
                     license_object = self.replace_license(
-                        lic_parser.parse(lic_in_snippet)
+                        utils.parse_license_expression(lic_in_snippet)
                     )
                     try:
                         self.builder.set_snippet_lics_info(
@@ -900,9 +937,7 @@ class FileParser(BaseParser):
         - concluded_license: Python str/unicode
         """
         if isinstance(concluded_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
-            license_object = self.replace_license(lic_parser.parse(concluded_license))
+            license_object = self.replace_license(utils.parse_license_expression(concluded_license))
             try:
                 return self.builder.set_concluded_license(self.document, license_object)
             except SPDXValueError:
@@ -922,10 +957,8 @@ class FileParser(BaseParser):
         if isinstance(license_info_in_files, list):
             for license_info_in_file in license_info_in_files:
                 if isinstance(license_info_in_file, str):
-                    lic_parser = utils.LicenseListParser()
-                    lic_parser.build(write_tables=0, debug=0)
                     license_object = self.replace_license(
-                        lic_parser.parse(license_info_in_file)
+                        utils.parse_license_expression(license_info_in_file)
                     )
                     try:
                         self.builder.set_file_license_in_file(
@@ -1412,10 +1445,8 @@ class PackageParser(BaseParser):
         - pkg_concluded_license: Python str/unicode
         """
         if isinstance(pkg_concluded_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
             license_object = self.replace_license(
-                lic_parser.parse(pkg_concluded_license)
+                utils.parse_license_expression(pkg_concluded_license)
             )
             try:
                 return self.builder.set_pkg_licenses_concluded(
@@ -1442,10 +1473,8 @@ class PackageParser(BaseParser):
         if isinstance(license_info_from_files, list):
             for license_info_from_file in license_info_from_files:
                 if isinstance(license_info_from_file, str):
-                    lic_parser = utils.LicenseListParser()
-                    lic_parser.build(write_tables=0, debug=0)
                     license_object = self.replace_license(
-                        lic_parser.parse(license_info_from_file)
+                        utils.parse_license_expression(license_info_from_file)
                     )
                     try:
                         self.builder.set_pkg_license_from_file(
@@ -1486,10 +1515,8 @@ class PackageParser(BaseParser):
         - pkg_declared_license: Python str/unicode
         """
         if isinstance(pkg_declared_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
             license_object = self.replace_license(
-                lic_parser.parse(pkg_declared_license)
+                utils.parse_license_expression(pkg_declared_license)
             )
             try:
                 return self.builder.set_pkg_license_declared(
@@ -1714,6 +1741,9 @@ class Parser(
     FileParser,
     PackageParser,
 ):
+    # keep the files of the parsed document in a file_table.FileTable
+    file_table = False
+
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
 
@@ -1729,38 +1759,140 @@ class Parser(
         Parse Document Information fields
         """
         self.error = False
-        self.document = document.Document()
+        self.document = document.Document(file_table=self.file_table)
         self.document_object = flatten_document(self.document_object)
-        if not isinstance(self.document_object, dict):
-            self.logger.log("Empty or not valid SPDX Document")
+        try:
+            if not isinstance(self.document_object, dict):
+                self.logger.log("Empty or not valid SPDX Document")
+                self.error = True
+                return self.document, self.error
+
+            self.parse_doc_version(self.document_object.get("spdxVersion"))
+            self.parse_doc_data_license(self.document_object.get("dataLicense"))
+            self.parse_doc_id(self.document_object.get("SPDXID"))
+            self.parse_doc_name(self.document_object.get("name"))
+            self.parse_doc_namespace(self.document_object.get("documentNamespace"))
+            self.parse_doc_comment(self.document_object.get("comment"))
+            self.parse_creation_info(self.document_object.get("creationInfo"))
+            self.parse_external_document_refs(
+                self.document_object.get("externalDocumentRefs")
+            )
+            self.parse_extracted_license_info(
+                self.document_object.get("hasExtractedLicensingInfos")
+            )
+            self.parse_annotations(self.document_object.get("annotations"), spdx_id=self.document_object.get("SPDXID"))
+            self.parse_relationships(self.document_object.get("relationships"))
+            self.parse_reviews(self.document_object.get("reviewers"))
+            self.parse_snippets(self.document_object.get("snippets"))
+
+            self.parse_packages(self.document_object.get("packages"))
+            self.parse_files(self.document_object.get("files"))
+
+            if self.document_object.get("documentDescribes"):
+                self.parse_doc_described_objects(self.document_object.get("documentDescribes"))
+
+            return self.validate_document()
+        except ErrorLimitReached:
+            # the logger stops parsing at its maximum number of errors
+            self.error = True
+            return self.document, self.error
+
+    def parse_incremental(self, document_fields: Iterable[Tuple[str, object]]):
+        """
+        Parse Document Information fields from (field name, value) pairs in
+        document order, so that the whole document never has to be in memory.
+        The values of ELEMENT_FIELDS may be iterators yielding one element at a
+        time; each element is parsed as soon as it is yielded.
+        """
+        self.error = False
+        self.document = document.Document(file_table=self.file_table)
+        element_parsers = {
+            "relationships": (self.parse_relationships, self.parse_relationship_info),
+            "snippets": (self.parse_snippets, self.parse_snippet),
+            "packages": (self.parse_packages, lambda package: self.parse_package(package, self.parse_relationship)),
+            "files": (self.parse_files, self.parse_file),
+        }
+        try:
+            header_fields = {}
+            parsed_header_fields = set()
+            elements_parsed = False
+            # extracted licenses read after some elements must be applied to them afterwards
+            late_extracted_licenses = False
+
+            for field, value in document_fields:
+                if field not in element_parsers:
+                    if isinstance(value, list) and isinstance(header_fields.get(field), list):
+                        # a list field that is repeated further on, as elements in XML can be
+                        if field in parsed_header_fields:
+                            parsed_header_fields.remove(field)
+                        else:
+                            value = header_fields[field] + value
+                    header_fields[field] = value
+                    continue
+                # header fields seen so far are needed to parse the elements
+                late_extracted_licenses = late_extracted_licenses or (
+                    elements_parsed and "hasExtractedLicensingInfos" in header_fields
+                    and "hasExtractedLicensingInfos" not in parsed_header_fields
+                )
+                self.parse_header_fields(header_fields, parsed_header_fields)
+                parse_list, parse_element = element_parsers[field]
+                if isinstance(value, (list, Iterator)):
+                    for element in value:
+                        parse_element(element)
+                else:
+                    parse_list(value)
+                elements_parsed = True
+
+            late_extracted_licenses = late_extracted_licenses or (
+                elements_parsed and "hasExtractedLicensingInfos" not in parsed_header_fields
+            )
+            self.parse_header_fields(header_fields, parsed_header_fields, final=True)
+            if late_extracted_licenses and self.document.extracted_licenses:
+                self.replace_element_licenses()
+
+            if header_fields.get("documentDescribes"):
+                self.parse_doc_described_objects(header_fields.get("documentDescribes"))
+
+            return self.validate_document()
+        except ErrorLimitReached:
+            # the logger stops parsing at its maximum number of errors
             self.error = True
             return self.document, self.error
 
-        self.parse_doc_version(self.document_object.get("spdxVersion"))
-        self.parse_doc_data_license(self.document_object.get("dataLicense"))
-        self.parse_doc_id(self.document_object.get("SPDXID"))
-        self.parse_doc_name(self.document_object.get("name"))
-        self.parse_doc_namespace(self.document_object.get("documentNamespace"))
-        self.parse_doc_comment(self.document_object.get("comment"))
-        self.parse_creation_info(self.document_object.get("creationInfo"))
-        self.parse_external_document_refs(
-            self.document_object.get("externalDocumentRefs")
-        )
-        self.parse_extracted_license_info(
-            self.document_object.get("hasExtractedLicensingInfos")
-        )
-        self.parse_annotations(self.document_object.get("annotations"), spdx_id=self.document_object.get("SPDXID"))
-        self.parse_relationships(self.document_object.get("relationships"))
-        self.parse_reviews(self.document_object.get("reviewers"))
-        self.parse_snippets(self.document_object.get("snippets"))
-
-        self.parse_packages(self.document_object.get("packages"))
-        self.parse_files(self.document_object.get("files"))
-
-        if self.document_object.get("documentDescribes"):
-            self.parse_doc_described_objects(self.document_object.get("documentDescribes"))
-
-        validation_messages = ErrorMessages()
+    def parse_header_fields(self, header_fields: Dict, parsed_header_fields: set, final: bool = False):
+        """
+        Parse the not yet parsed document-level fields of header_fields in the
+        order used by parse. Unless final is set, fields that have not been
+        read yet are left for a later call.
+        """
+        header_parsers = [
+            ("spdxVersion", self.parse_doc_version),
+            ("dataLicense", self.parse_doc_data_license),
+            ("SPDXID", self.parse_doc_id),
+            ("name", self.parse_doc_name),
+            ("documentNamespace", self.parse_doc_namespace),
+            ("comment", self.parse_doc_comment),
+            ("creationInfo", self.parse_creation_info),
+            ("externalDocumentRefs", self.parse_external_document_refs),
+            ("hasExtractedLicensingInfos", self.parse_extracted_license_info),
+            ("annotations", lambda annotations: self.parse_annotations(
+                annotations, spdx_id=header_fields.get("SPDXID"))),
+            ("reviewers", self.parse_reviews),
+        ]
+        for field, parse_field in header_parsers:
+            if field in parsed_header_fields or not (final or field in header_fields):
+                continue
+            # the annotations of the document are parsed with its SPDX id
+            if field == "annotations" and not (final or "SPDXID" in header_fields):
+                continue
+            parse_field(header_fields.get(field))
+            parsed_header_fields.add(field)
+
+    def validate_document(self):
+        """
+        Validate the parsed document and return it together with the error flag.
+        """
+        validation_messages = ErrorMessages(getattr(self.logger, "max_errors", None))
         # Report extra errors if self.error is False otherwise there will be
         # redundant messages
         validation_messages = self.document.validate(validation_messages)
@@ -9,6 +9,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import re
+from collections import deque
+
 from ply import lex
 
 
@@ -146,6 +150,7 @@ class Lexer(object):
     def t_text(self, t):
         r":\s*<text>"
         t.lexer.text_start = t.lexer.lexpos - len("<text>")
+        t.lexer.lineno += t.value.count("\n")
         t.lexer.begin("text")
 
     def t_text_end(self, t):
@@ -167,46 +172,55 @@ class Lexer(object):
     def t_CHKSUM(self, t):
         r":\s*(ADLER32|BLAKE2b-256|BLAKE2b-384|BLAKE2b-512|BLAKE3|MD2|MD4|MD5|MD6|" \
         "SHA1|SHA224|SHA256|SHA384|SHA512|SHA3-256|SHA3-384|SHA3-512):\s*([a-fA-F0-9]*)"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
     def t_RANGE(self, t):
         r":\s*\d+:\d+"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
     def t_DOC_REF_ID(self, t):
         r":\s*DocumentRef-([A-Za-z0-9\+\.\-]+)"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
     def t_DOC_URI(self, t):
         r"\s*((ht|f)tps?:\/\/\S*)"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value.strip()
         return t
 
     def t_EXT_DOC_REF_CHKSUM(self, t):
         r"\s*SHA1:\s*[a-f0-9]{40,40}"
-        t.value = t.value[1:].strip()
+        t.lexer.lineno += t.value.count("\n")
+        t.value = t.value.strip()
         return t
 
     def t_TOOL_VALUE(self, t):
         r":\s*Tool:.+"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
     def t_ORG_VALUE(self, t):
         r":\s*Organization:.+"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
     def t_PERSON_VALUE(self, t):
         r":\s*Person:.+"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
     def t_DATE(self, t):
         r":\s*\d\d\d\d-\d\d-\d\dT\d\d:\d\d:\d\dZ"
+        t.lexer.lineno += t.value.count("\n")
         t.value = t.value[1:].strip()
         return t
 
@@ -235,7 +249,7 @@ class Lexer(object):
 
     def t_whitespace(self, t):
         r"\s+"
-        pass
+        t.lexer.lineno += t.value.count("\n")
 
     def build(self, **kwargs):
         self.lexer = lex.lex(module=self, **kwargs)
@@ -244,9 +258,172 @@ class Lexer(object):
         return self.lexer.token()
 
     def input(self, data):
+        if not isinstance(data, str):
+            data = data.read()
         self.lexer.input(data)
 
     def t_error(self, t):
         t.lexer.skip(1)
         t.value = "Lexer error"
         return t
+
+
+# Rules of Lexer matching a value at the colon after a tag, in the order in
+# which the Lexer tries them. DOC_URI and EXT_DOC_REF_CHKSUM never start with
+# a colon.
+VALUE_RULES = ["text", "CHKSUM", "RANGE", "DOC_REF_ID", "TOOL_VALUE", "ORG_VALUE", "PERSON_VALUE", "DATE"]
+VALUE_PATTERN = re.compile("|".join("(?P<{}>{})".format(rule, getattr(Lexer, "t_" + rule).__doc__)
+                                    for rule in VALUE_RULES), re.UNICODE)
+TAG_PATTERN = re.compile(r"\s*([a-zA-Z]+):")
+# a tag followed by a colon that is matched as a DOC_URI by Lexer
+URI_SCHEMES = {"http", "https", "ftp", "ftps"}
+OPEN_COLON_PATTERN = re.compile(r":\s*\Z")
+
+
+class LineLexer(object):
+    """
+    Tokenizer for tag-value documents that reads its input one line at a time
+    and produces the same tokens as Lexer.
+
+    Lines of a tag, a colon and a value, comments and `<text>` blocks are
+    tokenized without running the Lexer rules over the whole input. Other
+    lines, like ExternalDocumentRef values of several tokens, are tokenized
+    with the rules of Lexer.
+    """
+    reserved = Lexer.reserved
+    tokens = Lexer.tokens
+
+    def __init__(self):
+        self.rule_lexer = None
+        self.rule_lexer_args = {}
+        self.input("")
+
+    def build(self, **kwargs):
+        # the Lexer for irregular lines is built when the first one is found
+        self.rule_lexer = None
+        self.rule_lexer_args = kwargs
+
+    def input(self, data):
+        """
+        Tokenize data, a string or a file object which is read line by line.
+        """
+        if isinstance(data, str):
+            data = io.StringIO(data)
+        self.lines = iter(data)
+        # line number and offset of the line being tokenized
+        self.lineno = 0
+        self.lexpos = 0
+        self.next_lexpos = 0
+        self.pending = deque()
+
+    def token(self):
+        while not self.pending:
+            line = self.next_line()
+            if line is None:
+                return None
+            self.tokenize_line(line, 0)
+        return self.pending.popleft()
+
+    def next_line(self):
+        line = next(self.lines, None)
+        if line is not None:
+            self.lineno += 1
+            self.lexpos = self.next_lexpos
+            self.next_lexpos += len(line)
+        return line
+
+    def add_token(self, token_type, value, lineno, lexpos):
+        tok = lex.LexToken()
+        tok.type = token_type
+        tok.value = value
+        tok.lineno = lineno
+        tok.lexpos = lexpos
+        self.pending.append(tok)
+
+    def tokenize_line(self, line, pos):
+        """
+        Add the tokens of line from pos on, and of the following lines if a
+        value continues on them.
+        """
+        match = TAG_PATTERN.match(line, pos)
+        if match is None or match.group(1) in URI_SCHEMES:
+            rest = line[pos:].lstrip()
+            if rest and not rest.startswith("#"):
+                self.tokenize_with_rules(line, pos)
+            return
+
+        tag = match.group(1)
+        self.add_token(self.reserved.get(tag, "UNKNOWN_TAG"), tag, self.lineno, self.lexpos + match.start(1))
+        colon = match.end() - 1
+        match = VALUE_PATTERN.match(line, colon)
+        if match is not None and match.end() == len(line):
+            # the value may continue on the next lines, like a checksum after "SHA1:"
+            self.tokenize_with_rules(line, colon)
+            return
+        if match is not None:
+            if match.lastgroup == "text":
+                self.tokenize_text(line, match.end())
+                return
+            self.add_token(match.lastgroup, match.group()[1:].strip(), self.lineno, self.lexpos + colon)
+            if match.end() < len(line) and not line[match.end():].isspace():
+                self.tokenize_line(line, match.end())
+            return
+
+        value = line[colon + 1:].strip()
+        if not value:
+            # an empty value is an error, unless a text or other value
+            # follows on the next lines
+            self.tokenize_with_rules(line, colon)
+            return
+        self.add_token(self.reserved.get(value, "LINE"), value, self.lineno, self.lexpos + colon)
+
+    def tokenize_text(self, line, pos):
+        """
+        Add the TEXT token of the `<text>` block ending at pos in line, which
+        may end on one of the following lines, and the tokens after it.
+        """
+        lineno = self.lineno
+        start = pos - len("<text>")
+        parts = []
+        end = line.find("</text>", pos)
+        while end == -1:
+            parts.append(line[start:])
+            line = self.next_line()
+            if line is None:
+                # like Lexer, drop a text that is not closed
+                return
+            start = 0
+            end = line.find("</text>")
+        pos = end + len("</text>")
+        parts.append(line[start:pos])
+        self.add_token("TEXT", "".join(parts).strip(), lineno, self.lexpos + end)
+        if pos < len(line) and not line[pos:].isspace():
+            self.tokenize_line(line, pos)
+
+    def tokenize_with_rules(self, line, pos):
+        """
+        Add the tokens of line from pos on with the rules of Lexer, together
+        with as many of the following lines as a value or text started on
+        line can extend to.
+        """
+        if self.rule_lexer is None:
+            self.rule_lexer = Lexer()
+            self.rule_lexer.build(**self.rule_lexer_args)
+        lexer = self.rule_lexer.lexer
+        lineno = self.lineno
+        lexpos = self.lexpos + pos
+        chunk = line[pos:]
+        while True:
+            lexer.begin("INITIAL")
+            lexer.input(chunk)
+            lexer.lineno = lineno
+            tokens = list(iter(lexer.token, None))
+            if lexer.current_state() != "text" and not OPEN_COLON_PATTERN.search(chunk):
+                break
+            line = self.next_line()
+            if line is None:
+                break
+            chunk += line
+        for tok in tokens:
+            tok.lexpos += lexpos
+        self.pending.extend(tokens)
@@ -8,6 +8,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
 
 class StandardLogger(object):
@@ -23,12 +24,56 @@ class FileLogger(object):
         self.dest.write(msg + "\n")
 
 
+class ErrorLimitReached(Exception):
+    """
+    Raised by ErrorMessages when the maximum number of errors is reached.
+    """
+
+
+class ErrorRecord(NamedTuple):
+    """
+    An error message with its context, formatted only when needed. A message
+    without args is logged as is, see ErrorMessages.log.
+    """
+    context: Tuple[str, ...]
+    template: str
+    args: Optional[tuple] = ()
+    kwargs: Optional[dict] = None
+
+    @property
+    def message(self) -> str:
+        if self.args is None:
+            message = self.template
+        else:
+            message = self.template.format(*self.args, **(self.kwargs or {}))
+        return "".join([c + ": " for c in self.context if c]) + message
+
+
+# creates an ErrorRecord without the keyword argument handling of its constructor
+_new_record = ErrorRecord._make
+
+
 class ErrorMessages:
+    """
+    Collect error records and format them only when needed.
+
+    With max_errors, ErrorLimitReached is raised as soon as this many errors
+    were added, so that Document.validate and the parsers stop early.
+    fail_fast is the same as max_errors=1.
+    An ErrorMessages can also be used as the logger of the parsers.
+    """
+
+    def __init__(self, max_errors: Optional[int] = None, fail_fast: bool = False):
+        self.records: List[ErrorRecord] = []
+        self.context: List[str] = []
+        self.max_errors = 1 if fail_fast else max_errors
+        # the formatted messages of the first records
+        self._messages: List[str] = []
+
+    @property
+    def limit_reached(self) -> bool:
+        return self.max_errors is not None and len(self.records) >= self.max_errors
 
-    def __init__(self):
-        self.messages = []
-        self.context = []
-    
     def push_context(self, context):
         """push some context information to better identify where is the problem"""
         self.context.append(context)
@@ -36,24 +81,53 @@ class ErrorMessages:
     def pop_context(self):
         """pop the last context information"""
         self.context.pop()
-    
+
     def append(self, message, *args, **kwargs):
         """add a message with standard python format
         the current context is prefixed to the message
         """
-        message = message.format(*args, **kwargs)
-        message = "".join([c + ": " for c in self.context if c]) + message
-        self.messages.append(message)
+        self.add_record(_new_record((tuple(self.context), message, args, kwargs or None)))
+
+    def log(self, msg):
+        """add a message that is already formatted, like the parser loggers"""
+        self.add_record(_new_record((tuple(self.context), msg, None, None)))
+
+    def add_record(self, record: ErrorRecord) -> None:
+        records = self.records
+        if self.max_errors is not None and len(records) >= self.max_errors:
+            raise ErrorLimitReached(self.max_errors)
+        records.append(record)
+        if self.max_errors is not None and len(records) >= self.max_errors:
+            raise ErrorLimitReached(self.max_errors)
+
+    def extend(self, records: Iterable[ErrorRecord]) -> None:
+        for record in records:
+            self.add_record(record)
+
+    @property
+    def messages(self) -> List[str]:
+        """
+        A copy of the formatted messages. Deprecated for adding messages:
+        they used to be collected in this list, use append or log instead.
+        """
+        messages = self._messages
+        # records are only ever appended, so the messages of the new ones are formatted
+        if len(messages) < len(self.records):
+            messages.extend(record.message for record in self.records[len(messages):])
+        return list(messages)
 
     def __iter__(self):
-        return self.messages.__iter__()
+        return (record.message for record in self.records)
+
+    def __len__(self):
+        return len(self.records)
 
     def __bool__(self):
-        return len(self.messages)>0
+        return len(self.records) > 0
 
     def __nonzero__(self):
-        return len(self.messages)>0
-    
+        return len(self.records) > 0
+
     def __eq__(self, b):
         if isinstance(b, ErrorMessages):
             return self.messages == b.messages
@@ -21,16 +21,18 @@ from spdx.parsers import jsonyamlxmlbuilders, tagvaluebuilders, rdfbuilders
 from spdx.parsers.builderexceptions import FileTypeError
 
 
-def parse_file(fn):
+def get_parser_modules(fn):
+    """
+    Return the parsing and builder modules for the format of file fn, given
+    by its extension.
+    """
     builder_module = jsonyamlxmlbuilders
-    read_data = False
     if fn.endswith(".rdf") or fn.endswith(".rdf.xml"):
         parsing_module = rdf
         builder_module = rdfbuilders
     elif fn.endswith(".tag") or fn.endswith(".spdx"):
         parsing_module = tagvalue
         builder_module = tagvaluebuilders
-        read_data = True
     elif fn.endswith(".json"):
         parsing_module = jsonparser
     elif fn.endswith(".xml"):
@@ -39,13 +41,31 @@ def parse_file(fn):
         parsing_module = yamlparser
     else:
         raise FileTypeError("FileType Not Supported" + str(fn))
+    return parsing_module, builder_module
 
-    p = parsing_module.Parser(builder_module.Builder(), StandardLogger())
+
+def create_parser(parsing_module, builder_module, logger=None, file_table=False):
+    """
+    Return a built Parser of parsing_module with a Builder of builder_module.
+    A parser can parse several documents, when its builder is reset before
+    each one.
+    """
+    if logger is None:
+        logger = StandardLogger()
+    p = parsing_module.Parser(builder_module.Builder(), logger)
+    p.file_table = file_table
     if hasattr(p, "build"):
         p.build()
+    return p
+
+
+def parse_file(fn, logger=None, file_table=False):
+    """
+    Parse the SPDX document in file fn, in the format given by its extension,
+    and return it with the error flag. The errors are logged to logger, a
+    StandardLogger by default, or an ErrorMessages to collect them. With
+    file_table, the files of the document are kept in a file_table.FileTable.
+    """
+    p = create_parser(*get_parser_modules(fn), logger=logger, file_table=file_table)
     with open(fn) as f:
-        if read_data:
-            data = f.read()
-            return p.parse(data)
-        else:
-            return p.parse(f)
+        return p.parse(f)
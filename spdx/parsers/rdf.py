@@ -9,14 +9,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pathlib
 import re
+from functools import partial, reduce
+from urllib.parse import urljoin
+from xml.etree import ElementTree
 
-from functools import reduce
-
+from rdflib import BNode
 from rdflib import Graph
+from rdflib import Literal
 from rdflib import Namespace
 from rdflib import RDF
 from rdflib import RDFS
+from rdflib import URIRef
 
 from spdx import document
 from spdx import license
@@ -24,7 +29,7 @@ from spdx import utils
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.parsers.builderexceptions import CardinalityError
 from spdx.parsers.builderexceptions import SPDXValueError
-from spdx.parsers.loggers import ErrorMessages
+from spdx.parsers.loggers import ErrorLimitReached, ErrorMessages
 
 
 ERROR_MESSAGES = {
@@ -75,6 +80,178 @@ def convert_rdf_checksum_algorithm(rdf_checksum_algorithm: str) -> ChecksumAlgor
     return checksum_algorithm
 
 
+RDF_NAMESPACE = str(RDF)
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+class SubjectIndex(object):
+    """
+    Small triple store indexed by subject, holding the triples of the elements
+    that RdfXmlStream has read but the parser has not built yet. It supports
+    the lookups of the parser: triples with a bound subject, predicate_objects
+    and membership tests. Like a Graph, it stores every triple once.
+    """
+
+    def __init__(self):
+        self.subjects = {}
+
+    def add(self, triple):
+        subject, predicate, obj = triple
+        predicates = self.subjects.get(subject)
+        if predicates is None:
+            predicates = self.subjects[subject] = {}
+        objects = predicates.get(predicate)
+        if objects is None:
+            objects = predicates[predicate] = {}
+        objects[obj] = None
+
+    def remove_subjects(self, subjects):
+        for subject in subjects:
+            self.subjects.pop(subject, None)
+
+    def triples(self, pattern):
+        subject, predicate, obj = pattern
+        predicates = self.subjects.get(subject, {})
+        if predicate is None:
+            items = predicates.items()
+        else:
+            items = [(predicate, predicates.get(predicate, {}))]
+        for item_predicate, objects in items:
+            if obj is None:
+                for item_object in objects:
+                    yield subject, item_predicate, item_object
+            elif obj in objects:
+                yield subject, item_predicate, obj
+
+    def predicate_objects(self, subject):
+        for predicate, objects in self.subjects.get(subject, {}).items():
+            for obj in objects:
+                yield predicate, obj
+
+    def objects(self, subject, predicate):
+        return self.subjects.get(subject, {}).get(predicate, {})
+
+    def __contains__(self, triple):
+        for _ in self.triples(triple):
+            return True
+        return False
+
+
+class RdfXmlStream(object):
+    """
+    Incremental reader for RDF/XML in a file object. It yields
+    ("start", node), ("triple", triple) and ("end", node) events while the
+    file is read, and keeps only the XML elements that are still open.
+    The triple linking a node element to its parent is yielded before the
+    node's "start" event.
+    Supported is the RDF/XML written by SPDX tools: node elements with
+    rdf:about, rdf:ID or rdf:nodeID, property elements with rdf:resource,
+    rdf:nodeID, rdf:datatype, rdf:parseType="Resource", a nested node element
+    or text, property attributes, xml:base and xml:lang. Reification,
+    containers, collections and XML literals are not.
+    """
+
+    RDF_ROOT = "{%s}RDF" % RDF_NAMESPACE
+    DESCRIPTION = "{%s}Description" % RDF_NAMESPACE
+    ABOUT = "{%s}about" % RDF_NAMESPACE
+    ID = "{%s}ID" % RDF_NAMESPACE
+    NODE_ID = "{%s}nodeID" % RDF_NAMESPACE
+    RESOURCE = "{%s}resource" % RDF_NAMESPACE
+    DATATYPE = "{%s}datatype" % RDF_NAMESPACE
+    PARSE_TYPE = "{%s}parseType" % RDF_NAMESPACE
+    TYPE = "{%s}type" % RDF_NAMESPACE
+    BASE = "{%s}base" % XML_NAMESPACE
+    LANG = "{%s}lang" % XML_NAMESPACE
+    SYNTAX_ATTRIBUTES = frozenset([ABOUT, ID, NODE_ID, RESOURCE, DATATYPE, PARSE_TYPE, BASE, LANG])
+
+    def __init__(self, file, base=""):
+        self.file = file
+        self.base = base
+
+    @staticmethod
+    def uri(tag):
+        return URIRef(tag[1:].replace("}", "", 1) if tag.startswith("{") else tag)
+
+    def property_attributes(self, element, subject):
+        for name, value in element.attrib.items():
+            if name not in self.SYNTAX_ATTRIBUTES:
+                if name == self.TYPE:
+                    yield "triple", (subject, RDF.type, URIRef(value))
+                else:
+                    yield "triple", (subject, self.uri(name), Literal(value))
+
+    def node_subject(self, element, base):
+        about = element.get(self.ABOUT)
+        if about is not None:
+            return URIRef(urljoin(base, about))
+        node_id = element.get(self.NODE_ID)
+        if node_id is not None:
+            return BNode(node_id)
+        rdf_id = element.get(self.ID)
+        if rdf_id is not None:
+            return URIRef(urljoin(base, "#" + rdf_id))
+        return BNode()
+
+    def events(self):
+        # one frame per open element:
+        # [element, base, lang, subject, predicate, object or None, is node element]
+        stack = []
+        for event, element in ElementTree.iterparse(self.file, events=("start", "end")):
+            if event == "start":
+                parent = stack[-1] if stack else None
+                base = urljoin(parent[1], element.get(self.BASE)) if parent else element.get(self.BASE, self.base)
+                lang = element.get(self.LANG, parent[2] if parent else None)
+                if parent is None and element.tag == self.RDF_ROOT:
+                    stack.append([element, base, lang, None, None, None, False])
+                elif parent is None or not parent[6]:
+                    # a node element
+                    subject = self.node_subject(element, base)
+                    if parent is not None and parent[4] is not None:
+                        parent[5] = subject
+                        yield "triple", (parent[3], parent[4], subject)
+                    yield "start", subject
+                    if element.tag != self.DESCRIPTION:
+                        yield "triple", (subject, RDF.type, self.uri(element.tag))
+                    for property_event in self.property_attributes(element, subject):
+                        yield property_event
+                    stack.append([element, base, lang, subject, None, None, True])
+                else:
+                    # a property element of the node element parent
+                    subject = parent[3]
+                    predicate = self.uri(element.tag)
+                    if element.get(self.PARSE_TYPE) == "Resource":
+                        obj = BNode()
+                        yield "triple", (subject, predicate, obj)
+                        yield "start", obj
+                        stack.append([element, base, lang, obj, None, obj, True])
+                        continue
+                    obj = None
+                    if element.get(self.RESOURCE) is not None:
+                        obj = URIRef(urljoin(base, element.get(self.RESOURCE)))
+                    elif element.get(self.NODE_ID) is not None:
+                        obj = BNode(element.get(self.NODE_ID))
+                    elif any(name not in self.SYNTAX_ATTRIBUTES for name in element.attrib):
+                        obj = BNode()
+                    if obj is not None:
+                        yield "triple", (subject, predicate, obj)
+                        for property_event in self.property_attributes(element, obj):
+                            yield property_event
+                    stack.append([element, base, lang, subject, predicate, obj, False])
+            else:
+                frame = stack.pop()
+                if frame[6]:
+                    yield "end", frame[3]
+                elif frame[4] is not None and frame[5] is None:
+                    datatype = element.get(self.DATATYPE)
+                    literal = Literal(element.text or "", lang=None if datatype else frame[2],
+                                      datatype=URIRef(datatype) if datatype else None)
+                    yield "triple", (frame[3], frame[4], literal)
+                # only the open elements are kept in memory
+                element.clear()
+                if stack:
+                    stack[-1][0].remove(element)
+
+
 class BaseParser(object):
     """
     Base class for all parsers.
@@ -123,6 +300,41 @@ class BaseParser(object):
         else:
             return str(value)
 
+    def predicate_objects(self, term):
+        """
+        Return a dict mapping each predicate of `term` to the list of its
+        objects, reading all triples of `term` from the graph at once.
+        """
+        objects = {}
+        for predicate, obj in self.graph.predicate_objects(term):
+            if predicate in objects:
+                objects[predicate].append(obj)
+            else:
+                objects[predicate] = [obj]
+        return objects
+
+    def parse_checksums(self, checksum_terms):
+        """
+        Yield a Checksum for each of the checksum resources `checksum_terms`.
+        """
+        for checksum_term in checksum_terms:
+            objects = self.predicate_objects(checksum_term)
+            for value in objects.get(self.spdx_namespace["checksumValue"], ()):
+                for algo in objects.get(self.spdx_namespace["algorithm"], ()):
+                    algorithm_identifier = convert_rdf_checksum_algorithm(str(algo))
+                    yield Checksum(algorithm_identifier, str(value))
+
+    @staticmethod
+    def dispatch_fields(term, objects, field_handlers):
+        """
+        Call the handler of every predicate of `term` with its objects, in the
+        order of `field_handlers`, a list of (predicate, handler) pairs.
+        """
+        for predicate, handler in field_handlers:
+            predicate_objects = objects.get(predicate)
+            if predicate_objects:
+                handler(term, predicate_objects)
+
 
 class LicenseParser(BaseParser):
     """
@@ -154,7 +366,7 @@ class LicenseParser(BaseParser):
             if special == lics:
                 if self.LICS_REF_REGEX.match(lics):
                     # Is a license ref i.e LicenseRef-1
-                    return license.License.from_identifier(str(lics))
+                    return self.license_from_identifier(str(lics))
                 else:
                     # Not a known license form
                     raise SPDXValueError("License")
@@ -163,82 +375,81 @@ class LicenseParser(BaseParser):
                 return special
         else:
             # license url
-            return license.License.from_identifier(lics[ident_start:])
+            return self.license_from_identifier(str(lics[ident_start:]))
 
-    def get_extr_license_ident(self, extr_lic):
+    @staticmethod
+    def license_from_identifier(identifier):
         """
-        Return a license identifier from an ExtractedLicense or None.
+        Return a License for a single identifier, shared through the
+        license expression cache so that repeated licenses are parsed once.
         """
-        identifier_triples = list(
-            self.graph.triples((extr_lic, self.spdx_namespace["licenseId"], None))
-        )
+        return utils.parse_license_expression(
+            identifier
+        ) or license.License.from_identifier(identifier)
+
+    def get_extr_license_ident(self, objects):
+        """
+        Return a license identifier from the objects of an ExtractedLicense or None.
+        """
+        identifiers = objects.get(self.spdx_namespace["licenseId"], [])
 
-        if not identifier_triples:
+        if not identifiers:
             self.error = True
             msg = "Extracted license must have licenseId property."
             self.logger.log(msg)
             return
 
-        if len(identifier_triples) > 1:
+        if len(identifiers) > 1:
             self.more_than_one_error("extracted license identifier_triples")
             return
 
-        identifier_triple = identifier_triples[0]
-        _s, _p, identifier = identifier_triple
-        return str(identifier)
+        return str(identifiers[0])
 
-    def get_extr_license_text(self, extr_lic):
+    def get_extr_license_text(self, objects):
         """
-        Return extracted text from an ExtractedLicense or None.
+        Return extracted text from the objects of an ExtractedLicense or None.
         """
-        text_triples = list(
-            self.graph.triples((extr_lic, self.spdx_namespace["extractedText"], None))
-        )
-        if not text_triples:
+        texts = objects.get(self.spdx_namespace["extractedText"], [])
+        if not texts:
             self.error = True
             msg = "Extracted license must have extractedText property"
             self.logger.log(msg)
             return
 
-        if len(text_triples) > 1:
+        if len(texts) > 1:
             self.more_than_one_error("extracted license text")
             return
 
-        text_triple = text_triples[0]
-        _s, _p, text = text_triple
-        return str(text)
+        return str(texts[0])
 
-    def get_extr_lic_name(self, extr_lic):
+    def get_extr_lic_name(self, objects):
         """
-        Return the license name from an ExtractedLicense or None
+        Return the license name from the objects of an ExtractedLicense or None
         """
-        extr_name_list = list(
-            self.graph.triples((extr_lic, self.spdx_namespace["licenseName"], None))
-        )
+        extr_name_list = objects.get(self.spdx_namespace["licenseName"], [])
         if len(extr_name_list) > 1:
             self.more_than_one_error("extracted license name")
             return
         elif len(extr_name_list) == 0:
             return
-        return str(self.to_special_value(extr_name_list[0][2]))
+        return str(self.to_special_value(extr_name_list[0]))
 
-    def get_extr_lics_xref(self, extr_lic):
+    def get_extr_lics_xref(self, objects):
         """
         Return a list of cross references.
         """
-        xrefs = list(self.graph.triples((extr_lic, RDFS.seeAlso, None)))
-        return list(map(lambda xref_triple: xref_triple[2], xrefs))
+        return list(objects.get(RDFS.seeAlso, []))
 
-    def get_extr_lics_comment(self, extr_lics):
+    def get_extr_lics_comment(self, objects):
         """
         Return license comment or None.
         """
-        comment_list = list(self.graph.triples((extr_lics, RDFS.comment, None)))
+        comment_list = objects.get(RDFS.comment, [])
         if len(comment_list) > 1:
             self.more_than_one_error("extracted license comment")
             return
         elif len(comment_list) == 1:
-            return str(comment_list[0][2])
+            return str(comment_list[0])
         else:
             return
 
@@ -249,11 +460,12 @@ class LicenseParser(BaseParser):
         Return None if failed.
         """
         # Grab all possible values
-        ident = self.get_extr_license_ident(extr_lic)
-        text = self.get_extr_license_text(extr_lic)
-        comment = self.get_extr_lics_comment(extr_lic)
-        xrefs = self.get_extr_lics_xref(extr_lic)
-        name = self.get_extr_lic_name(extr_lic)
+        objects = self.predicate_objects(extr_lic)
+        ident = self.get_extr_license_ident(objects)
+        text = self.get_extr_license_text(objects)
+        comment = self.get_extr_lics_comment(objects)
+        xrefs = self.get_extr_lics_xref(objects)
+        name = self.get_extr_lic_name(objects)
 
         if not ident:
             # Must have identifier
@@ -323,22 +535,43 @@ class PackageParser(LicenseParser):
 
     def __init__(self, builder, logger):
         super(PackageParser, self).__init__(builder, logger)
+        # package field handlers, in the order the fields are set
+        self.package_field_handlers = [
+            (self.spdx_namespace["versionInfo"], self.p_pkg_vinfo),
+            (self.spdx_namespace["packageFileName"], self.p_pkg_fname),
+            (self.spdx_namespace["supplier"], self.p_pkg_suppl),
+            (self.spdx_namespace["originator"], self.p_pkg_originator),
+            (self.spdx_namespace["downloadLocation"], self.p_pkg_down_loc),
+            (self.spdx_namespace["filesAnalyzed"], self.p_pkg_files_analyzed),
+            (self.doap_namespace["homepage"], self.p_pkg_homepg),
+            (self.spdx_namespace["checksum"], self.p_pkg_checksum),
+            (self.spdx_namespace["sourceInfo"], self.p_pkg_src_info),
+            (self.spdx_namespace["packageVerificationCode"], self.p_pkg_verif_code),
+            (self.spdx_namespace["attributionText"], self.p_pkg_attribution_text),
+            (self.spdx_namespace["licenseConcluded"], self.p_pkg_lic_conc),
+            (self.spdx_namespace["licenseDeclared"], self.p_pkg_lic_decl),
+            (self.spdx_namespace["licenseInfoFromFiles"], self.p_pkg_lics_info_from_files),
+            (self.spdx_namespace["licenseComments"], self.p_pkg_comments_on_lics),
+            (self.spdx_namespace["copyrightText"], self.p_pkg_cr_text),
+            (self.spdx_namespace["summary"], self.p_pkg_summary),
+            (self.spdx_namespace["description"], self.p_pkg_descr),
+            (self.spdx_namespace["comment"], self.p_pkg_comment),
+        ]
 
     def parse_package(self, p_term):
         """
         Parse package fields.
         """
+        objects = self.predicate_objects(p_term)
         # Check there is a package name
-        if not (p_term, self.spdx_namespace["name"], None) in self.graph:
+        if self.spdx_namespace["name"] not in objects:
             self.error = True
             self.logger.log("Package must have a name.")
             # Create dummy package so that we may continue parsing the rest of
             # the package fields.
             self.builder.create_package(self.doc, "dummy_package")
         else:
-            for _s, _p, o in self.graph.triples(
-                (p_term, self.spdx_namespace["name"], None)
-            ):
+            for o in objects[self.spdx_namespace["name"]]:
                 try:
                     self.builder.create_package(self.doc, str(o))
                 except CardinalityError:
@@ -354,77 +587,57 @@ class PackageParser(LicenseParser):
         except SPDXValueError:
             self.value_error("PKG_SPDX_ID_VALUE", p_term)
 
-        self.p_pkg_vinfo(p_term, self.spdx_namespace["versionInfo"])
-        self.p_pkg_fname(p_term, self.spdx_namespace["packageFileName"])
-        self.p_pkg_suppl(p_term, self.spdx_namespace["supplier"])
-        self.p_pkg_originator(p_term, self.spdx_namespace["originator"])
-        self.p_pkg_down_loc(p_term, self.spdx_namespace["downloadLocation"])
-        self.p_pkg_files_analyzed(p_term, self.spdx_namespace["filesAnalyzed"])
-        self.p_pkg_homepg(p_term, self.doap_namespace["homepage"])
-        self.p_pkg_checksum(p_term, self.spdx_namespace["checksum"])
-        self.p_pkg_src_info(p_term, self.spdx_namespace["sourceInfo"])
-        self.p_pkg_verif_code(p_term, self.spdx_namespace["packageVerificationCode"])
-        self.p_pkg_attribution_text(p_term, self.spdx_namespace["attributionText"])
-        self.p_pkg_lic_conc(p_term, self.spdx_namespace["licenseConcluded"])
-        self.p_pkg_lic_decl(p_term, self.spdx_namespace["licenseDeclared"])
-        self.p_pkg_lics_info_from_files(
-            p_term, self.spdx_namespace["licenseInfoFromFiles"]
-        )
-        self.p_pkg_comments_on_lics(p_term, self.spdx_namespace["licenseComments"])
-        self.p_pkg_cr_text(p_term, self.spdx_namespace["copyrightText"])
-        self.p_pkg_summary(p_term, self.spdx_namespace["summary"])
-        self.p_pkg_descr(p_term, self.spdx_namespace["description"])
-        self.p_pkg_comment(p_term, self.spdx_namespace["comment"])
+        self.dispatch_fields(p_term, objects, self.package_field_handlers)
 
-    def p_pkg_cr_text(self, p_term, predicate):
+    def p_pkg_cr_text(self, p_term, objects):
         try:
-            for _, _, text in self.graph.triples((p_term, predicate, None)):
+            for text in objects:
                 self.builder.set_pkg_cr_text(
                     self.doc, str(self.to_special_value(text))
                 )
         except CardinalityError:
             self.more_than_one_error("package copyright text")
 
-    def p_pkg_summary(self, p_term, predicate):
+    def p_pkg_summary(self, p_term, objects):
         try:
-            for _, _, summary in self.graph.triples((p_term, predicate, None)):
+            for summary in objects:
                 self.builder.set_pkg_summary(self.doc, str(summary))
         except CardinalityError:
             self.more_than_one_error("package summary")
 
-    def p_pkg_descr(self, p_term, predicate):
+    def p_pkg_descr(self, p_term, objects):
         try:
-            for _, _, desc in self.graph.triples((p_term, predicate, None)):
+            for desc in objects:
                 self.builder.set_pkg_desc(self.doc, str(desc))
         except CardinalityError:
             self.more_than_one_error("package description")
 
-    def p_pkg_comment(self, p_term, predicate):
+    def p_pkg_comment(self, p_term, objects):
         try:
-            for _, _, comment in self.graph.triples((p_term, predicate, None)):
+            for comment in objects:
                 self.builder.set_pkg_comment(self.doc, str(comment))
         except CardinalityError:
             self.more_than_one_error("package comment")
 
-    def p_pkg_attribution_text(self, p_term, predicate):
+    def p_pkg_attribution_text(self, p_term, objects):
         try:
-            for _, _, attribute_text in self.graph.triples((p_term, predicate, None)):
+            for attribute_text in objects:
                 self.builder.set_pkg_attribution_text(
                     self.doc, str(attribute_text)
                 )
         except CardinalityError:
             self.more_than_one_error("package attribution text")
 
-    def p_pkg_comments_on_lics(self, p_term, predicate):
-        for _, _, comment in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_comments_on_lics(self, p_term, objects):
+        for comment in objects:
             try:
                 self.builder.set_pkg_license_comment(self.doc, str(comment))
             except CardinalityError:
                 self.more_than_one_error("package comments on license")
                 break
 
-    def p_pkg_lics_info_from_files(self, p_term, predicate):
-        for _, _, lics in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_lics_info_from_files(self, p_term, objects):
+        for lics in objects:
             try:
                 if (
                     lics,
@@ -442,15 +655,15 @@ class PackageParser(LicenseParser):
             except SPDXValueError:
                 self.value_error("PKG_LICS_INFO_FILES", lics)
 
-    def p_pkg_lic_decl(self, p_term, predicate):
-        self.handle_pkg_lic(p_term, predicate, self.builder.set_pkg_license_declared)
+    def p_pkg_lic_decl(self, p_term, objects):
+        self.handle_pkg_lic(objects, self.spdx_namespace["licenseDeclared"], self.builder.set_pkg_license_declared)
 
-    def handle_pkg_lic(self, p_term, predicate, builder_func):
+    def handle_pkg_lic(self, objects, predicate, builder_func):
         """
         Handle package lics concluded or declared.
         """
         try:
-            for _, _, licenses in self.graph.triples((p_term, predicate, None)):
+            for licenses in objects:
                 if (
                     licenses,
                     RDF.type,
@@ -476,11 +689,12 @@ class PackageParser(LicenseParser):
         except CardinalityError:
             self.more_than_one_error("package {0}".format(predicate))
 
-    def p_pkg_lic_conc(self, p_term, predicate):
-        self.handle_pkg_lic(p_term, predicate, self.builder.set_pkg_licenses_concluded)
+    def p_pkg_lic_conc(self, p_term, objects):
+        self.handle_pkg_lic(objects, self.spdx_namespace["licenseConcluded"],
+                            self.builder.set_pkg_licenses_concluded)
 
-    def p_pkg_verif_code(self, p_term, predicate):
-        for _, _, verifcode in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_verif_code(self, p_term, objects):
+        for verifcode in objects:
             # Parse verification code
             for _, _, code in self.graph.triples(
                 (verifcode, self.spdx_namespace["packageVerificationCodeValue"], None)
@@ -504,28 +718,20 @@ class PackageParser(LicenseParser):
                     self.more_than_one_error("package verification code excluded file")
                     break
 
-    def p_pkg_src_info(self, p_term, predicate):
-        for _, _, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_src_info(self, p_term, objects):
+        for o in objects:
             try:
                 self.builder.set_pkg_source_info(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("package source info")
                 break
 
-    def p_pkg_checksum(self, p_term, predicate):
-        for _s, _p, pkg_checksum in self.graph.triples((p_term, predicate, None)):
-            for _, _, value in self.graph.triples(
-                (pkg_checksum, self.spdx_namespace["checksumValue"], None)
-            ):
-                for _, _, algo in self.graph.triples(
-                        (pkg_checksum, self.spdx_namespace["algorithm"], None)
-                ):
-                    algorithm_identifier = convert_rdf_checksum_algorithm(str(algo))
-                    checksum = Checksum(algorithm_identifier, str(value))
-                    self.builder.set_pkg_checksum(self.doc, checksum)
+    def p_pkg_checksum(self, p_term, objects):
+        for checksum in self.parse_checksums(objects):
+            self.builder.set_pkg_checksum(self.doc, checksum)
 
-    def p_pkg_homepg(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_homepg(self, p_term, objects):
+        for o in objects:
             try:
                 self.builder.set_pkg_home(
                     self.doc, str(self.to_special_value(o))
@@ -536,8 +742,8 @@ class PackageParser(LicenseParser):
             except SPDXValueError:
                 self.value_error("PKG_HOME_PAGE", o)
 
-    def p_pkg_down_loc(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_down_loc(self, p_term, objects):
+        for o in objects:
             try:
                 self.builder.set_pkg_down_location(
                     self.doc, str(self.to_special_value(o))
@@ -548,8 +754,8 @@ class PackageParser(LicenseParser):
             except SPDXValueError:
                 self.value_error("PKG_DOWN_LOC", o)
 
-    def p_pkg_files_analyzed(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_files_analyzed(self, p_term, objects):
+        for o in objects:
             try:
                 self.builder.set_pkg_files_analyzed(self.doc, str(o))
             except CardinalityError:
@@ -558,8 +764,8 @@ class PackageParser(LicenseParser):
             except SPDXValueError:
                 self.value_error("PKG_FILES_ANALYZED_VALUE", o)
 
-    def p_pkg_originator(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_originator(self, p_term, objects):
+        for o in objects:
             try:
                 if o == "NOASSERTION":
                     self.builder.set_pkg_originator(self.doc, utils.NoAssert())
@@ -572,8 +778,8 @@ class PackageParser(LicenseParser):
             except SPDXValueError:
                 self.value_error("PKG_ORIGINATOR_VALUE", o)
 
-    def p_pkg_suppl(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_suppl(self, p_term, objects):
+        for o in objects:
             try:
                 if o == "NOASSERTION":
                     self.builder.set_pkg_supplier(self.doc, utils.NoAssert())
@@ -586,16 +792,16 @@ class PackageParser(LicenseParser):
             except SPDXValueError:
                 self.value_error("PKG_SUPPL_VALUE", o)
 
-    def p_pkg_fname(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_fname(self, p_term, objects):
+        for o in objects:
             try:
                 self.builder.set_pkg_file_name(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("Package file name")
                 break
 
-    def p_pkg_vinfo(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+    def p_pkg_vinfo(self, p_term, objects):
+        for o in objects:
             try:
                 self.builder.set_pkg_vers(self.doc, str(o))
             except CardinalityError:
@@ -610,32 +816,35 @@ class FileParser(LicenseParser):
 
     def __init__(self, builder, logger):
         super(FileParser, self).__init__(builder, logger)
+        # file field handlers, in the order the fields are set
+        self.file_field_handlers = [
+            (self.spdx_namespace["fileType"], self.p_file_type),
+            (self.spdx_namespace["checksum"], self.p_file_checksum),
+            (self.spdx_namespace["licenseConcluded"], self.p_file_lic_conc),
+            (self.spdx_namespace["licenseInfoInFile"], self.p_file_lic_info),
+            (self.spdx_namespace["licenseComments"], self.p_file_comments_on_lics),
+            (self.spdx_namespace["attributionText"], self.p_file_attribution_text),
+            (self.spdx_namespace["copyrightText"], self.p_file_cr_text),
+            (self.spdx_namespace["artifactOf"], self.p_file_artifact),
+            (RDFS.comment, self.p_file_comment),
+            (self.spdx_namespace["noticeText"], self.p_file_notice),
+            (self.spdx_namespace["fileContributor"], self.p_file_contributor),
+            (self.spdx_namespace["fileDependency"], self.p_file_depends),
+        ]
 
     def parse_file(self, f_term):
-        if not (f_term, self.spdx_namespace["fileName"], None) in self.graph:
+        objects = self.predicate_objects(f_term)
+        if self.spdx_namespace["fileName"] not in objects:
             self.error = True
             self.logger.log("File must have a name.")
             # Dummy name to continue
             self.builder.set_file_name(self.doc, "Dummy file")
         else:
-            for _, _, name in self.graph.triples(
-                (f_term, self.spdx_namespace["fileName"], None)
-            ):
+            for name in objects[self.spdx_namespace["fileName"]]:
                 self.builder.set_file_name(self.doc, str(name))
 
         self.p_file_spdx_id(f_term, self.spdx_namespace["File"])
-        self.p_file_type(f_term, self.spdx_namespace["fileType"])
-        self.p_file_checksum(f_term, self.spdx_namespace["checksum"])
-        self.p_file_lic_conc(f_term, self.spdx_namespace["licenseConcluded"])
-        self.p_file_lic_info(f_term, self.spdx_namespace["licenseInfoInFile"])
-        self.p_file_comments_on_lics(f_term, self.spdx_namespace["licenseComments"])
-        self.p_file_attribution_text(f_term, self.spdx_namespace["attributionText"])
-        self.p_file_cr_text(f_term, self.spdx_namespace["copyrightText"])
-        self.p_file_artifact(f_term, self.spdx_namespace["artifactOf"])
-        self.p_file_comment(f_term, RDFS.comment)
-        self.p_file_notice(f_term, self.spdx_namespace["noticeText"])
-        self.p_file_contributor(f_term, self.spdx_namespace["fileContributor"])
-        self.p_file_depends(f_term, self.spdx_namespace["fileDependency"])
+        self.dispatch_fields(f_term, objects, self.file_field_handlers)
 
     def get_file_name(self, f_term):
         """Returns first found fileName property or None if not found."""
@@ -645,11 +854,11 @@ class FileParser(LicenseParser):
             return name
         return
 
-    def p_file_depends(self, f_term, predicate):
+    def p_file_depends(self, f_term, objects):
         """
         Set file dependencies.
         """
-        for _, _, other_file in self.graph.triples((f_term, predicate, None)):
+        for other_file in objects:
             name = self.get_file_name(other_file)
             if name is not None:
                 self.builder.add_file_dep(str(name))
@@ -658,51 +867,51 @@ class FileParser(LicenseParser):
                 msg = "File depends on file with no name"
                 self.logger.log(msg)
 
-    def p_file_contributor(self, f_term, predicate):
+    def p_file_contributor(self, f_term, objects):
         """
         Parse all file contributors and adds them to the model.
         """
-        for _, _, contributor in self.graph.triples((f_term, predicate, None)):
+        for contributor in objects:
             self.builder.add_file_contribution(self.doc, str(contributor))
 
-    def p_file_notice(self, f_term, predicate):
+    def p_file_notice(self, f_term, objects):
         """
         Set file notice text.
         """
         try:
-            for _, _, notice in self.graph.triples((f_term, predicate, None)):
+            for notice in objects:
                 self.builder.set_file_notice(self.doc, str(notice))
         except CardinalityError:
             self.more_than_one_error("file notice")
 
-    def p_file_comment(self, f_term, predicate):
+    def p_file_comment(self, f_term, objects):
         """
         Set file comment text.
         """
         try:
-            for _, _, comment in self.graph.triples((f_term, predicate, None)):
+            for comment in objects:
                 self.builder.set_file_comment(self.doc, str(comment))
         except CardinalityError:
             self.more_than_one_error("file comment")
 
-    def p_file_attribution_text(self, f_term, predicate):
+    def p_file_attribution_text(self, f_term, objects):
         """
         Set file attribution text
         """
         try:
-            for _, _, attribute_text in self.graph.triples((f_term, predicate, None)):
+            for attribute_text in objects:
                 self.builder.set_file_attribution_text(
                     self.doc, str(attribute_text)
                 )
         except CardinalityError:
             self.more_than_one_error("file attribution text")
 
-    def p_file_artifact(self, f_term, predicate):
+    def p_file_artifact(self, f_term, objects):
         """
         Handle file artifactOf.
         Note: does not handle artifact of project URI.
         """
-        for _, _, project in self.graph.triples((f_term, predicate, None)):
+        for project in objects:
             if (project, RDF.type, self.doap_namespace["Project"]):
                 self.p_file_project(project)
             else:
@@ -728,31 +937,31 @@ class FileParser(LicenseParser):
                 self.doc, "home", str(homepage)
             )
 
-    def p_file_cr_text(self, f_term, predicate):
+    def p_file_cr_text(self, f_term, objects):
         """
         Set file copyright text.
         """
         try:
-            for _, _, cr_text in self.graph.triples((f_term, predicate, None)):
+            for cr_text in objects:
                 self.builder.set_file_copyright(self.doc, str(cr_text))
         except CardinalityError:
             self.more_than_one_error("file copyright text")
 
-    def p_file_comments_on_lics(self, f_term, predicate):
+    def p_file_comments_on_lics(self, f_term, objects):
         """
         Set file license comment.
         """
         try:
-            for _, _, comment in self.graph.triples((f_term, predicate, None)):
+            for comment in objects:
                 self.builder.set_file_license_comment(self.doc, str(comment))
         except CardinalityError:
             self.more_than_one_error("file comments on license")
 
-    def p_file_lic_info(self, f_term, predicate):
+    def p_file_lic_info(self, f_term, objects):
         """
         Set file license information.
         """
-        for _, _, info in self.graph.triples((f_term, predicate, None)):
+        for info in objects:
             lic = self.handle_lics(info)
             if lic is not None:
                 self.builder.set_file_license_in_file(self.doc, lic)
@@ -766,12 +975,12 @@ class FileParser(LicenseParser):
         except CardinalityError:
             self.more_than_one_error("FILE_SPDX_ID_VALUE")
 
-    def p_file_type(self, f_term, predicate):
+    def p_file_type(self, f_term, objects):
         """
         Set file type.
         """
         try:
-            for _, _, ftype in self.graph.triples((f_term, predicate, None)):
+            for ftype in objects:
                 try:
                     self.builder.set_file_type(self.doc, ftype)
                 except SPDXValueError:
@@ -779,27 +988,19 @@ class FileParser(LicenseParser):
         except CardinalityError:
             self.more_than_one_error("file type")
 
-    def p_file_checksum(self, f_term, predicate):
+    def p_file_checksum(self, f_term, objects):
         """
         Set file checksum.
         """
-        for _s, _p, file_checksum in self.graph.triples((f_term, predicate, None)):
-            for _, _, value in self.graph.triples(
-                (file_checksum, self.spdx_namespace["checksumValue"], None)
-            ):
-                for _, _, algo in self.graph.triples(
-                        (file_checksum, self.spdx_namespace["algorithm"], None)
-                ):
-                    algorithm_identifier = convert_rdf_checksum_algorithm(str(algo))
-                    checksum = Checksum(algorithm_identifier, str(value))
-                    self.builder.set_file_checksum(self.doc, checksum)
+        for checksum in self.parse_checksums(objects):
+            self.builder.set_file_checksum(self.doc, checksum)
 
-    def p_file_lic_conc(self, f_term, predicate):
+    def p_file_lic_conc(self, f_term, objects):
         """
         Set file licenses concluded.
         """
         try:
-            for _, _, licenses in self.graph.triples((f_term, predicate, None)):
+            for licenses in objects:
                 if (
                     licenses,
                     RDF.type,
@@ -823,7 +1024,7 @@ class FileParser(LicenseParser):
                     except SPDXValueError:
                         self.value_error("FILE_SINGLE_LICS", licenses)
         except CardinalityError:
-            self.more_than_one_error("file {0}".format(predicate))
+            self.more_than_one_error("file {0}".format(self.spdx_namespace["licenseConcluded"]))
 
 
 class SnippetParser(LicenseParser):
@@ -840,34 +1041,30 @@ class SnippetParser(LicenseParser):
         except SPDXValueError:
             self.value_error("SNIPPET_SPDX_ID_VALUE", snippet_term)
 
-        for _s, _p, o in self.graph.triples(
-            (snippet_term, self.spdx_namespace["name"], None)
-        ):
+        objects = self.predicate_objects(snippet_term)
+
+        for o in objects.get(self.spdx_namespace["name"], ()):
             try:
                 self.builder.set_snippet_name(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("snippetName")
                 break
 
-        for _s, _p, o in self.graph.triples(
-            (snippet_term, self.spdx_namespace["licenseComments"], None)
-        ):
+        for o in objects.get(self.spdx_namespace["licenseComments"], ()):
             try:
                 self.builder.set_snippet_lic_comment(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("licenseComments")
                 break
 
-        for _s, _p, o in self.graph.triples((snippet_term, RDFS.comment, None)):
+        for o in objects.get(RDFS.comment, ()):
             try:
                 self.builder.set_snippet_comment(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("comment")
                 break
 
-        for _s, _p, o in self.graph.triples(
-            (snippet_term, self.spdx_namespace["copyrightText"], None)
-        ):
+        for o in objects.get(self.spdx_namespace["copyrightText"], ()):
             try:
                 self.builder.set_snippet_copyright(
                     self.doc, self.to_special_value(str(o))
@@ -877,9 +1074,7 @@ class SnippetParser(LicenseParser):
                 break
 
         try:
-            for _, _, licenses in self.graph.triples(
-                (snippet_term, self.spdx_namespace["licenseConcluded"], None)
-            ):
+            for licenses in objects.get(self.spdx_namespace["licenseConcluded"], ()):
                 if (
                     licenses,
                     RDF.type,
@@ -907,9 +1102,7 @@ class SnippetParser(LicenseParser):
                 "package {0}".format(self.spdx_namespace["licenseConcluded"])
             )
 
-        for _, _, info in self.graph.triples(
-            (snippet_term, self.spdx_namespace["licenseInfoInSnippet"], None)
-        ):
+        for info in objects.get(self.spdx_namespace["licenseInfoInSnippet"], ()):
             lic = self.handle_lics(info)
             if lic is not None:
                 try:
@@ -917,9 +1110,7 @@ class SnippetParser(LicenseParser):
                 except SPDXValueError:
                     self.value_error("SNIPPET_LIC_INFO", lic)
 
-        for _s, _p, o in self.graph.triples(
-            (snippet_term, self.spdx_namespace["snippetFromFile"], None)
-        ):
+        for o in objects.get(self.spdx_namespace["snippetFromFile"], ()):
             try:
                 self.builder.set_snip_from_file_spdxid(self.doc, str(o))
             except CardinalityError:
@@ -927,9 +1118,7 @@ class SnippetParser(LicenseParser):
                 break
 
         try:
-            for _, _, attribute_text in self.graph.triples(
-                (snippet_term, self.spdx_namespace["attributionText"], None)
-            ):
+            for attribute_text in objects.get(self.spdx_namespace["attributionText"], ()):
                 self.builder.set_snippet_attribution_text(
                     self.doc, str(attribute_text)
                 )
@@ -1275,19 +1464,47 @@ class Parser(
     RDF/XML file parser.
     """
 
+    # keep the files of the parsed document in a file_table.FileTable
+    file_table = False
+
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
 
-    def parse(self, fil):
+    def parse(self, fil, incremental=False):
         """
         Parse a file and returns a document object.
-        fil is a file like object.
+        fil is a file like object. If incremental is set, the SPDX elements are
+        built while the file is read, instead of loading the whole file into an
+        rdflib Graph first.
         """
         self.error = False
-        self.graph = Graph()
-        self.graph.parse(file=fil, format="xml")
-        self.doc = document.Document()
+        self.doc = document.Document(file_table=self.file_table)
+        try:
+            if incremental:
+                self.parse_incremental(fil)
+            else:
+                self.graph = Graph()
+                self.graph.parse(file=fil, format="xml")
+                self.parse_graph()
+
+            validation_messages = ErrorMessages(getattr(self.logger, "max_errors", None))
+            # Report extra errors if self.error is False otherwise there will be
+            # redundant messages
+            validation_messages = self.doc.validate(validation_messages)
+            if not self.error:
+                if validation_messages:
+                    for msg in validation_messages:
+                        self.logger.log(msg)
+                    self.error = True
+        except ErrorLimitReached:
+            # the logger stops parsing at its maximum number of errors
+            self.error = True
+        return self.doc, self.error
 
+    def parse_graph(self):
+        """
+        Build the document from all triples in self.graph.
+        """
         for s, _p, o in self.graph.triples(
             (None, RDF.type, self.spdx_namespace["SpdxDocument"])
         ):
@@ -1343,16 +1560,120 @@ class Parser(
         ):
             self.parse_relationship(s, o)
 
-        validation_messages = ErrorMessages()
-        # Report extra errors if self.error is False otherwise there will be
-        # redundant messages
-        validation_messages = self.doc.validate(validation_messages)
-        if not self.error:
-            if validation_messages:
-                for msg in validation_messages:
-                    self.logger.log(msg)
-                self.error = True
-        return self.doc, self.error
+    def parse_incremental(self, fil):
+        """
+        Build the document from the RDF/XML in fil while it is read. Each SPDX
+        element is built when its node element ends, and its triples are
+        dropped afterwards, so that only the open elements, the extracted
+        licenses and the elements that are waiting for a reference are kept.
+        Blank nodes must be defined before they are referenced from other
+        elements, like the SPDX tools write them.
+        """
+        self.graph = SubjectIndex()
+        # nodes that are built when they are the object of these predicates
+        link_handlers = {
+            self.spdx_namespace["referencesFile"]: lambda subject, node: self.parse_file(node),
+            self.spdx_namespace["reviewed"]: lambda subject, node: self.parse_review(node),
+            self.spdx_namespace["annotation"]: lambda subject, node: self.parse_annotation(node),
+            self.spdx_namespace["relationship"]: self.parse_relationship,
+        }
+        # nodes that are built when they end, by their type
+        type_handlers = {
+            self.spdx_namespace["SpdxDocument"]: self.parse_doc_fields,
+            self.spdx_namespace["ExternalDocumentRef"]: self.parse_ext_doc_ref,
+            self.spdx_namespace["CreationInfo"]: self.parse_creation_info,
+            self.spdx_namespace["Package"]: self.parse_package,
+            self.spdx_namespace["Snippet"]: self.parse_snippet,
+        }
+        extracted_license_type = self.spdx_namespace["ExtractedLicensingInfo"]
+        package_type = self.spdx_namespace["Package"]
+        link_target_types = {self.spdx_namespace["File"], self.spdx_namespace["Review"],
+                             self.spdx_namespace["Annotation"], self.spdx_namespace["Relationship"]}
+
+        # [node, subjects of the element, actions to run after the node is built] per open node element
+        open_nodes = []
+        # links to nodes that have not ended yet and the subjects of unlinked nodes, by node
+        pending_links = {}
+        unlinked_nodes = {}
+        # (action, subjects) that need a package to be built first, like files
+        waiting_for_package = []
+
+        def run(action, subjects):
+            action()
+            self.graph.remove_subjects(subjects)
+
+        def run_with_package(action, subjects):
+            if self.doc.packages:
+                run(action, subjects)
+            else:
+                waiting_for_package.append((action, subjects))
+
+        def run_links(node, links, subjects):
+            for subject, predicate in links:
+                action = partial(link_handlers[predicate], subject, node)
+                if predicate == self.spdx_namespace["referencesFile"]:
+                    run_with_package(action, subjects)
+                else:
+                    run(action, subjects)
+
+        def end_node(node, subjects, actions):
+            types = self.graph.objects(node, RDF.type)
+            if extracted_license_type in types:
+                # kept, extracted licenses may be referenced from anywhere
+                self.handle_extracted_license(node)
+                return
+            for node_type in types:
+                if node_type in type_handlers:
+                    type_handlers[node_type](node)
+            if package_type in types:
+                for action, action_subjects in actions + waiting_for_package:
+                    run(action, action_subjects)
+                del waiting_for_package[:]
+            elif self.spdx_namespace["ExternalRef"] in types:
+                action = partial(self.parse_pkg_ext_ref, node)
+                for open_node in reversed(open_nodes):
+                    if package_type in self.graph.objects(open_node[0], RDF.type):
+                        # built after the package it belongs to
+                        open_node[2].append((action, subjects))
+                        return
+                run_with_package(action, subjects)
+                return
+
+            links = pending_links.pop(node, None)
+            if links is not None:
+                run_links(node, links, subjects)
+            elif any(node_type in link_target_types for node_type in types):
+                unlinked_nodes[node] = subjects
+            elif any(node_type in type_handlers for node_type in types) or not open_nodes:
+                self.graph.remove_subjects(subjects)
+            else:
+                # part of the enclosing element
+                open_nodes[-1][1].extend(subjects)
+
+        base = ""
+        if isinstance(getattr(fil, "name", None), str):
+            base = pathlib.Path(fil.name).absolute().as_uri()
+        for event, value in RdfXmlStream(fil, base).events():
+            if event == "triple":
+                subject, predicate, obj = value
+                if predicate not in link_handlers:
+                    self.graph.add(value)
+                elif obj in unlinked_nodes:
+                    run_links(obj, [(subject, predicate)], unlinked_nodes.pop(obj))
+                else:
+                    pending_links.setdefault(obj, []).append((subject, predicate))
+            elif event == "start":
+                open_nodes.append([value, [value], []])
+            else:
+                node, subjects, actions = open_nodes.pop()
+                end_node(node, subjects, actions)
+
+        # like the graph parser, elements that are referenced but not defined
+        # are built from the triples there are
+        for action, subjects in waiting_for_package:
+            run(action, subjects)
+        for node, links in pending_links.items():
+            run_links(node, links, [])
 
     def parse_creation_info(self, ci_term):
         """
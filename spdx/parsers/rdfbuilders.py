@@ -629,7 +629,7 @@ class RelationshipBuilder(tagvaluebuilders.RelationshipBuilder):
         if len(doc.relationships) != 0:
             if not self.relationship_comment_set:
                 self.relationship_comment_set = True
-                doc.relationships[-1].comment = comment
+                doc.relationships[-1].relationship_comment = comment
                 return True
             else:
                 raise CardinalityError("RelationshipComment")
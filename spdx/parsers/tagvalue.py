@@ -19,10 +19,13 @@ from spdx import utils
 from spdx.parsers.builderexceptions import CardinalityError
 from spdx.parsers.builderexceptions import OrderError
 from spdx.parsers.builderexceptions import SPDXValueError
-from spdx.parsers.lexers.tagvalue import Lexer
-from spdx.parsers.loggers import ErrorMessages
+from spdx.parsers.lexers.tagvalue import Lexer, LineLexer
+from spdx.parsers.loggers import ErrorLimitReached, ErrorMessages
 from spdx import document
 
+# Module holding the precomputed LALR tables, see spdx.parsers._build_tables
+PARSETAB_MODULE = "spdx.parsers.tagvalue_parsetab"
+
 ERROR_MESSAGES = {
     "TOOL_VALUE": "Invalid tool value {0} at line: {1}",
     "ORG_VALUE": "Invalid organization value {0} at line: {1}",
@@ -139,13 +142,14 @@ ERROR_MESSAGES = {
 
 
 class Parser(object):
+    # keep the files of the parsed document in a file_table.FileTable
+    file_table = False
+
     def __init__(self, builder, logger):
         self.tokens = Lexer.tokens
         self.builder = builder
         self.logger = logger
         self.error = False
-        self.license_list_parser = utils.LicenseListParser()
-        self.license_list_parser.build(write_tables=0, debug=0)
 
     def p_start_1(self, p):
         "start : start attrib "
@@ -568,7 +572,7 @@ class Parser(object):
         if (p[1] in config.LICENSE_MAP.keys()) or (ref_re.match(p[1]) is not None):
             p[0] = license.License.from_identifier(value)
         else:
-            p[0] = self.license_list_parser.parse(value)
+            p[0] = utils.parse_license_expression(value)
 
     def p_file_name_1(self, p):
         """file_name : FILE_NAME LINE"""
@@ -1799,24 +1803,39 @@ class Parser(object):
     def p_error(self, p):
         pass
 
-    def build(self, **kwargs):
-        self.lex = Lexer()
+    def build(self, line_lexer=True, **kwargs):
+        """
+        Build the parser, with the LineLexer or with the PLY Lexer if
+        line_lexer is False.
+        """
+        self.lex = LineLexer() if line_lexer else Lexer()
         self.lex.build(reflags=re.UNICODE)
+        # Load the prebuilt tables; PLY regenerates them if the grammar changed.
+        kwargs.setdefault("tabmodule", PARSETAB_MODULE)
+        kwargs.setdefault("debug", False)
         self.yacc = yacc.yacc(module=self, **kwargs)
 
     def parse(self, text):
-        self.document = document.Document()
+        """
+        Parse a tag-value document from text, a string or a file object.
+        """
+        self.document = document.Document(file_table=self.file_table)
         self.error = False
-        self.yacc.parse(text, lexer=self.lex)
-        # FIXME: this state does not make sense
-        self.builder.reset()
-        validation_messages = ErrorMessages()
-        # Report extra errors if self.error is False otherwise there will be
-        # redundant messages
-        validation_messages = self.document.validate(validation_messages)
-        if not self.error:
-            if validation_messages:
-                for msg in validation_messages:
-                    self.logger.log(msg)
-                self.error = True
+        try:
+            self.yacc.parse(text, lexer=self.lex)
+            # FIXME: this state does not make sense
+            self.builder.reset()
+            validation_messages = ErrorMessages(getattr(self.logger, "max_errors", None))
+            # Report extra errors if self.error is False otherwise there will be
+            # redundant messages
+            validation_messages = self.document.validate(validation_messages)
+            if not self.error:
+                if validation_messages:
+                    for msg in validation_messages:
+                        self.logger.log(msg)
+                    self.error = True
+        except ErrorLimitReached:
+            # the logger stops parsing at its maximum number of errors
+            self.builder.reset()
+            self.error = True
         return self.document, self.error
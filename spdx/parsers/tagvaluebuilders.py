@@ -10,7 +10,7 @@
 # limitations under the License.
 
 import re
-from typing import Dict, List
+from typing import Dict, Optional
 
 from spdx import annotation
 from spdx import creationinfo
@@ -525,19 +525,19 @@ class RelationshipBuilder(object):
         """
         self.reset_relationship()
         relationship_to_add = Relationship(relationship_term)
-        existing_relationships: List[Relationship] = doc.relationships
+        existing_relationship: Optional[Relationship] = next(
+            (relationship for relationship in doc.get_relationships_from(relationship_to_add.spdx_element_id)
+             if relationship.relationship == relationship_term), None)
 
-        if relationship_to_add not in existing_relationships:
+        if existing_relationship is None:
             doc.add_relationship(relationship_to_add)
             return True
 
-        existing_relationship: Relationship = existing_relationships[existing_relationships.index(relationship_to_add)]
-
         # If the relationship already exists without comment, we remove the old one and re-append it at the end. This
         # allows to add a comment to the relationship (since a comment will always be added to the latest
         # relationship). If an equal relationship with comment already exists, we ignore the new relationship.
         if not existing_relationship.has_comment:
-            existing_relationships.remove(relationship_to_add)
+            doc.remove_relationship(existing_relationship)
             doc.add_relationship(relationship_to_add)
             return True
 
@@ -560,7 +560,7 @@ class RelationshipBuilder(object):
             raise SPDXValueError("RelationshipComment::Comment")
 
         self.relationship_comment_set = True
-        doc.relationships[-1].comment = str_from_text(comment)
+        doc.relationships[-1].relationship_comment = str_from_text(comment)
         return True
 
 
@@ -1111,7 +1111,7 @@ class FileBuilder(object):
         self.reset_file_stat()
 
     def set_file_name(self, doc, name):
-        doc.files.append(file.File(name))
+        doc.add_file(file.File(name))
         # A file name marks the start of a new file instance.
         # The builder must be reset
         # FIXME: this state does not make sense
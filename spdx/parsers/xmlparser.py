@@ -9,12 +9,154 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import OrderedDict
-
-import xmltodict
+from itertools import groupby
+from operator import itemgetter
+from xml.etree import ElementTree
 
 from spdx.parsers import jsonyamlxml
 
+# Fields whose values are always lists, even if the element occurs only once
+LIST_LIKE_FIELDS = {
+    "creators",
+    "externalDocumentRefs",
+    "extractedLicenseInfos",
+    "seeAlsos",
+    "annotations",
+    "relationships",
+    "snippets",
+    "reviewers",
+    "fileTypes",
+    "licenseInfoFromFiles",
+    "licenseInfoInFiles",
+    "artifactOf",
+    "fileContributors",
+    "fileDependencies",
+    "files",
+    "documentDescribes",
+    "packages",
+    "checksums",
+    "hasFiles",
+    "externalRefs",
+    "ranges",
+    "licenseInfoInSnippets",
+    "packageVerificationCodeExcludedFiles",
+}
+
+
+def local_name(tag):
+    return tag.rpartition("}")[2]
+
+
+class ElementValueBuilder(object):
+    """
+    Build the value of an element from the values of its children, the way
+    xmltodict does: the text of an element without children or attributes,
+    or a dict from child names to child values, with the values of repeated
+    children and of list-like fields in lists.
+    """
+
+    def __init__(self, element, list_like_fields=LIST_LIKE_FIELDS):
+        self.list_like_fields = list_like_fields
+        self.value = {"@" + key: value for key, value in element.attrib.items()}
+        self.repeated = set()
+        self.text = [element.text] if element.text else []
+
+    def add(self, name, value):
+        if name in self.repeated:
+            self.value[name].append(value)
+        elif name in self.value:
+            self.value[name] = [self.value[name], value]
+            self.repeated.add(name)
+        elif name in self.list_like_fields:
+            self.value[name] = [value]
+            self.repeated.add(name)
+        else:
+            self.value[name] = value
+
+    def add_element(self, element):
+        self.add(local_name(element.tag), element_value(element, self.list_like_fields))
+        if element.tail:
+            self.text.append(element.tail)
+
+    def build(self):
+        text = "".join(self.text)
+        if not self.value:
+            return text or None
+        # unlike xmltodict, the whitespace between child elements is dropped
+        if text.strip():
+            self.value["#text"] = text
+        return self.value
+
+
+def element_value(element, list_like_fields=LIST_LIKE_FIELDS):
+    """
+    Return the value of a parsed element, see ElementValueBuilder.
+    """
+    if not len(element) and not element.attrib:
+        return element.text
+    builder = ElementValueBuilder(element, list_like_fields)
+    for child in element:
+        builder.add_element(child)
+    return builder.build()
+
+
+def iter_top_level_elements(file):
+    """
+    Yield the name and value of each child element of the Document root
+    element of an XML file as soon as it is complete, and remove it from the
+    tree. Nothing is yielded if the root element is not a Document.
+    """
+    depth = 0
+    root = None
+    for event, element in ElementTree.iterparse(file, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                root = element
+                if local_name(root.tag) != "Document":
+                    return
+            continue
+        depth -= 1
+        if depth == 1:
+            yield local_name(element.tag), element_value(element)
+            root.remove(element)
+
+
+def read_document(file):
+    """
+    Return the Document element of an XML file as a dict, like
+    xmltodict.parse(file.read())["Document"] with list-like fields in lists,
+    or None if the root element is not a Document.
+    """
+    builder = None
+    for name, value in iter_top_level_elements(file):
+        if builder is None:
+            builder = ElementValueBuilder(ElementTree.Element("Document"))
+        builder.add(name, value)
+    if builder is None:
+        return None
+    return builder.build() or {}
+
+
+def iter_document_fields(file):
+    """
+    Yield the (field name, value) pairs of the SPDX document in an XML file
+    in document order. Each run of consecutive jsonyamlxml.ELEMENT_FIELDS
+    elements with the same name is yielded as an iterator that reads one
+    element at a time, other runs as a list if the field is list-like or
+    repeated.
+    """
+    for field, fields in groupby(iter_top_level_elements(file), key=itemgetter(0)):
+        values = (value for _, value in fields)
+        if field in jsonyamlxml.ELEMENT_FIELDS:
+            yield field, values
+            continue
+        values = list(values)
+        if len(values) == 1 and field not in LIST_LIKE_FIELDS:
+            yield field, values[0]
+        else:
+            yield field, values
+
 
 class Parser(jsonyamlxml.Parser):
     """
@@ -25,57 +167,17 @@ class Parser(jsonyamlxml.Parser):
 
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
-        self.LIST_LIKE_FIELDS = {
-            "creators",
-            "externalDocumentRefs",
-            "extractedLicenseInfos",
-            "seeAlsos",
-            "annotations",
-            "relationships",
-            "snippets",
-            "reviewers",
-            "fileTypes",
-            "licenseInfoFromFiles",
-            "licenseInfoInFiles",
-            "artifactOf",
-            "fileContributors",
-            "fileDependencies",
-            "files",
-            "documentDescribes",
-            "packages",
-            "checksums",
-            "hasFiles",
-            "externalRefs",
-            "ranges",
-            "licenseInfoInSnippets",
-            "packageVerificationCodeExcludedFiles",
-        }
-
-    def parse(self, file):
-        parsed_xml = xmltodict.parse(
-            file.read(), strip_whitespace=False, encoding="utf-8"
-        )
-        fixed_object = self._set_in_list(parsed_xml, self.LIST_LIKE_FIELDS)
-        self.document_object = fixed_object.get("Document")
-        return super(Parser, self).parse()
+        self.LIST_LIKE_FIELDS = LIST_LIKE_FIELDS
 
-    def _set_in_list(self, data, keys):
+    def parse(self, file, incremental=False):
         """
-        xmltodict parse list-like fields in different way when there is only one
-        of them than when there are several of them.
-        Set in lists those fields that are expected to be in them.
+        Parse an XML SPDX document from file. The file is read with iterparse,
+        and each element of the document is converted as soon as it is
+        complete. If incremental is set, the packages, files, snippets and
+        relationships are also parsed one at a time, instead of after the
+        whole document was read.
         """
-        if isinstance(data, (dict, OrderedDict)):
-            new_data = OrderedDict()
-            for k, v in data.items():
-                if k in keys and not isinstance(v, list):
-                    new_data[k] = [self._set_in_list(v, keys)]
-                else:
-                    new_data[k] = self._set_in_list(v, keys)
-            return new_data
-        elif isinstance(data, list):
-            new_data = []
-            for element in data:
-                new_data.append(self._set_in_list(element, keys))
-            return new_data
-        return data
+        if incremental:
+            return self.parse_incremental(iter_document_fields(file))
+        self.document_object = read_document(file)
+        return super(Parser, self).parse()
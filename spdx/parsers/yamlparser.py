@@ -10,9 +10,74 @@
 # limitations under the License.
 
 import yaml
+from yaml.composer import Composer
+from yaml.events import MappingEndEvent, MappingStartEvent, SequenceEndEvent, SequenceStartEvent, StreamEndEvent
 
 from spdx.parsers import jsonyamlxml
 
+# the libyaml based loader if PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class StreamLoader(SafeLoader, Composer):
+    """
+    SafeLoader that composes and constructs one node at a time, so that a
+    document can be read from its event stream without holding all of it
+    in memory. The C loaders compose whole documents only, the composition
+    of single nodes is done by the pure-Python Composer.
+    """
+
+    def __init__(self, stream):
+        SafeLoader.__init__(self, stream)
+        Composer.__init__(self)
+
+    def next_value(self):
+        """
+        Construct and return the value of the node at the current event.
+        """
+        return self.construct_document(self.compose_node(None, None))
+
+    def iter_sequence(self):
+        """
+        Yield the values of the sequence at the current event one at a time.
+        """
+        self.get_event()
+        while not self.check_event(SequenceEndEvent):
+            yield self.next_value()
+        self.get_event()
+
+
+def iter_document_fields(loader):
+    """
+    Yield the (field name, value) pairs of the SPDX document read by a
+    StreamLoader, with the elements of jsonyamlxml.ELEMENT_FIELDS as
+    iterators. Nothing is yielded if the document is not a mapping.
+    """
+    loader.get_event()
+    if loader.check_event(StreamEndEvent):
+        return
+    loader.get_event()
+    if not loader.check_event(MappingStartEvent):
+        return
+    yield from iter_mapping_fields(loader)
+
+
+def iter_mapping_fields(loader):
+    loader.get_event()
+    while not loader.check_event(MappingEndEvent):
+        key = loader.next_value()
+        if key in jsonyamlxml.ELEMENT_FIELDS and loader.check_event(SequenceStartEvent):
+            elements = loader.iter_sequence()
+            yield key, elements
+            # skip whatever the consumer did not read
+            for _ in elements:
+                pass
+        elif key == "Document" and loader.check_event(MappingStartEvent):
+            yield from iter_mapping_fields(loader)
+        else:
+            yield key, loader.next_value()
+    loader.get_event()
+
 
 class Parser(jsonyamlxml.Parser):
     """
@@ -24,6 +89,17 @@ class Parser(jsonyamlxml.Parser):
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
 
-    def parse(self, file):
-        self.json_yaml_set_document(yaml.safe_load(file))
+    def parse(self, file, incremental=False):
+        """
+        Parse a YAML SPDX document from file. If incremental is set, the file
+        is read one element at a time from the YAML event stream instead of
+        being loaded as a whole.
+        """
+        if incremental:
+            loader = StreamLoader(file)
+            try:
+                return self.parse_incremental(iter_document_fields(loader))
+            finally:
+                loader.dispose()
+        self.json_yaml_set_document(yaml.load(file, Loader=SafeLoader))
         return super(Parser, self).parse()
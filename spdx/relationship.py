@@ -12,6 +12,7 @@
 
 from enum import auto, Enum
 
+from spdx.change_tracking import ChangeTracked, IndexedAttribute
 from spdx.parsers.loggers import ErrorMessages
 
 
@@ -63,7 +64,7 @@ class RelationshipType(Enum):
     SPECIFICATION_FOR = auto()
 
 
-class Relationship(object):
+class Relationship(ChangeTracked):
     """
     Document relationship information
     Fields:
@@ -71,6 +72,10 @@ class Relationship(object):
     - relationship_comment:  place for the SPDX file creator to record any general comments. Optional, One
     """
 
+    __slots__ = ("_relationship", "relationship_comment")
+
+    relationship = IndexedAttribute()
+
     def __init__(self, relationship=None, relationship_comment=None):
         self.relationship = relationship
         self.relationship_comment = relationship_comment
@@ -0,0 +1,261 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Graph of the relationships of a document, for traversal queries such as
+everything that transitively DEPENDS_ON a package, or the packages that
+CONTAIN a file. Each relationship is parsed once, and the edges are kept in
+adjacency arrays by node in both directions, so that building the graph and
+each traversal take time linear in the number of edges. A query for a
+relationship type also follows the relationships of its inverse type, see
+CANONICAL_RELATIONSHIP_TYPES, in the other direction, as "B CONTAINED_BY A"
+states that "A CONTAINS B".
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from spdx.relationship import Relationship
+
+# relationship types that state the relationship of another type in the other
+# direction, by that type: "B CONTAINED_BY A" is the same as "A CONTAINS B"
+CANONICAL_RELATIONSHIP_TYPES = {
+    "CONTAINED_BY": "CONTAINS",
+    "DESCRIBED_BY": "DESCRIBES",
+    "DEPENDENCY_OF": "DEPENDS_ON",
+    "GENERATED_FROM": "GENERATES",
+    "DESCENDANT_OF": "ANCESTOR_OF",
+    "HAS_PREREQUISITE": "PREREQUISITE_FOR",
+}
+# the inverse type of each type that has one, in both directions
+INVERSE_RELATIONSHIP_TYPES = dict(CANONICAL_RELATIONSHIP_TYPES)
+INVERSE_RELATIONSHIP_TYPES.update((canonical, inverse) for inverse, canonical in CANONICAL_RELATIONSHIP_TYPES.items())
+
+
+class AdjacencyIndex(object):
+    """
+    The edges of a graph grouped by node, in compressed sparse rows: the
+    edges from node n are at positions offsets[n] to offsets[n + 1] of
+    `targets` and `types`, in the order they were given.
+    """
+
+    def __init__(self, node_count: int, from_nodes: array, to_nodes: array, edge_types: array):
+        offsets = array("L", bytes(array("L").itemsize * (node_count + 1)))
+        for node in from_nodes:
+            offsets[node + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+        self.offsets = offsets
+        self.targets = array(to_nodes.typecode, to_nodes)
+        self.types = array(edge_types.typecode, edge_types)
+        positions = offsets[:-1]
+        for edge, node in enumerate(from_nodes):
+            position = positions[node]
+            self.targets[position] = to_nodes[edge]
+            self.types[position] = edge_types[edge]
+            positions[node] = position + 1
+
+    def neighbors(self, node: int, type_ids: Optional[Set[int]] = None) -> Iterable[int]:
+        targets, types = self.targets, self.types
+        for position in range(self.offsets[node], self.offsets[node + 1]):
+            if type_ids is None or types[position] in type_ids:
+                yield targets[position]
+
+
+class RelationshipGraph(object):
+    """
+    Graph of relationships between SPDX ids. The relationship types of the
+    queries are names of spdx.relationship.RelationshipType members, all
+    types if None. A query for a type also follows the relationships of its
+    inverse type in the other direction, see INVERSE_RELATIONSHIP_TYPES.
+    Relationships that do not have three parts are skipped and counted in
+    skipped_relationships.
+    """
+
+    def __init__(self, relationships: Iterable[Relationship]):
+        self._node_ids: Dict[str, int] = {}
+        self.nodes: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+        self.relationship_types: List[str] = []
+        self.skipped_relationships = 0
+        sources, targets, types = array("L"), array("L"), array("H")
+        for relationship in relationships:
+            parts = relationship.relationship.split(" ") if relationship.relationship else []
+            if len(parts) < 3:
+                self.skipped_relationships += 1
+                continue
+            sources.append(self._add_node(parts[0]))
+            types.append(self._add_type(parts[1]))
+            targets.append(self._add_node(parts[2]))
+        self.edge_count = len(sources)
+        self._forward = AdjacencyIndex(len(self.nodes), sources, targets, types)
+        self._reverse = AdjacencyIndex(len(self.nodes), targets, sources, types)
+
+    @classmethod
+    def from_document(cls, document) -> "RelationshipGraph":
+        return cls(document.relationships)
+
+    def _add_node(self, spdx_id: str) -> int:
+        node = self._node_ids.get(spdx_id)
+        if node is None:
+            node = self._node_ids[spdx_id] = len(self.nodes)
+            self.nodes.append(spdx_id)
+        return node
+
+    def _add_type(self, relationship_type: str) -> int:
+        type_id = self._type_ids.get(relationship_type)
+        if type_id is None:
+            type_id = self._type_ids[relationship_type] = len(self.relationship_types)
+            self.relationship_types.append(relationship_type)
+        return type_id
+
+    def __contains__(self, spdx_id: str) -> bool:
+        return spdx_id in self._node_ids
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _neighbor_function(self, relationship_types: Optional[Iterable[str]], reverse: bool = False,
+                           canonical: bool = False):
+        """
+        Return a function from a node to its neighbors along relationship_types
+        and, in the other direction, along their inverse types. With canonical,
+        the relationships of the types in CANONICAL_RELATIONSHIP_TYPES are
+        only followed as the relationship of the canonical type they state, so
+        that a relationship and its redundant inverse are one edge.
+        """
+        index, inverse_index = (self._reverse, self._forward) if reverse else (self._forward, self._reverse)
+        if canonical:
+            names = None if relationship_types is None else {
+                CANONICAL_RELATIONSHIP_TYPES.get(name, name) for name in relationship_types}
+            type_ids, inverse_type_ids = set(), set()
+            for type_id, name in enumerate(self.relationship_types):
+                canonical_name = CANONICAL_RELATIONSHIP_TYPES.get(name, name)
+                if names is None or canonical_name in names:
+                    (type_ids if canonical_name == name else inverse_type_ids).add(type_id)
+        else:
+            if relationship_types is None:
+                # all types: each relationship of a type with an inverse type is also followed backwards
+                type_ids = None
+                inverse_names = INVERSE_RELATIONSHIP_TYPES
+            else:
+                type_ids = {self._type_ids[name] for name in relationship_types if name in self._type_ids}
+                inverse_names = {INVERSE_RELATIONSHIP_TYPES[name] for name in relationship_types
+                                 if name in INVERSE_RELATIONSHIP_TYPES}
+            inverse_type_ids = {type_id for name, type_id in self._type_ids.items() if name in inverse_names}
+        if not inverse_type_ids:
+            return lambda node: index.neighbors(node, type_ids)
+
+        def neighbors(node):
+            yield from index.neighbors(node, type_ids)
+            yield from inverse_index.neighbors(node, inverse_type_ids)
+
+        return neighbors
+
+    def successors(self, spdx_id: str, relationship_types: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Return the SPDX ids that spdx_id has a relationship to, i.e. B for each
+        "spdx_id TYPE B" and for each "B INVERSE_TYPE spdx_id", in relationship
+        order without duplicates, the inverse relationships last.
+        """
+        return self.reachable(spdx_id, relationship_types, max_depth=1)
+
+    def predecessors(self, spdx_id: str, relationship_types: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Return the SPDX ids that have a relationship to spdx_id, i.e. A for
+        each "A TYPE spdx_id", e.g. the packages that CONTAIN a file.
+        """
+        return self.reachable(spdx_id, relationship_types, reverse=True, max_depth=1)
+
+    def reachable(self, spdx_id: str, relationship_types: Optional[Iterable[str]] = None, reverse: bool = False,
+                  max_depth: Optional[int] = None) -> List[str]:
+        """
+        Return the SPDX ids reachable from spdx_id along relationships of the
+        given types, breadth first, up to max_depth relationships away. With
+        reverse, the relationships are followed backwards: the ids from which
+        spdx_id is reachable, e.g. everything that transitively DEPENDS_ON it.
+        spdx_id itself is only included if it is on a cycle.
+        """
+        start = self._node_ids.get(spdx_id)
+        if start is None:
+            return []
+        neighbors = self._neighbor_function(relationship_types, reverse)
+        visited = bytearray(len(self.nodes))
+        reached = []
+        queue = deque([(start, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbor in neighbors(node):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    reached.append(self.nodes[neighbor])
+                    queue.append((neighbor, depth + 1))
+        return reached
+
+    def find_cycles(self, relationship_types: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """
+        Return the cycles along relationships of the given types, as the
+        strongly connected components that contain a cycle, each in the order
+        in which its SPDX ids were first reached. A relationship and its
+        inverse, like "A CONTAINS B" and "B CONTAINED_BY A", are one edge and
+        not a cycle.
+        """
+        neighbors = self._neighbor_function(relationship_types, canonical=True)
+        node_count = len(self.nodes)
+        # Tarjan's algorithm, iterative so that long chains do not hit the recursion limit
+        order = array("l", [-1]) * node_count
+        low_link = array("l", [0]) * node_count
+        on_stack = bytearray(node_count)
+        stack = []
+        cycles = []
+        counter = 0
+        for root in range(node_count):
+            if order[root] != -1:
+                continue
+            order[root] = low_link[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, iter(neighbors(root)))]
+            while work:
+                node, node_neighbors = work[-1]
+                for neighbor in node_neighbors:
+                    if order[neighbor] == -1:
+                        order[neighbor] = low_link[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        work.append((neighbor, iter(neighbors(neighbor))))
+                        break
+                    if on_stack[neighbor]:
+                        low_link[node] = min(low_link[node], order[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low_link[parent] = min(low_link[parent], low_link[node])
+                    if low_link[node] == order[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = 0
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in neighbors(node):
+                            cycles.append([self.nodes[member] for member in sorted(component, key=order.__getitem__)])
+        return cycles
+
+    def has_cycle(self, relationship_types: Optional[Iterable[str]] = None) -> bool:
+        return bool(self.find_cycles(relationship_types))
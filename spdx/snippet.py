@@ -11,10 +11,11 @@
 from typing import Tuple, Optional
 
 from spdx import license
+from spdx.change_tracking import ChangeTracked, IndexedAttribute
 from spdx import utils
 
 
-class Snippet(object):
+class Snippet(ChangeTracked):
     """
     Represents an analyzed snippet.
     Fields:
@@ -42,6 +43,26 @@ class Snippet(object):
      snippet information applies to. Optional, one. Type (int, int)
     """
 
+    __slots__ = (
+        "_spdx_id",
+        "name",
+        "comment",
+        "copyright",
+        "license_comment",
+        "attribution_text",
+        "snip_from_file_spdxid",
+        "conc_lics",
+        "_licenses_in_snippet",
+        "byte_range",
+        "line_range",
+    )
+
+    collection_attributes = ("_licenses_in_snippet",)
+    spdx_id = IndexedAttribute()
+
+    # created on first access
+    licenses_in_snippet = utils.LazyCollection()
+
     def __init__(
         self, spdx_id=None, copyright=None, snip_from_file_spdxid=None, conc_lics=None, byte_range=None
     ):
@@ -53,7 +74,6 @@ class Snippet(object):
         self.attribution_text = None
         self.snip_from_file_spdxid = snip_from_file_spdxid
         self.conc_lics = conc_lics
-        self.licenses_in_snippet = []
         self.byte_range: Optional[Tuple[int, int]] = byte_range
         self.line_range: Optional[Tuple[int, int]] = None
 
@@ -101,7 +121,7 @@ class Snippet(object):
             )
 
     def validate_licenses_in_snippet(self, messages):
-        for lic in self.licenses_in_snippet:
+        for lic in getattr(self, "_licenses_in_snippet", ()):
             if not isinstance(
                 lic, (license.License, utils.NoAssert, utils.SPDXNone)
             ):
@@ -0,0 +1,130 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generate valid synthetic SPDX documents of configurable size, for the
+benchmarks and the tests.
+"""
+
+from datetime import datetime
+
+from spdx.annotation import Annotation
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.creationinfo import Tool
+from spdx.document import Document, ExtractedLicense
+from spdx.file import File, FileType
+from spdx.license import License, LicenseConjunction, LicenseDisjunction
+from spdx.package import Package
+from spdx.relationship import Relationship
+from spdx.snippet import Snippet
+from spdx.utils import NoAssert
+from spdx.version import Version
+
+LICENSE_IDS = ["MIT", "Apache-2.0", "GPL-2.0-only", "BSD-3-Clause", "LGPL-2.1-or-later", "LicenseRef-1"]
+DATE = datetime(2022, 1, 1, 12, 0, 0)
+
+
+def license_expression(depth, offset=0):
+    """
+    Return a license expression nesting `depth` licenses in alternating
+    conjunctions and disjunctions.
+    """
+    expression = License.from_identifier(LICENSE_IDS[offset % len(LICENSE_IDS)])
+    for level in range(1, depth):
+        other = License.from_identifier(LICENSE_IDS[(offset + level) % len(LICENSE_IDS)])
+        if level % 2:
+            expression = LicenseConjunction(expression, other)
+        else:
+            expression = LicenseDisjunction(expression, other)
+    return expression
+
+
+def checksum_value(algorithm_length, number):
+    return "{:0{}x}".format(number, algorithm_length)
+
+
+def create_document(packages=10, files_per_package=10, snippets=10, relationships=10, annotations=10,
+                    license_depth=3):
+    """
+    Return a valid Document with `packages` packages of `files_per_package`
+    files each, `snippets` snippets, `relationships` DEPENDS_ON relationships
+    between packages in addition to the CONTAINS and DESCRIBES ones, and
+    `annotations` annotations. Concluded licenses are expressions of
+    `license_depth` licenses.
+    """
+    document = Document(Version(2, 3), License.from_identifier("CC0-1.0"), "synthetic-document",
+                        spdx_id="SPDXRef-DOCUMENT",
+                        namespace="https://spdx.org/spdxdocs/synthetic-document-{}-{}".format(packages,
+                                                                                           files_per_package))
+    document.creation_info.add_creator(Tool("spdx-benchmarks"))
+    document.creation_info.created = DATE
+    extracted_license = ExtractedLicense("LicenseRef-1")
+    extracted_license.full_name = "Synthetic License"
+    extracted_license.text = "Synthetic license text"
+    document.add_extr_lic(extracted_license)
+
+    file_number = 0
+    element_ids = []
+    for package_number in range(packages):
+        package = Package(name="package{}".format(package_number), download_location=NoAssert())
+        package.spdx_id = "SPDXRef-Package{}".format(package_number)
+        package.version = "1.0.{}".format(package_number)
+        package.cr_text = "Copyright {} Synthetic".format(package_number)
+        package.set_checksum(Checksum(ChecksumAlgorithm.SHA1, checksum_value(40, package_number)))
+        package.license_declared = License.from_identifier(LICENSE_IDS[package_number % len(LICENSE_IDS)])
+        package.conc_lics = license_expression(license_depth, package_number)
+        package.files_analyzed = files_per_package > 0
+        document.add_package(package)
+        document.add_relationship(Relationship("SPDXRef-DOCUMENT DESCRIBES " + package.spdx_id))
+        element_ids.append(package.spdx_id)
+
+        licenses_from_files = []
+        for _ in range(files_per_package):
+            file = File("./package{}/file{}.c".format(package_number, file_number),
+                        spdx_id="SPDXRef-File{}".format(file_number))
+            file.set_checksum(Checksum(ChecksumAlgorithm.SHA1, checksum_value(40, file_number)))
+            file.set_checksum(Checksum(ChecksumAlgorithm.SHA256, checksum_value(64, file_number)))
+            file.file_types = [FileType.SOURCE]
+            file.conc_lics = license_expression(license_depth, file_number)
+            file_license = License.from_identifier(LICENSE_IDS[file_number % len(LICENSE_IDS)])
+            file.add_lics(file_license)
+            if file_license not in licenses_from_files:
+                licenses_from_files.append(file_license)
+            file.copyright = "Copyright {} Synthetic".format(file_number)
+            document.add_file(file)
+            document.add_relationship(Relationship("{} CONTAINS {}".format(package.spdx_id, file.spdx_id)))
+            element_ids.append(file.spdx_id)
+            file_number += 1
+        for file_license in licenses_from_files:
+            package.add_lics_from_file(file_license)
+        if files_per_package:
+            package.verif_code = checksum_value(40, package_number)
+
+    for snippet_number in range(snippets if file_number else 0):
+        snippet = Snippet(spdx_id="SPDXRef-Snippet{}".format(snippet_number),
+                          snip_from_file_spdxid="SPDXRef-File{}".format(snippet_number % file_number),
+                          conc_lics=license_expression(license_depth, snippet_number),
+                          copyright="Copyright {} Synthetic".format(snippet_number))
+        snippet.byte_range = (snippet_number, snippet_number + 100)
+        snippet.licenses_in_snippet.append(License.from_identifier("MIT"))
+        document.add_snippet(snippet)
+
+    for relationship_number in range(relationships if packages > 1 else 0):
+        document.add_relationship(Relationship("SPDXRef-Package{} DEPENDS_ON SPDXRef-Package{}".format(
+            relationship_number % packages, (relationship_number + 1) % packages)))
+
+    for annotation_number in range(annotations if element_ids else 0):
+        document.add_annotation(Annotation(annotator=Tool("spdx-benchmarks"), annotation_date=DATE,
+                                           comment="Annotation {}".format(annotation_number),
+                                           annotation_type="OTHER",
+                                           spdx_id=element_ids[annotation_number % len(element_ids)]))
+
+    return document
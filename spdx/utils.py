@@ -12,11 +12,14 @@
 import datetime
 import hashlib
 import re
-from typing import Dict, List, TYPE_CHECKING
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 from ply import lex
 from ply import yacc
 
+from spdx import hashing
 from spdx.checksum import ChecksumAlgorithm
 
 if TYPE_CHECKING:
@@ -112,6 +115,39 @@ class SPDXNone(object):
         return self.to_value()
 
 
+# Module holding the precomputed LALR tables, see spdx.parsers._build_tables
+LICENSE_PARSETAB_MODULE = "spdx.parsers.license_parsetab"
+
+
+class LazyCollection(object):
+    """
+    Descriptor for a list or dict attribute of a class with __slots__, stored
+    in the slot of the same name with a leading underscore. The collection is
+    only created when the attribute is first read, so that the many elements
+    which never get a value do not each hold an empty one.
+    """
+
+    def __init__(self, factory=list):
+        self.factory = factory
+        self.slot_name = None
+
+    def __set_name__(self, owner, name):
+        self.slot_name = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            value = self.factory()
+            setattr(instance, self.slot_name, value)
+            return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot_name, value)
+
+
 class LicenseListLexer(object):
     tokens = ["LP", "RP", "AND", "OR", "LICENSE"]
 
@@ -201,6 +237,9 @@ class LicenseListParser(object):
 
     def build(self, **kwargs):
         """Must be called before parse."""
+        # Load the prebuilt tables; PLY regenerates them if the grammar changed.
+        kwargs.setdefault("tabmodule", LICENSE_PARSETAB_MODULE)
+        kwargs.setdefault("debug", False)
         self.yacc = yacc.yacc(module=self, **kwargs)
 
     def parse(self, data):
@@ -211,16 +250,62 @@ class LicenseListParser(object):
             return None
 
 
-def calc_verif_code(files: List['File']) -> str:
-    list_of_file_hashes = []
+# Upper bound on the number of distinct license expressions kept by
+# parse_license_expression. Real documents repeat a few hundred expressions
+# across all of their files, so this is plenty.
+LICENSE_EXPRESSION_CACHE_SIZE = 4096
+
+_license_list_parser = None
+_license_list_parser_lock = threading.Lock()
+
+
+def get_license_list_parser() -> LicenseListParser:
+    """
+    Return the process-wide LicenseListParser, building its tables on first use.
+    Callers sharing it between threads must hold _license_list_parser_lock
+    while parsing, as the PLY lexer keeps its state on the instance.
+    """
+    global _license_list_parser
+    if _license_list_parser is None:
+        with _license_list_parser_lock:
+            if _license_list_parser is None:
+                parser = LicenseListParser()
+                parser.build(write_tables=0, debug=0)
+                _license_list_parser = parser
+    return _license_list_parser
+
+
+@lru_cache(maxsize=LICENSE_EXPRESSION_CACHE_SIZE)
+def parse_license_expression(expression: str):
+    """
+    Parse a license expression string with the shared LicenseListParser.
+    Return a License, LicenseConjunction or LicenseDisjunction, or None if
+    parsing failed. Results are memoized, which saves parsing the expressions
+    again; the licenses are interned anyway.
+    """
+    parser = get_license_list_parser()
+    with _license_list_parser_lock:
+        return parser.parse(expression)
+
+
+def calc_verif_code(files: List['File'], max_workers: Optional[int] = None) -> str:
+    """
+    Return the package verification code of files. The SHA1 of files without
+    a SHA1 checksum is calculated on up to max_workers threads.
+    """
     hash_algorithm_name = ChecksumAlgorithm.SHA1
+    list_of_file_hashes = []
+    files_to_hash = []
     for file in files:
         file_checksum = file.get_checksum(hash_algorithm_name)
         if file_checksum is not None:
-            file_checksum_value = file_checksum.value
+            list_of_file_hashes.append(file_checksum.value)
         else:
-            file_checksum_value = file.calculate_checksum(hash_algorithm_name)
-        list_of_file_hashes.append(file_checksum_value)
+            files_to_hash.append(file)
+
+    calculated_checksums = hashing.calculate_files_checksums(
+        [file.name for file in files_to_hash], [hash_algorithm_name], max_workers=max_workers)
+    list_of_file_hashes.extend(checksums[hash_algorithm_name] for checksums in calculated_checksums)
 
     list_of_file_hashes.sort()
 
@@ -229,16 +314,66 @@ def calc_verif_code(files: List['File']) -> str:
     return hasher.hexdigest()
 
 
-def get_files_in_package(package: 'Package', files: List['File'], relationships: List[Relationship]) -> List['File']:
-    files_in_package = []
-    for file in files:
-        if file.spdx_id in [relationship.related_spdx_element for relationship in relationships
-                            if relationship.relationship_type == "CONTAINS" and relationship.spdx_element_id == package.spdx_id] \
-            or file.spdx_id in [relationship.spdx_element_id for relationship in relationships
-                                if relationship.relationship_type == "CONTAINED_BY" and relationship.related_spdx_element == package.spdx_id]:
-            files_in_package.append(file)
+class ContainmentIndex(object):
+    """
+    Resolve which files of a document are contained in which packages in a
+    single pass over the relationships. A file is contained in a package if the
+    package CONTAINS the file or the file is CONTAINED_BY the package.
+    - files_by_package_id: files contained in each package, in relationship order.
+    - package_ids_by_file_id: SPDX ids of the packages containing each file.
+    - relationships_to_write: relationships that are not expressed by the
+      containment, i.e. all other relationships and containment relationships
+      with a comment, in document order.
+    """
+
+    def __init__(self, packages: List['Package'], files: List['File'], relationships: List[Relationship]):
+        self.files_by_package_id: Dict[str, List['File']] = {}
+        self.package_ids_by_file_id: Dict[str, List[str]] = {}
+        self.relationships_to_write: List[Relationship] = []
+        packages_spdx_ids = {package.spdx_id for package in packages}
+        files_by_spdx_id = {file.spdx_id: file for file in files}
+
+        for relationship in relationships:
+            relationship_parts = relationship.relationship.split(" ") if relationship.relationship else []
+            if len(relationship_parts) < 3:
+                self.relationships_to_write.append(relationship)
+                continue
+            spdx_element_id, relationship_type, related_spdx_element = relationship_parts[:3]
+            if relationship_type == "CONTAINS" and spdx_element_id in packages_spdx_ids \
+                    and related_spdx_element in files_by_spdx_id:
+                self.add_file_to_package(spdx_element_id, files_by_spdx_id[related_spdx_element])
+            elif relationship_type == "CONTAINED_BY" and related_spdx_element in packages_spdx_ids \
+                    and spdx_element_id in files_by_spdx_id:
+                self.add_file_to_package(related_spdx_element, files_by_spdx_id[spdx_element_id])
+            else:
+                self.relationships_to_write.append(relationship)
+                continue
+            if relationship.has_comment:
+                self.relationships_to_write.append(relationship)
+
+    @classmethod
+    def from_document(cls, document) -> 'ContainmentIndex':
+        return cls(document.packages, document.files, document.relationships)
+
+    def add_file_to_package(self, package_spdx_id: str, file: 'File') -> None:
+        package_ids = self.package_ids_by_file_id.setdefault(file.spdx_id, [])
+        if package_spdx_id not in package_ids:
+            package_ids.append(package_spdx_id)
+            self.files_by_package_id.setdefault(package_spdx_id, []).append(file)
+
+    def files_in_package(self, package_spdx_id: str) -> List['File']:
+        return self.files_by_package_id.get(package_spdx_id, [])
+
+    def package_ids_of_file(self, file_spdx_id: str) -> List[str]:
+        return self.package_ids_by_file_id.get(file_spdx_id, [])
 
-    return files_in_package
+
+def get_files_in_package(package: 'Package', files: List['File'], relationships: List[Relationship]) -> List['File']:
+    """
+    Return the files contained in package. To resolve the files of several
+    packages, build a ContainmentIndex once instead.
+    """
+    return list(ContainmentIndex([package], files, relationships).files_in_package(package.spdx_id))
 
 
 def update_dict_item_with_new_item(current_state: Dict, key: str, item_to_add: str) -> None:
@@ -10,6 +10,7 @@
 # limitations under the License.
 
 import json
+from collections.abc import Iterator
 
 from spdx.writers.tagvalue import InvalidDocumentError
 from spdx.writers.jsonyamlxml import Writer
@@ -24,7 +25,50 @@ def json_converter(obj):
         raise TypeError("No implementation available to serialize objects of type " + type(obj).__name__)
 
 
-def write_document(document, out, validate=True):
+INDENT = " " * 4
+
+
+def write_json_value(value, out, level):
+    """
+    Write value as json.dump(..., indent=4) would write it nested `level` levels deep.
+    """
+    encoded = json.dumps(value, indent=4, default=json_converter)
+    out.write(encoded.replace("\n", "\n" + INDENT * level))
+
+
+def write_json_array(values, out, level):
+    out.write("[")
+    separator = "\n"
+    for value in values:
+        out.write(separator + INDENT * (level + 1))
+        write_json_value(value, out, level + 1)
+        separator = ",\n"
+    if separator != "\n":
+        out.write("\n" + INDENT * level)
+    out.write("]")
+
+
+def stream_document(document_fields, out):
+    """
+    Write the (field name, value) pairs of a document as a json object, one
+    element at a time for values that are iterators. The output is identical
+    to json.dump(dict(document_fields), out, indent=4).
+    """
+    out.write("{")
+    separator = "\n"
+    for field, value in document_fields:
+        out.write(separator + INDENT + json.dumps(field) + ": ")
+        if isinstance(value, Iterator):
+            write_json_array(value, out, 1)
+        else:
+            write_json_value(value, out, 1)
+        separator = ",\n"
+    if separator != "\n":
+        out.write("\n")
+    out.write("}")
+
+
+def write_document(document, out, validate=True, streaming=True):
 
     if validate:
         messages = ErrorMessages()
@@ -33,5 +77,8 @@ def write_document(document, out, validate=True):
             raise InvalidDocumentError(messages)
 
     writer = Writer(document)
-    document_object = writer.create_document()
-    json.dump(document_object, out, indent=4, default=json_converter)
+    if streaming:
+        stream_document(writer.iter_document_fields(), out)
+    else:
+        document_object = writer.create_document()
+        json.dump(document_object, out, indent=4, default=json_converter)
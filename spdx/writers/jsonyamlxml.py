@@ -8,7 +8,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 from rdflib import Literal
 
@@ -16,7 +16,7 @@ from spdx import license, utils
 from spdx.checksum import Checksum
 from spdx.package import ExternalPackageRef
 from spdx.relationship import Relationship
-from spdx.utils import update_dict_item_with_new_item
+from spdx.utils import ContainmentIndex, update_dict_item_with_new_item
 
 
 class BaseWriter(object):
@@ -373,53 +373,52 @@ class SnippetWriter(BaseWriter):
         super(SnippetWriter, self).__init__(document)
 
     def create_snippet_info(self, annotations_by_spdx_id):
-        snippet_info_objects = []
-        snippets = self.document.snippet
+        return [self.create_snippet_object(snippet, annotations_by_spdx_id) for snippet in self.document.snippet]
 
-        for snippet in snippets:
-            snippet_from_file_spdx_id = self.spdx_id(snippet.snip_from_file_spdxid)
-            snippet_object = dict()
-            snippet_object["SPDXID"] = self.spdx_id(snippet.spdx_id)
-            snippet_object["snippetFromFile"] = snippet_from_file_spdx_id
+    def create_snippet_object(self, snippet, annotations_by_spdx_id):
+        snippet_from_file_spdx_id = self.spdx_id(snippet.snip_from_file_spdxid)
+        snippet_object = dict()
+        snippet_object["SPDXID"] = self.spdx_id(snippet.spdx_id)
+        snippet_object["snippetFromFile"] = snippet_from_file_spdx_id
 
-            if snippet.has_optional_field("copyright"):
-                snippet_object["copyrightText"] = snippet.copyright
+        if snippet.has_optional_field("copyright"):
+            snippet_object["copyrightText"] = snippet.copyright
 
-            if snippet.has_optional_field("conc_lics"):
-                snippet_object["licenseConcluded"] = self.license(snippet.conc_lics)
+        if snippet.has_optional_field("conc_lics"):
+            snippet_object["licenseConcluded"] = self.license(snippet.conc_lics)
 
-            if snippet.has_optional_field("licenses_in_snippet"):
-                snippet_object["licenseInfoInSnippets"] = list(
-                    map(self.license, snippet.licenses_in_snippet)
-                )
+        if snippet.has_optional_field("licenses_in_snippet"):
+            snippet_object["licenseInfoInSnippets"] = list(
+                map(self.license, snippet.licenses_in_snippet)
+            )
+        snippet_object["ranges"] = []
+        if snippet.byte_range:
             byte_range = {"endPointer": {"offset": snippet.byte_range[1], "reference": snippet_from_file_spdx_id},
                           "startPointer": {"offset": snippet.byte_range[0], "reference": snippet_from_file_spdx_id}}
-            snippet_object["ranges"] = [byte_range]
-
-            if snippet.has_optional_field("name"):
-                snippet_object["name"] = snippet.name
+            snippet_object["ranges"].append(byte_range)
 
-            if snippet.has_optional_field("comment"):
-                snippet_object["comment"] = snippet.comment
+        if snippet.has_optional_field("name"):
+            snippet_object["name"] = snippet.name
 
-            if snippet.has_optional_field("attribution_text"):
-                snippet_object["attributionTexts"] = [snippet.attribution_text]
+        if snippet.has_optional_field("comment"):
+            snippet_object["comment"] = snippet.comment
 
-            if snippet.has_optional_field("license_comment"):
-                snippet_object["licenseComments"] = snippet.license_comment
+        if snippet.has_optional_field("attribution_text"):
+            snippet_object["attributionTexts"] = [snippet.attribution_text]
 
-            if snippet.spdx_id in annotations_by_spdx_id:
-                snippet_object["annotations"] = annotations_by_spdx_id[snippet.spdx_id]
+        if snippet.has_optional_field("license_comment"):
+            snippet_object["licenseComments"] = snippet.license_comment
 
-            if snippet.has_optional_field("line_range"):
-                line_range = {
-                    "endPointer": {"lineNumber": snippet.line_range[1], "reference": snippet_from_file_spdx_id},
-                    "startPointer": {"lineNumber": snippet.line_range[0], "reference": snippet_from_file_spdx_id}}
-                snippet_object["ranges"].append(line_range)
+        if snippet.spdx_id in annotations_by_spdx_id:
+            snippet_object["annotations"] = annotations_by_spdx_id[snippet.spdx_id]
 
-            snippet_info_objects.append(snippet_object)
+        if snippet.has_optional_field("line_range"):
+            line_range = {
+                "endPointer": {"lineNumber": snippet.line_range[1], "reference": snippet_from_file_spdx_id},
+                "startPointer": {"lineNumber": snippet.line_range[0], "reference": snippet_from_file_spdx_id}}
+            snippet_object["ranges"].append(line_range)
 
-        return snippet_info_objects
+        return snippet_object
 
 
 class ExtractedLicenseWriter(BaseWriter):
@@ -526,102 +525,114 @@ class Writer(
 
         return ext_document_reference_objects
 
-    def create_relationships(self) -> List[Dict]:
-        packages_spdx_ids = [package.spdx_id for package in self.document.packages]
-        files_spdx_ids = [file.spdx_id for file in self.document.files]
-        # we take the package_objects from document_object if any exist because we will modify them to add
-        # jsonyamlxml-specific fields
-        if "packages" in self.document_object:
-            packages_by_spdx_id = {package["SPDXID"]: package for package in self.document_object["packages"]}
-        else:
-            packages_by_spdx_id = {}
-
-        relationship_objects = []
-        for relationship in self.document.relationships:
-            if relationship.relationship_type == "CONTAINS" and relationship.spdx_element_id in packages_spdx_ids \
-                    and relationship.related_spdx_element in files_spdx_ids:
-                update_dict_item_with_new_item(packages_by_spdx_id[relationship.spdx_element_id], "hasFiles",
-                                               relationship.related_spdx_element)
-                if relationship.has_comment:
-                    relationship_objects.append(self.create_relationship_info(relationship))
-
-            elif relationship.relationship_type == "CONTAINED_BY" and relationship.spdx_element_id in files_spdx_ids \
-                    and relationship.related_spdx_element in packages_spdx_ids:
-                update_dict_item_with_new_item(packages_by_spdx_id[relationship.related_spdx_element],
-                                                    "hasFiles", relationship.spdx_element_id)
-                if relationship.has_comment:
-                    relationship_objects.append(self.create_relationship_info(relationship))
-
-            elif relationship.relationship_type == "DESCRIBES" and relationship.spdx_element_id == self.document.spdx_id:
-                update_dict_item_with_new_item(self.document_object, "documentDescribes",
+    def split_relationships(self) -> Tuple[Dict[str, List[str]], List[str], List[Relationship]]:
+        """
+        Split the document relationships into the jsonyamlxml-specific fields and
+        the relationships that still have to be written as relationship objects.
+        Return the hasFiles entries by package SPDX id, the documentDescribes
+        entries and the remaining relationships.
+        """
+        containment_index = ContainmentIndex.from_document(self.document)
+        has_files_by_spdx_id = {package_spdx_id: [file.spdx_id for file in files]
+                                for package_spdx_id, files in containment_index.files_by_package_id.items()}
+        document_describes = {}
+        relationships = []
+
+        for relationship in containment_index.relationships_to_write:
+            if relationship.relationship_type == "DESCRIBES" and relationship.spdx_element_id == self.document.spdx_id:
+                update_dict_item_with_new_item(document_describes, "documentDescribes",
                                                relationship.related_spdx_element)
                 if relationship.has_comment:
-                    relationship_objects.append(self.create_relationship_info(relationship))
+                    relationships.append(relationship)
 
             elif relationship.relationship_type == "DESCRIBED_BY" and relationship.related_spdx_element == self.document.spdx_id:
-                update_dict_item_with_new_item(self.document_object, "documentDescribes",
+                update_dict_item_with_new_item(document_describes, "documentDescribes",
                                                relationship.spdx_element_id)
                 if relationship.has_comment:
-                    relationship_objects.append(self.create_relationship_info(relationship))
+                    relationships.append(relationship)
 
             else:
-                relationship_objects.append(self.create_relationship_info(relationship))
+                relationships.append(relationship)
 
-        return relationship_objects
+        return has_files_by_spdx_id, document_describes.get("documentDescribes", []), relationships
 
-    def create_document(self):
-        self.document_object = dict()
+    def create_relationships(self) -> List[Dict]:
+        has_files_by_spdx_id, document_describes, relationships = self.split_relationships()
+        # we take the package_objects from document_object if any exist because we will modify them to add
+        # jsonyamlxml-specific fields
+        if "packages" in self.document_object:
+            packages_by_spdx_id = {package["SPDXID"]: package for package in self.document_object["packages"]}
+        else:
+            packages_by_spdx_id = {}
 
-        self.document_object["spdxVersion"] = self.document.version.__str__()
-        self.document_object["documentNamespace"] = self.document.namespace.__str__()
-        self.document_object["creationInfo"] = self.create_creation_info()
-        self.document_object["dataLicense"] = self.license(self.document.data_license)
-        self.document_object["SPDXID"] = self.doc_spdx_id
-        self.document_object["name"] = self.document.name
-        annotations_by_spdx_id = self.create_annotations_by_spdx_id()
+        for package_spdx_id, file_spdx_ids in has_files_by_spdx_id.items():
+            packages_by_spdx_id[package_spdx_id]["hasFiles"] = file_spdx_ids
+        if document_describes:
+            self.document_object["documentDescribes"] = document_describes
 
+        return [self.create_relationship_info(relationship) for relationship in relationships]
+
+    def iter_package_objects(self, annotations_by_spdx_id, has_files_by_spdx_id):
         unique_doc_packages = {}
         for doc_package in self.document.packages:
             if doc_package.spdx_id not in unique_doc_packages.keys():
                 unique_doc_packages[doc_package.spdx_id] = doc_package
-        if unique_doc_packages:
-            package_objects = []
-            for package in unique_doc_packages.values():
-                package_info_object = self.create_package_info(package, annotations_by_spdx_id)
-                package_objects.append(package_info_object)
-            self.document_object["packages"] = package_objects
+        for package in unique_doc_packages.values():
+            package_info_object = self.create_package_info(package, annotations_by_spdx_id)
+            if package_info_object["SPDXID"] in has_files_by_spdx_id:
+                package_info_object["hasFiles"] = has_files_by_spdx_id[package_info_object["SPDXID"]]
+            yield package_info_object
+
+    def iter_document_fields(self) -> Iterator[Tuple[str, object]]:
+        """
+        Yield the (field name, json-serializable value) pairs of the document in
+        the order of create_document. The values of packages, files, snippets and
+        relationships are iterators creating one element at a time, so that the
+        document can be written without holding all element objects in memory.
+        """
+        yield "spdxVersion", self.document.version.__str__()
+        yield "documentNamespace", self.document.namespace.__str__()
+        yield "creationInfo", self.create_creation_info()
+        yield "dataLicense", self.license(self.document.data_license)
+        yield "SPDXID", self.doc_spdx_id
+        yield "name", self.document.name
+        annotations_by_spdx_id = self.create_annotations_by_spdx_id()
+        has_files_by_spdx_id, document_describes, relationships = self.split_relationships()
+
+        if self.document.packages:
+            yield "packages", self.iter_package_objects(annotations_by_spdx_id, has_files_by_spdx_id)
+
         if self.document.files:
-            file_objects = []
-            for file in self.document.files:
-                file_object = self.create_file_info(file, annotations_by_spdx_id)
-                file_objects.append(file_object)
-            self.document_object["files"] = file_objects
+            yield "files", (self.create_file_info(file, annotations_by_spdx_id) for file in self.document.files)
 
         if self.document.has_comment:
-            self.document_object["comment"] = self.document.comment
+            yield "comment", self.document.comment
 
         if self.document.ext_document_references:
-            self.document_object[
-                "externalDocumentRefs"
-            ] = self.create_ext_document_references()
+            yield "externalDocumentRefs", self.create_ext_document_references()
 
         if self.document.extracted_licenses:
-            self.document_object[
-                "hasExtractedLicensingInfos"
-            ] = self.create_extracted_license()
+            yield "hasExtractedLicensingInfos", self.create_extracted_license()
 
         if self.document.reviews:
-            self.document_object["reviewers"] = self.create_review_info()
+            yield "reviewers", self.create_review_info()
 
         if self.document.snippet:
-            self.document_object["snippets"] = self.create_snippet_info(annotations_by_spdx_id)
+            yield "snippets", (self.create_snippet_object(snippet, annotations_by_spdx_id)
+                               for snippet in self.document.snippet)
 
         if self.doc_spdx_id in annotations_by_spdx_id:
-            self.document_object["annotations"] = annotations_by_spdx_id[self.doc_spdx_id]
+            yield "annotations", annotations_by_spdx_id[self.doc_spdx_id]
 
-        if self.document.relationships:
-            relationship_objects = self.create_relationships()
-            if relationship_objects:
-                self.document_object["relationships"] = relationship_objects
+        if document_describes:
+            yield "documentDescribes", document_describes
+
+        if relationships:
+            yield "relationships", (self.create_relationship_info(relationship) for relationship in relationships)
+
+    def create_document(self):
+        self.document_object = dict()
+        for field, value in self.iter_document_fields():
+            self.document_object[field] = list(value) if isinstance(value, Iterator) else value
 
         return self.document_object
@@ -9,6 +9,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+from xml.sax.saxutils import escape, quoteattr
+
 from rdflib import BNode
 from rdflib import Graph
 from rdflib import Literal
@@ -17,6 +20,7 @@ from rdflib import RDF
 from rdflib import RDFS
 from rdflib import URIRef
 from rdflib.compare import to_isomorphic
+from rdflib.namespace import split_uri
 
 from spdx import config
 from spdx import file
@@ -26,12 +30,27 @@ from spdx.checksum import Checksum
 from spdx.package import Package
 from spdx.parsers.loggers import ErrorMessages
 from spdx.relationship import Relationship
-from spdx.utils import get_files_in_package
+from spdx.utils import ContainmentIndex
 from spdx.writers.tagvalue import InvalidDocumentError
 
 import warnings
 
 
+class OrderedGraph(Graph):
+    """
+    A graph that also keeps its triples in the order they were added, as the
+    rdflib stores do not.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(OrderedGraph, self).__init__(*args, **kwargs)
+        self.ordered_triples = {}
+
+    def add(self, triple):
+        self.ordered_triples[triple] = None
+        return super(OrderedGraph, self).add(triple)
+
+
 class BaseWriter(object):
     """
     Base class for all Writer classes.
@@ -43,14 +62,29 @@ class BaseWriter(object):
         self.out = out
         self.doap_namespace = Namespace("http://usefulinc.com/ns/doap#")
         self.spdx_namespace = Namespace("http://spdx.org/rdf/terms#")
-        self.graph = Graph()
+        self.graph = OrderedGraph()
+        self.blank_node_counts = {}
+
+    def create_blank_node(self, node_type: str, *content) -> BNode:
+        """
+        Return a new blank node with an id derived from its type and content,
+        so that the ids do not depend on the order of the graph. Nodes with the
+        same type and content are numbered in the order they are created.
+        """
+        digest = hashlib.sha1("\x00".join(map(str, content)).encode("utf-8")).hexdigest()[:16]
+        node_id = "{0}-{1}".format(node_type, digest)
+        count = self.blank_node_counts.get(node_id, 0) + 1
+        self.blank_node_counts[node_id] = count
+        if count > 1:
+            node_id = "{0}-{1}".format(node_id, count)
+        return BNode(node_id)
 
     def create_checksum_node(self, checksum: Checksum) -> BNode:
         """
         Return a node representing spdx.checksum.
         """
         algo = checksum.identifier.algorithm_to_rdf_representation() or 'checksumAlgorithm_sha1'
-        checksum_node = BNode()
+        checksum_node = self.create_blank_node("Checksum", algo, checksum.value)
         type_triple = (checksum_node, RDF.type, self.spdx_namespace.Checksum)
         self.graph.add(type_triple)
         algorithm_triple = (
@@ -94,23 +128,22 @@ class LicenseWriter(BaseWriter):
             self.licenses_from_tree_helper(current.license_1, licenses)
             self.licenses_from_tree_helper(current.license_2, licenses)
         else:
-            licenses.add(self.create_license_helper(current))
+            licenses.setdefault(self.create_license_helper(current))
 
     def licenses_from_tree(self, tree):
         """
         Traverse conjunctions and disjunctions like trees and return a
-        set of all licenses in it as nodes.
+        list of all distinct licenses in it as nodes, in the order of the tree.
         """
-        # FIXME: this is unordered!
-        licenses = set()
+        licenses = {}
         self.licenses_from_tree_helper(tree, licenses)
-        return licenses
+        return list(licenses)
 
     def create_conjunction_node(self, conjunction):
         """
         Return a node representing a conjunction of licenses.
         """
-        node = BNode()
+        node = self.create_blank_node("ConjunctiveLicenseSet", conjunction.identifier)
         type_triple = (node, RDF.type, self.spdx_namespace.ConjunctiveLicenseSet)
         self.graph.add(type_triple)
         licenses = self.licenses_from_tree(conjunction)
@@ -123,7 +156,7 @@ class LicenseWriter(BaseWriter):
         """
         Return a node representing a disjunction of licenses.
         """
-        node = BNode()
+        node = self.create_blank_node("DisjunctiveLicenseSet", disjunction.identifier)
         type_triple = (node, RDF.type, self.spdx_namespace.DisjunctiveLicenseSet)
         self.graph.add(type_triple)
         licenses = self.licenses_from_tree(disjunction)
@@ -167,7 +200,7 @@ class LicenseWriter(BaseWriter):
         if len(licenses) != 0:
             return licenses[0][0]  # return subject in first triple
         else:
-            license_node = BNode()
+            license_node = self.create_blank_node("ExtractedLicensingInfo", lic.identifier)
             type_triple = (
                 license_node,
                 RDF.type,
@@ -462,7 +495,7 @@ class ReviewInfoWriter(BaseWriter):
         """
         Return a review node.
         """
-        review_node = BNode()
+        review_node = self.create_blank_node("Review", review.reviewer, review.review_date_iso_format)
         type_triple = (review_node, RDF.type, self.spdx_namespace.Review)
         self.graph.add(type_triple)
 
@@ -552,7 +585,7 @@ class RelationshipInfoWriter(BaseWriter):
         """
         Return a relationship node.
         """
-        relationship_node = BNode()
+        relationship_node = self.create_blank_node("Relationship", relationship.relationship)
         type_triple = (relationship_node, RDF.type, self.spdx_namespace.Relationship)
         self.graph.add(type_triple)
 
@@ -615,7 +648,7 @@ class CreationInfoWriter(BaseWriter):
         """
         Add and return a creation info node to graph
         """
-        ci_node = BNode()
+        ci_node = self.create_blank_node("CreationInfo")
         # Type property
         type_triple = (ci_node, RDF.type, self.spdx_namespace.CreationInfo)
         self.graph.add(type_triple)
@@ -648,7 +681,8 @@ class ExternalDocumentRefWriter(BaseWriter):
         """
         Add and return a creation info node to graph
         """
-        ext_doc_ref_node = BNode()
+        ext_doc_ref_node = self.create_blank_node("ExternalDocumentRef",
+                                                  ext_document_references.external_document_id)
         type_triple = (
             ext_doc_ref_node,
             RDF.type,
@@ -690,12 +724,13 @@ class PackageWriter(LicenseWriter):
 
     def __init__(self, document, out):
         super(PackageWriter, self).__init__(document, out)
+        self.containment_index = None
 
     def package_verif_node(self, package):
         """
         Return a node representing package verification code.
         """
-        verif_node = BNode()
+        verif_node = self.create_blank_node("PackageVerificationCode", package.verif_code)
         type_triple = (
             verif_node,
             RDF.type,
@@ -893,7 +928,9 @@ class PackageWriter(LicenseWriter):
         Add hasFile triples to graph.
         Must be called after files have been added.
         """
-        files = get_files_in_package(package, self.document.files, self.document.relationships)
+        if self.containment_index is None:
+            self.containment_index = ContainmentIndex.from_document(self.document)
+        files = self.containment_index.files_in_package(package.spdx_id)
         file_nodes = map(self.handle_package_has_file_helper, files)
         triples = [
             (package_node, self.spdx_namespace.hasFile, node) for node in file_nodes
@@ -914,7 +951,8 @@ class PackageExternalRefWriter(BaseWriter):
         """
         Add and return an external package reference node to graph.
         """
-        pkg_ext_ref_node = BNode()
+        pkg_ext_ref_node = self.create_blank_node("ExternalRef", pkg_ext_refs.category, pkg_ext_refs.pkg_ext_ref_type,
+                                                  pkg_ext_refs.locator)
         pkg_ext_ref_triple = (
             pkg_ext_ref_node,
             RDF.type,
@@ -965,6 +1003,160 @@ class PackageExternalRefWriter(BaseWriter):
                 for ext_ref in package.pkg_ext_refs]
 
 
+class RdfXmlSerializer(object):
+    """
+    Serialize triples to RDF/XML nested like rdflib's "pretty-xml" serializer,
+    but in a defined order: namespaces sorted by prefix, and subjects and their
+    properties in the order of the triples, grouped by predicate like the
+    rdflib stores do. Together with the blank node ids of
+    BaseWriter.create_blank_node, this makes the output reproducible without
+    canonicalizing the graph.
+    """
+
+    MAX_DEPTH = 3
+    BOUND_NAMESPACES = {"rdf": str(RDF), "rdfs": str(RDFS)}
+    # RDF/XML syntax terms, not all of them are in rdflib.RDF
+    RDF_ROOT = URIRef(str(RDF) + "RDF")
+    DESCRIPTION = URIRef(str(RDF) + "Description")
+    ABOUT = URIRef(str(RDF) + "about")
+    NODE_ID = URIRef(str(RDF) + "nodeID")
+    RESOURCE = URIRef(str(RDF) + "resource")
+    DATATYPE = URIRef(str(RDF) + "datatype")
+
+    def __init__(self, triples):
+        objects_by_predicate = {}
+        self.reference_counts = {}
+        for subject, predicate, obj in triples:
+            objects_by_predicate.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+            self.reference_counts[obj] = self.reference_counts.get(obj, 0) + 1
+        self.properties = {
+            subject: [(predicate, obj) for predicate, objects in predicates.items() for obj in objects]
+            for subject, predicates in objects_by_predicate.items()
+        }
+        self.prefixes = {namespace: prefix for prefix, namespace in self.BOUND_NAMESPACES.items()}
+        self.generated_prefixes = 0
+        self.used_namespaces = {}
+        self.qnames = {}
+        self.serialized = set()
+        self.parts = []
+        self.element_stack = []
+        self.closed = True
+        self.parent = False
+
+    def qname(self, uri):
+        qname = self.qnames.get(uri)
+        if qname is None:
+            namespace, local_name = split_uri(uri)
+            prefix = self.prefixes.get(namespace)
+            if prefix is None:
+                self.generated_prefixes += 1
+                prefix = self.prefixes[namespace] = "ns{0}".format(self.generated_prefixes)
+            self.used_namespaces[prefix] = namespace
+            qname = self.qnames[uri] = "{0}:{1}".format(prefix, local_name)
+        return qname
+
+    def element_type(self, subject):
+        for predicate, obj in self.properties.get(subject, ()):
+            if predicate == RDF.type:
+                try:
+                    self.qname(obj)
+                except ValueError:
+                    return None
+                return obj
+        return None
+
+    def serialize(self, out):
+        # the namespaces of the predicates and types are declared on the root element
+        for properties in self.properties.values():
+            for predicate, obj in properties:
+                self.qname(predicate)
+                if predicate == RDF.type:
+                    try:
+                        self.qname(obj)
+                    except ValueError:
+                        pass
+        self.parts.append('<?xml version="1.0" encoding="utf-8"?>')
+        self.push(self.RDF_ROOT)
+        self.parts.append("\n")
+        for prefix, namespace in sorted(self.used_namespaces.items()):
+            self.parts.append('  xmlns:{0}="{1}"\n'.format(prefix, namespace))
+
+        # subjects that are not the object of a triple first, then all others
+        for subject in self.properties:
+            if subject not in self.reference_counts:
+                self.subject(subject, 1)
+        for subject in self.properties:
+            self.subject(subject, 1)
+
+        self.pop()
+        self.parts.append("\n")
+        out.write("".join(self.parts).encode("utf-8"))
+
+    def subject(self, subject, depth):
+        if subject in self.serialized:
+            return
+        self.serialized.add(subject)
+        element_type = self.element_type(subject)
+        self.push(element_type or self.DESCRIPTION)
+        if isinstance(subject, BNode):
+            self.attribute(self.NODE_ID, subject)
+        else:
+            self.attribute(self.ABOUT, subject)
+        for predicate, obj in self.properties.get(subject, ()):
+            if not (predicate == RDF.type and obj == element_type):
+                self.predicate(predicate, obj, depth + 1)
+        self.pop()
+
+    def predicate(self, predicate, obj, depth):
+        self.push(predicate)
+        if isinstance(obj, Literal):
+            if obj.language:
+                self.parts.append(" xml:lang={0}".format(quoteattr(obj.language)))
+            if obj.datatype:
+                self.attribute(self.DATATYPE, obj.datatype)
+            self.text(obj)
+        elif obj in self.serialized or obj not in self.properties:
+            self.attribute(self.NODE_ID if isinstance(obj, BNode) else self.RESOURCE, obj)
+        elif depth <= self.MAX_DEPTH or (isinstance(obj, BNode) and self.reference_counts[obj] == 1):
+            self.subject(obj, depth + 1)
+        else:
+            self.attribute(self.NODE_ID if isinstance(obj, BNode) else self.RESOURCE, obj)
+        self.pop()
+
+    def close_start_tag(self):
+        if not self.closed:
+            self.closed = True
+            self.parts.append(">")
+
+    def push(self, uri):
+        self.close_start_tag()
+        self.parts.append("\n{0}<{1}".format("  " * len(self.element_stack), self.qname(uri)))
+        self.element_stack.append(uri)
+        self.closed = False
+        self.parent = False
+
+    def pop(self):
+        uri = self.element_stack.pop()
+        if not self.closed:
+            self.closed = True
+            self.parts.append("/>")
+        else:
+            if self.parent:
+                self.parts.append("\n" + "  " * len(self.element_stack))
+            self.parts.append("</{0}>".format(self.qname(uri)))
+        self.parent = True
+
+    def attribute(self, uri, value):
+        self.parts.append(" {0}={1}".format(self.qname(uri), quoteattr(value)))
+
+    def text(self, text):
+        self.close_start_tag()
+        if "<" in text and ">" in text and "]]>" not in text:
+            self.parts.append("<![CDATA[{0}]]>".format(text))
+        else:
+            self.parts.append(escape(text, {"\r": "&#13;"}))
+
+
 class Writer(
     CreationInfoWriter,
     ReviewInfoWriter,
@@ -981,12 +1173,16 @@ class Writer(
     Call `write()` to start writing.
     """
 
-    def __init__(self, document, out):
+    def __init__(self, document, out, canonicalize=False):
         """
         - document is spdx.document instance that will be written.
         - out is a file-like object that will be written to.
+        - canonicalize: normalize the graph with rdflib.compare.to_isomorphic and
+          write it with rdflib's "pretty-xml" serializer, instead of writing it
+          in the order it was built with RdfXmlSerializer. This is much slower.
         """
         super(Writer, self).__init__(document, out)
+        self.canonicalize = canonicalize
 
     def create_doc(self):
         """
@@ -1061,20 +1257,23 @@ class Writer(
         for snippet in snippet_nodes:
             self.graph.add((doc_node, self.spdx_namespace.Snippet, snippet))
 
-        # normalize the graph to ensure that the sort order is stable
-        self.graph = to_isomorphic(self.graph)
-
-        # Write file
-        self.graph.serialize(self.out, "pretty-xml", encoding="utf-8")
+        if self.canonicalize:
+            # normalize the graph to ensure that the sort order is stable
+            self.graph = to_isomorphic(self.graph)
+            self.graph.serialize(self.out, "pretty-xml", encoding="utf-8")
+        else:
+            RdfXmlSerializer(self.graph.ordered_triples).serialize(self.out)
 
 
-def write_document(document, out, validate=True):
+def write_document(document, out, validate=True, canonicalize=False):
     """
     Write an SPDX RDF document.
     - document - spdx.document instance.
     - out - file like object that will be written to.
     Optionally `validate` the document before writing and raise
     InvalidDocumentError if document.validate returns False.
+    With `canonicalize`, the graph is normalized with rdflib before writing,
+    see Writer.
     """
 
     if validate:
@@ -1083,5 +1282,5 @@ def write_document(document, out, validate=True):
         if messages:
             raise InvalidDocumentError(messages)
 
-    writer = Writer(document, out)
+    writer = Writer(document, out, canonicalize)
     writer.write()
@@ -327,20 +327,10 @@ def write_extracted_licenses(lics, out):
     write_text_value("ExtractedText", lics.text, out)
 
 
-def write_document(document, out, validate=True):
+def write_document_info(document, out):
     """
-    Write an SPDX tag value document.
-    - document - spdx.document instance.
-    - out - file like object that will be written to.
-    Optionally `validate` the document before writing and raise
-    InvalidDocumentError if document.validate returns False.
+    Write the document information and the creation info to out.
     """
-    messages = ErrorMessages()
-    messages = document.validate(messages)
-    if validate and messages:
-        raise InvalidDocumentError(messages)
-
-    # Write out document information
     out.write("# Document Information\n\n")
     write_value("SPDXVersion", str(document.version), out)
     write_value("DataLicense", document.data_license.identifier, out)
@@ -368,6 +358,59 @@ def write_document(document, out, validate=True):
     write_creation_info(document.creation_info, out)
     write_separators(out)
 
+
+class WriterIndex(object):
+    """
+    The lookups of the tag-value writer, computed once per document:
+    - relationships_to_write: relationships not expressed by the containment
+      of files in packages, see utils.ContainmentIndex.
+    - files_by_package_id: files written after each package.
+    - snippets_by_file_id: snippets written after each file.
+    - packaged_file_ids, filed_snippet_ids: SPDX ids of the files and
+      snippets that are written after their package or file.
+    """
+
+    def __init__(self, document):
+        containment_index = utils.ContainmentIndex.from_document(document)
+        self.relationships_to_write = containment_index.relationships_to_write
+        self.files_by_package_id = containment_index.files_by_package_id
+        self.snippets_by_file_id = determine_files_containing_snippets(document.snippet, document.files)
+        self.packaged_file_ids = set(containment_index.package_ids_by_file_id)
+        self.filed_snippet_ids = {snippet.spdx_id for snippets in self.snippets_by_file_id.values()
+                                  for snippet in snippets}
+
+
+class ChunkBuffer(object):
+    """
+    File-like object that collects the strings written to it, to join them
+    into one chunk of output.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.write = self.parts.append
+
+    def take(self):
+        """
+        Return the strings written since the last call as one string.
+        """
+        chunk = "".join(self.parts)
+        self.parts.clear()
+        return chunk
+
+
+def iter_document_chunks(document, index=None):
+    """
+    Yield the tag-value output of document in chunks: the document and
+    creation info with the reviews, annotations and relationships, each
+    snippet and file that is not written with its file or package, each
+    package with its files and their snippets, and the extracted licenses.
+    """
+    if index is None:
+        index = WriterIndex(document)
+    out = ChunkBuffer()
+    write_document_info(document, out)
+
     # Write sorted reviews
     if document.reviews:
         out.write("# Reviews\n\n")
@@ -384,46 +427,34 @@ def write_document(document, out, validate=True):
             write_separator(out)
         write_separator(out)
 
-    relationships_to_write, contained_files_by_package_id = scan_relationships(document.relationships,
-                                                                               document.packages, document.files)
-    contained_snippets_by_file_id = determine_files_containing_snippets(document.snippet, document.files)
-    packaged_file_ids = [file.spdx_id for files_list in contained_files_by_package_id.values()
-                         for file in files_list]
-    filed_snippet_ids = [snippet.spdx_id for snippets_list in contained_snippets_by_file_id.values()
-                         for snippet in snippets_list]
-
     # Write Relationships
-    if relationships_to_write:
+    if index.relationships_to_write:
         out.write("# Relationships\n\n")
-        for relationship in relationships_to_write:
+        for relationship in index.relationships_to_write:
             write_relationship(relationship, out)
         write_separators(out)
+    yield out.take()
 
     # Write snippet info
     for snippet in document.snippet:
-        if snippet.spdx_id not in filed_snippet_ids:
+        if snippet.spdx_id not in index.filed_snippet_ids:
             write_snippet(snippet, out)
             write_separators(out)
+            yield out.take()
 
     # Write file info
     for file in document.files:
-        if file.spdx_id not in packaged_file_ids:
-            write_file(file, out)
-            write_separators(out)
-            if file.spdx_id in contained_snippets_by_file_id:
-                write_snippets(contained_snippets_by_file_id[file.spdx_id], out)
+        if file.spdx_id not in index.packaged_file_ids:
+            write_file_with_snippets(file, index, out)
+            yield out.take()
 
     # Write out package info
     for package in document.packages:
         write_package(package, out)
         write_separators(out)
-        if package.spdx_id in contained_files_by_package_id:
-            for file in contained_files_by_package_id[package.spdx_id]:
-                write_file(file, out)
-                write_separators(out)
-                if file.spdx_id in contained_snippets_by_file_id:
-                    write_snippets(contained_snippets_by_file_id[file.spdx_id], out)
-                    break
+        for file in index.files_by_package_id.get(package.spdx_id, ()):
+            write_file_with_snippets(file, index, out)
+        yield out.take()
 
     if document.extracted_licenses:
         out.write("# Extracted Licenses\n\n")
@@ -431,6 +462,39 @@ def write_document(document, out, validate=True):
             write_extracted_licenses(lic, out)
             write_separator(out)
         write_separator(out)
+        yield out.take()
+
+
+def write_document(document, out, validate=True, streaming=True):
+    """
+    Write an SPDX tag value document.
+    - document - spdx.document instance.
+    - out - file like object that will be written to.
+    Optionally `validate` the document before writing and raise
+    InvalidDocumentError if document.validate returns False.
+    The output is assembled in chunks, see iter_document_chunks. With
+    `streaming`, each chunk is written to out as soon as it is complete,
+    so that the output of one package at a time is held in memory,
+    otherwise the whole output is written at once.
+    """
+    if validate:
+        messages = ErrorMessages()
+        messages = document.validate(messages)
+        if messages:
+            raise InvalidDocumentError(messages)
+
+    chunks = iter_document_chunks(document)
+    if streaming:
+        for chunk in chunks:
+            out.write(chunk)
+    else:
+        out.write("".join(chunks))
+
+
+def write_file_with_snippets(file, index, out):
+    write_file(file, out)
+    write_separators(out)
+    write_snippets(index.snippets_by_file_id.get(file.spdx_id, ()), out)
 
 
 def write_snippets(snippets_to_write: List, out: TextIO) -> None:
@@ -441,35 +505,17 @@ def write_snippets(snippets_to_write: List, out: TextIO) -> None:
 
 def scan_relationships(relationships: List[Relationship], packages: List[Package], files: List[File]) \
         -> Tuple[List, Dict]:
-    contained_files_by_package_id = dict()
-    relationships_to_write = []
-    files_by_spdx_id = {file.spdx_id: file for file in files}
-    packages_spdx_ids = [package.spdx_id for package in packages]
-    for relationship in relationships:
-        if relationship.relationship_type == "CONTAINS" and \
-            relationship.spdx_element_id in packages_spdx_ids and \
-                relationship.related_spdx_element in files_by_spdx_id.keys():
-            contained_files_by_package_id.setdefault(relationship.spdx_element_id, []).append(
-                files_by_spdx_id[relationship.related_spdx_element])
-            if relationship.has_comment:
-                relationships_to_write.append(relationship)
-        elif relationship.relationship_type == "CONTAINED_BY" and \
-            relationship.related_spdx_element in packages_spdx_ids and \
-                relationship.spdx_element_id in files_by_spdx_id:
-            contained_files_by_package_id.setdefault(relationship.related_spdx_element, []).append(
-                files_by_spdx_id[relationship.spdx_element_id])
-            if relationship.has_comment:
-                relationships_to_write.append(relationship)
-        else:
-            relationships_to_write.append(relationship)
-
+    containment_index = utils.ContainmentIndex(packages, files, relationships)
+    relationships_to_write = containment_index.relationships_to_write
+    contained_files_by_package_id = containment_index.files_by_package_id
     return relationships_to_write, contained_files_by_package_id
 
 
 def determine_files_containing_snippets(snippets: List[Snippet], files: List[File]) -> Dict:
+    file_ids = {file.spdx_id for file in files}
     contained_snippets_by_file_id = dict()
     for snippet in snippets:
-        if snippet.snip_from_file_spdxid in [file.spdx_id for file in files]:
+        if snippet.snip_from_file_spdxid in file_ids:
             contained_snippets_by_file_id.setdefault(snippet.snip_from_file_spdxid, []).append(snippet)
 
     return contained_snippets_by_file_id
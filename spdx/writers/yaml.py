@@ -9,15 +9,88 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Iterator
+
 import yaml
+from yaml.events import (DocumentEndEvent, DocumentStartEvent, MappingEndEvent, MappingStartEvent, ScalarEvent,
+                         SequenceEndEvent, SequenceStartEvent, StreamEndEvent, StreamStartEvent)
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
 
 from spdx.writers.tagvalue import InvalidDocumentError
 from spdx.writers.jsonyamlxml import Writer
 from spdx.parsers.loggers import ErrorMessages
 
+# the libyaml based dumper if PyYAML was built with it
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+DUMP_OPTIONS = {"indent": 2, "explicit_start": True, "encoding": "utf-8", "default_flow_style": False}
+
+
+def iter_node_events(dumper, node):
+    """
+    Yield the events of a represented node, like yaml.Serializer.serialize_node
+    does for nodes without aliases.
+    """
+    if isinstance(node, ScalarNode):
+        detected_tag = dumper.resolve(ScalarNode, node.value, (True, False))
+        default_tag = dumper.resolve(ScalarNode, node.value, (False, True))
+        implicit = (node.tag == detected_tag), (node.tag == default_tag)
+        yield ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+    elif isinstance(node, SequenceNode):
+        implicit = node.tag == dumper.resolve(SequenceNode, node.value, True)
+        yield SequenceStartEvent(None, node.tag, implicit, flow_style=node.flow_style)
+        for item in node.value:
+            yield from iter_node_events(dumper, item)
+        yield SequenceEndEvent()
+    elif isinstance(node, MappingNode):
+        implicit = node.tag == dumper.resolve(MappingNode, node.value, True)
+        yield MappingStartEvent(None, node.tag, implicit, flow_style=node.flow_style)
+        for key, value in node.value:
+            yield from iter_node_events(dumper, key)
+            yield from iter_node_events(dumper, value)
+        yield MappingEndEvent()
+
+
+def iter_value_events(dumper, value):
+    """
+    Represent value on its own and yield its events. Objects are not shared
+    with earlier values, so no aliases are needed.
+    """
+    dumper.represented_objects = {}
+    dumper.object_keeper = []
+    dumper.alias_key = None
+    yield from iter_node_events(dumper, dumper.represent_data(value))
 
-def write_document(document, out, validate=True):
 
+def iter_document_events(dumper, document_fields):
+    """
+    Yield the events of a YAML stream holding the document given by its
+    (field name, value) pairs, with sorted keys like yaml.safe_dump. Iterator
+    values are represented one element at a time.
+    """
+    yield StreamStartEvent(encoding=DUMP_OPTIONS["encoding"])
+    yield DocumentStartEvent(explicit=DUMP_OPTIONS["explicit_start"])
+    yield MappingStartEvent(None, yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, True, flow_style=False)
+    for field, value in sorted(document_fields, key=lambda field_value: field_value[0]):
+        yield from iter_value_events(dumper, field)
+        if isinstance(value, Iterator):
+            yield SequenceStartEvent(None, yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, True, flow_style=False)
+            for element in value:
+                yield from iter_value_events(dumper, element)
+            yield SequenceEndEvent()
+        else:
+            yield from iter_value_events(dumper, value)
+    yield MappingEndEvent()
+    yield DocumentEndEvent(explicit=False)
+    yield StreamEndEvent()
+
+
+def write_document(document, out, validate=True, streaming=False):
+    """
+    Write document as YAML to out, with the libyaml dumper if available. With
+    `streaming`, the packages, files, snippets and relationships are
+    represented and written one at a time instead of building the whole
+    document object first. The output is the same.
+    """
     if validate:
         messages = ErrorMessages()
         messages = document.validate(messages)
@@ -25,6 +98,14 @@ def write_document(document, out, validate=True):
             raise InvalidDocumentError(messages)
 
     writer = Writer(document)
-    document_object = writer.create_document()
+    if streaming:
+        dumper = SafeDumper(out, **DUMP_OPTIONS)
+        try:
+            for event in iter_document_events(dumper, writer.iter_document_fields()):
+                dumper.emit(event)
+        finally:
+            dumper.dispose()
+        return
 
-    yaml.safe_dump(document_object, out, indent=2, explicit_start=True, encoding='utf-8')
+    document_object = writer.create_document()
+    yaml.dump(document_object, out, Dumper=SafeDumper, **DUMP_OPTIONS)
@@ -0,0 +1,80 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from benchmarks import document_diff, formats, model_memory, relationship_graph, tagvalue_lexer, yaml_json
+from spdx.synthetic import create_document
+
+
+def test_synthetic_document_is_valid():
+    document = create_document(packages=2, files_per_package=3, snippets=2, relationships=2, annotations=2,
+                               license_depth=4)
+
+    assert not document.validate()
+    assert len(document.files) == 6
+
+
+def test_format_benchmarks():
+    parameters = {"packages": 1, "files_per_package": 1, "snippets": 1, "relationships": 0, "annotations": 1,
+                  "license_depth": 2}
+
+    report = formats.run_benchmarks(parameters, ["json"], memory=True)
+
+    assert report["parameters"] == parameters
+    assert [(result["operation"], result["format"]) for result in report["results"]] == \
+           [("validate", None), ("write", "json"), ("parse", "json")]
+    assert not report["results"][2]["error"]
+    assert report["results"][2]["elements"] == report["elements"]
+
+
+def test_tagvalue_lexer_benchmark():
+    parameters = {"packages": 2, "files_per_package": 3, "snippets": 1, "relationships": 1, "annotations": 1,
+                  "license_depth": 2}
+
+    report = tagvalue_lexer.run_benchmarks(parameters, repeat=1)
+
+    assert report["same_tokens"]
+    assert [result["lexer"] for result in report["results"]] == ["ply", "line"]
+
+
+def test_yaml_json_benchmark():
+    parameters = {"packages": 1, "files_per_package": 2, "snippets": 1, "relationships": 1, "annotations": 1,
+                  "license_depth": 2}
+
+    report = yaml_json.run_benchmarks(parameters, repeat=1)
+
+    assert [result["variant"] for result in report["results"]] == list(yaml_json.VARIANTS)
+    for result in report["results"]:
+        assert not result["error"]
+        assert result["elements"] == report["elements"]
+
+
+def test_model_memory_benchmark():
+    report = model_memory.run_benchmarks(count=10)
+
+    assert [result["class"] for result in report["results"]] == list(model_memory.ELEMENT_FACTORIES)
+    assert all(result["bytes_per_element"] > 0 for result in report["results"])
+
+
+def test_relationship_graph_benchmark():
+    report = relationship_graph.run_benchmarks([100], files_per_package=4)
+
+    assert [result["benchmark"] for result in report["results"]] == \
+           ["build", "dependencies", "dependents", "closure", "cycles"]
+    assert all(result["relationships"] == 100 for result in report["results"])
+    assert report["results"][3]["reached"] == 100
+
+
+def test_document_diff_benchmark():
+    report = document_diff.run_benchmarks([20], files_per_package=10)
+
+    assert [result["benchmark"] for result in report["results"]] == ["documents", "streaming"]
+    # two changed licenses, the renamed file and the new package
+    assert all(result["differences"] == 4 for result in report["results"])
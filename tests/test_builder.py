@@ -449,6 +449,7 @@ class TestRelationshipBuilder(TestCase):
         assert self.builder.add_relationship_comment(self.document, comment)
         self.add_relationship()
         assert self.builder.add_relationship_comment(self.document, comment)
+        assert self.document.relationships[-1].relationship_comment == "Relationship Comment"
 
     @testing_utils.raises(builders.SPDXValueError)
     def test_relationship_comment_value(self):
@@ -461,6 +462,16 @@ class TestRelationshipBuilder(TestCase):
         relationship = "SPDXRef-DOCUMENT DESCRIBES SPDXRef-File"
         assert self.builder.add_relationship(self.document, relationship)
 
+    def test_relationship_comment_of_repeated_relationship(self):
+        self.add_relationship()
+        assert self.builder.add_relationship(self.document, "SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package")
+        self.add_relationship()
+        assert self.builder.add_relationship_comment(self.document, "<text>Relationship Comment</text>")
+        assert [relationship.relationship for relationship in self.document.relationships] == [
+            "SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package", "SPDXRef-DOCUMENT DESCRIBES SPDXRef-File"]
+        assert self.document.relationships[1].relationship_comment == "Relationship Comment"
+        assert self.document.get_relationships_from("SPDXRef-DOCUMENT") == self.document.relationships
+
     def add_relationship(self):
         relate_str = "SPDXRef-DOCUMENT DESCRIBES SPDXRef-File"
         self.builder.add_relationship(self.document, relate_str)
@@ -0,0 +1,91 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+
+import pytest
+
+from spdx import hashing, utils
+from spdx.checksum import ChecksumAlgorithm
+from spdx.checksum_cache import ChecksumCache, file_identity
+from spdx.file import File
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ChecksumCache(str(tmp_path / "checksums.sqlite"))
+    hashing.set_checksum_cache(cache)
+    yield cache
+    hashing.set_checksum_cache(None)
+    cache.close()
+
+
+@pytest.fixture
+def test_file(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"some content")
+    return str(path)
+
+
+def test_cache_hits_and_misses(cache, test_file):
+    file = File(test_file)
+
+    assert file.calculate_checksum() == hashlib.sha1(b"some content").hexdigest()
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert file.calculate_checksum() == hashlib.sha1(b"some content").hexdigest()
+    assert (cache.hits, cache.misses) == (1, 1)
+    # an algorithm not cached yet is a miss
+    file.calculate_checksum(ChecksumAlgorithm.MD5)
+    assert (cache.hits, cache.misses) == (1, 2)
+    utils.calc_verif_code([file])
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_cache_detects_modified_file(cache, test_file):
+    hashing.calculate_checksums(test_file, [ChecksumAlgorithm.SHA1])
+    stat_result = os.stat(test_file)
+    with open(test_file, "wb") as file_handle:
+        file_handle.write(b"other content")
+    os.utime(test_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+
+    checksums = hashing.calculate_checksums(test_file, [ChecksumAlgorithm.SHA1])
+
+    assert checksums[ChecksumAlgorithm.SHA1] == hashlib.sha1(b"other content").hexdigest()
+    assert cache.misses == 2
+
+
+def test_cache_persists_and_force(tmp_path, test_file):
+    cache_path = str(tmp_path / "checksums.sqlite")
+    with ChecksumCache(cache_path) as cache:
+        cache.put(file_identity(test_file), {ChecksumAlgorithm.SHA1: "cached"})
+
+    with ChecksumCache(cache_path) as cache:
+        assert cache.get(file_identity(test_file), [ChecksumAlgorithm.SHA1]) == {ChecksumAlgorithm.SHA1: "cached"}
+
+    with ChecksumCache(cache_path, force=True) as cache:
+        assert cache.get(file_identity(test_file), [ChecksumAlgorithm.SHA1]) is None
+        assert cache.misses == 1
+
+
+def test_cache_eviction(tmp_path):
+    with ChecksumCache(str(tmp_path / "checksums.sqlite"), max_entries=2) as cache:
+        for number in range(3):
+            identity = file_identity(str(tmp_path))._replace(path="file{}".format(number))
+            cache.put(identity, {ChecksumAlgorithm.SHA1: str(number)})
+        cache.evict()
+
+        assert cache.connection.execute("SELECT COUNT(*) FROM checksums").fetchone()[0] == 2
+
+        cache.max_age = -1
+        cache.evict()
+
+        assert cache.connection.execute("SELECT COUNT(*) FROM checksums").fetchone()[0] == 0
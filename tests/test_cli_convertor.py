@@ -12,7 +12,11 @@
 import os
 from unittest import TestCase
 
+import pytest
+
+from spdx.cli_tools import batch
 from spdx.cli_tools.convertor import determine_infile_and_outfile
+from spdx.parsers import tagvalue, tagvaluebuilders
 
 from tests.testing_utils import raises
 
@@ -81,3 +85,65 @@ class TestConvertor(TestCase):
         to = None
 
         infile, outfile = determine_infile_and_outfile(infile_given, outfile_given, src, from_, to)
+
+
+def test_collect_conversions(tmp_path):
+    source = tmp_path / "source"
+    (source / "nested").mkdir(parents=True)
+    (source / "a.tag").write_text("")
+    (source / "nested" / "b.rdf.xml").write_text("")
+    (source / "README.md").write_text("")
+    manifest = tmp_path / "manifest"
+    manifest.write_text("# comment\nc.spdx\td/c.json\ne.yml\n")
+    outdir = str(tmp_path / "out")
+
+    conversions = batch.collect_conversions([str(source)], outdir, "json", manifest=str(manifest))
+
+    assert conversions == [
+        (str(source / "a.tag"), os.path.join(outdir, "a.json")),
+        (str(source / "nested" / "b.rdf.xml"), os.path.join(outdir, "nested", "b.json")),
+        ("c.spdx", "d/c.json"),
+        ("e.yml", os.path.join(outdir, "e.json")),
+    ]
+    assert batch.collect_conversions([str(source)], outdir, "json", from_="tag") == conversions[:1]
+
+
+def test_collect_conversions_with_conflicting_outfiles(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "a.tag").write_text("")
+    (source / "a.spdx").write_text("")
+    (source / "b.json").write_text("")
+
+    with pytest.raises(ValueError, match="a.json is the output of"):
+        batch.collect_conversions([str(source)], str(tmp_path / "out"), "json", from_="tag")
+    with pytest.raises(ValueError, match="b.json would overwrite an input file"):
+        batch.collect_conversions([str(source / "b.json")], str(source), "json")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_convert_files(tmp_path, jobs):
+    sources = [os.path.join(os.path.dirname(__file__), "data", "formats", name)
+               for name in ["SPDXTagExample.tag", "SPDXSimpleTag.tag"]]
+    conversions = batch.collect_conversions(sources + ["missing.tag"], str(tmp_path), "json")
+
+    results = {os.path.basename(result["infile"]): result for result in batch.convert_files(conversions, jobs=jobs)}
+
+    assert {name: result["status"] for name, result in results.items()} == {
+        "SPDXTagExample.tag": "ok", "SPDXSimpleTag.tag": "ok", "missing.tag": "error"}
+    assert os.path.isfile(str(tmp_path / "SPDXTagExample.json"))
+    assert os.path.isfile(str(tmp_path / "SPDXSimpleTag.json"))
+    assert not os.path.exists(str(tmp_path / "missing.json"))
+
+
+def test_convert_files_reuses_parsers(tmp_path):
+    source = os.path.join(os.path.dirname(__file__), "data", "formats", "SPDXTagExample.tag")
+    conversions = [(source, str(tmp_path / "first.json")), (source, str(tmp_path / "second.json"))]
+
+    results = list(batch.convert_files(conversions, jobs=1))
+
+    assert [result["status"] for result in results] == ["ok", "ok"]
+    assert (tmp_path / "first.json").read_text() == (tmp_path / "second.json").read_text()
+    parser = batch.get_parser(tagvalue, tagvaluebuilders)
+    assert batch.parse_with_cached_parser(source)[0] is not batch.parse_with_cached_parser(source)[0]
+    assert batch.get_parser(tagvalue, tagvaluebuilders) is parser
@@ -12,7 +12,9 @@
 
 from unittest import TestCase
 
-from spdx import config
+import codecs
+
+from spdx import _build_license_lists, config
 from spdx.version import Version
 
 
@@ -43,3 +45,17 @@ class TestLicenseList(TestCase):
         assert exception_map['openvpn-openssl-exception'] == 'OpenVPN OpenSSL Exception'
         assert exception_map['Qt GPL exception 1.0'] == 'Qt-GPL-exception-1.0'
         assert exception_map['Qt-GPL-exception-1.0'] == 'Qt GPL exception 1.0'
+
+    def test_license_list_data_is_current(self):
+        with codecs.open(_build_license_lists.LICENSE_LIST_DATA_FILE, "r", encoding="utf-8") as data_file:
+            assert data_file.read() == _build_license_lists.generate_license_list_data()
+
+    def test_lazy_maps_match_license_lists(self):
+        licenses_map = config.LazyLicenseMap(config.license_list_data.LICENSES)
+        assert not licenses_map.loaded
+        assert licenses_map['MIT'] == 'MIT License'
+        assert licenses_map.loaded
+
+        assert dict(config.LICENSE_MAP) == config.load_license_list(config._licenses)[1]
+        assert dict(config.EXCEPTION_MAP) == config.load_exception_list(config._exceptions)[1]
+        assert 'Apache-2.0' in config.LICENSE_MAP.keys()
@@ -9,18 +9,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
+import pickle
 import shutil
 import tempfile
 import unittest
 from datetime import datetime
-from unittest import TestCase
+from unittest import TestCase, mock
+
+from spdx.synthetic import create_document as create_synthetic_document
 
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.config import LICENSE_MAP, EXCEPTION_MAP
 from spdx.creationinfo import Tool
 from spdx.document import Document, ExternalDocumentRef
-from spdx.license import License
+from spdx.license import ExtractedLicense, License, LicenseConjunction, LicenseDisjunction
 from spdx.file import File, FileType
 from spdx.package import Package, PackagePurpose
 from spdx.parsers.loggers import ErrorMessages
@@ -164,6 +168,195 @@ class TestDocument(TestCase):
         messages = doc.validate()
         assert len(messages.messages) == 0
 
+    def test_document_spdx_id_indexes(self):
+        doc = Document(Version(2, 1), License.from_identifier("CC0-1.0"),
+                       'Sample_Document_V2.1', spdx_id='SPDXRef-DOCUMENT')
+        package = Package(name='some/path', download_location=NoAssert())
+        doc.add_package(package)
+        # the id of an added element may be set later, as the parsers do
+        package.spdx_id = 'SPDXRef-Package'
+        file1 = File('./some/path/tofile', spdx_id='SPDXRef-File1')
+        doc.add_file(file1)
+        contains = create_relationship(package.spdx_id, RelationshipType.CONTAINS, file1.spdx_id)
+        doc.add_relationship(contains)
+        describes = create_relationship(doc.spdx_id, RelationshipType.DESCRIBES, package.spdx_id)
+        doc.add_relationship(describes)
+
+        assert doc.get_element('SPDXRef-Package') is package
+        assert doc.get_element('SPDXRef-File1') is file1
+        assert doc.get_element('SPDXRef-Unknown') is None
+        assert doc.get_relationships_from('SPDXRef-Package') == [contains]
+        assert doc.get_relationships_to('SPDXRef-Package') == [describes]
+        assert doc.get_relationships_to('SPDXRef-File1') == [contains]
+
+        file2 = File('./some/path/tofile2', spdx_id='SPDXRef-File2')
+        doc.files.append(file2)
+        doc.relationships.remove(contains)
+
+        assert doc.get_element('SPDXRef-File2') is file2
+        assert doc.get_relationships_from('SPDXRef-Package') == []
+
+        file2.spdx_id = 'SPDXRef-File3'
+
+        assert doc.get_element('SPDXRef-File2') is None
+        assert doc.get_element('SPDXRef-File3') is file2
+
+    def test_document_spdx_id_indexes_detect_replacements(self):
+        doc = Document(Version(2, 1), License.from_identifier("CC0-1.0"),
+                       'Sample_Document_V2.1', spdx_id='SPDXRef-DOCUMENT')
+        package1 = Package(name='some/path', spdx_id='SPDXRef-Package1', download_location=NoAssert())
+        doc.add_package(package1)
+        describes = create_relationship(doc.spdx_id, RelationshipType.DESCRIBES, package1.spdx_id)
+        doc.add_relationship(describes)
+        assert doc.get_element('SPDXRef-Package1') is package1
+
+        package2 = Package(name='some/other/path', spdx_id='SPDXRef-Package2', download_location=NoAssert())
+        doc.packages[0] = package2
+
+        assert doc.get_element('SPDXRef-Package1') is None
+        assert doc.get_element('SPDXRef-Package2') is package2
+
+        describes.relationship = 'SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package2'
+
+        assert doc.get_relationships_to('SPDXRef-Package1') == []
+        assert doc.get_relationships_to('SPDXRef-Package2') == [describes]
+
+        doc.packages = [package1]
+
+        assert doc.get_element('SPDXRef-Package1') is package1
+        assert doc.get_element('SPDXRef-Package2') is None
+
+    def test_document_keeps_assigned_lists(self):
+        doc = Document(Version(2, 1), License.from_identifier("CC0-1.0"),
+                       'Sample_Document_V2.1', spdx_id='SPDXRef-DOCUMENT')
+        files = []
+        doc.files = files
+        file1 = File('./some/path/tofile', spdx_id='SPDXRef-File1')
+        files.append(file1)
+
+        assert doc.files is files
+        assert doc.files == [file1]
+        assert doc.get_element('SPDXRef-File1') is file1
+
+    def test_document_spdx_id_indexes_only_detect_their_replacements(self):
+        doc1 = Document(Version(2, 1), License.from_identifier("CC0-1.0"),
+                        'Sample_Document_V2.1', spdx_id='SPDXRef-DOCUMENT')
+        doc2 = Document(Version(2, 1), License.from_identifier("CC0-1.0"),
+                        'Sample_Document_V2.1', spdx_id='SPDXRef-DOCUMENT')
+        package1 = Package(name='some/path', spdx_id='SPDXRef-Package1', download_location=NoAssert())
+        package2 = Package(name='some/path', spdx_id='SPDXRef-Package2', download_location=NoAssert())
+        doc1.add_package(package1)
+        doc2.add_package(package2)
+        assert doc1.get_element('SPDXRef-Package1') is package1
+        assert doc2.get_element('SPDXRef-Package2') is package2
+
+        with mock.patch.object(doc1, 'rebuild_indexes') as rebuild_indexes:
+            package2.spdx_id = 'SPDXRef-Package3'
+            assert doc1.get_element('SPDXRef-Package1') is package1
+            rebuild_indexes.assert_not_called()
+        assert doc2.get_element('SPDXRef-Package3') is package2
+
+    def test_document_remove_and_replace_relationship(self):
+        doc = Document(Version(2, 1), License.from_identifier("CC0-1.0"),
+                       'Sample_Document_V2.1', spdx_id='SPDXRef-DOCUMENT')
+        describes = create_relationship(doc.spdx_id, RelationshipType.DESCRIBES, 'SPDXRef-Package1')
+        depends_on = create_relationship('SPDXRef-Package1', RelationshipType.DEPENDS_ON, 'SPDXRef-Package2')
+        doc.add_relationship(describes)
+        doc.add_relationship(depends_on)
+        assert doc.get_relationships_from('SPDXRef-Package1') == [depends_on]
+
+        with mock.patch.object(doc, 'rebuild_indexes') as rebuild_indexes:
+            contains = create_relationship('SPDXRef-Package1', RelationshipType.CONTAINS, 'SPDXRef-File1')
+            doc.replace_relationship(depends_on, contains)
+            assert doc.relationships == [describes, contains]
+            assert doc.get_relationships_from('SPDXRef-Package1') == [contains]
+            assert doc.get_relationships_to('SPDXRef-Package2') == []
+
+            doc.remove_relationship(describes)
+            assert doc.relationships == [contains]
+            assert doc.get_relationships_from('SPDXRef-DOCUMENT') == []
+            assert doc.get_relationships_to('SPDXRef-File1') == [contains]
+            rebuild_indexes.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            doc.remove_relationship(describes)
+
+    def _get_invalid_synthetic_doc(self):
+        doc = create_synthetic_document(packages=3, files_per_package=5, snippets=3, relationships=3, annotations=3)
+        doc.files[1].conc_lics = 'MIT'
+        doc.files[4].spdx_id = None
+        doc.packages[2].download_location = None
+        doc.snippet[0].snip_from_file_spdxid = None
+        doc.add_relationship(Relationship('SPDXRef-Package0 NOT_A_TYPE SPDXRef-Package1'))
+        return doc
+
+    def test_document_validate_in_parallel(self):
+        doc = self._get_invalid_synthetic_doc()
+
+        messages = doc.validate(max_workers=2)
+
+        assert len(messages.messages) == 5
+        assert messages == doc.validate()
+
+    def test_document_validate_incrementally(self):
+        doc = self._get_invalid_synthetic_doc()
+        expected_messages = doc.validate().messages
+
+        assert doc.validate(incremental=True) == expected_messages
+        with mock.patch.object(File, 'validate', autospec=True, side_effect=File.validate) as validate_file:
+            assert doc.validate(incremental=True) == expected_messages
+            # only the files with errors are validated again
+            assert validate_file.call_count == 2
+
+            doc.files[1].conc_lics = NoAssert()
+            doc.files[2].conc_lics = 'MIT'
+            doc.invalidate_validation(doc.files[2])
+            doc.add_file(File('./new_file.c'))
+            validate_file.reset_mock()
+            messages = doc.validate(incremental=True)
+            # the files with errors, the invalidated file and the new file
+            assert validate_file.call_count == 4
+            assert messages == doc.validate()
+
+            doc.invalidate_validation()
+            validate_file.reset_mock()
+            doc.validate(incremental=True)
+            assert validate_file.call_count == len(doc.files)
+
+    def test_document_validate_incrementally_detects_changes(self):
+        doc = create_synthetic_document(packages=2, files_per_package=2, snippets=1, relationships=1, annotations=1)
+        assert not doc.validate(incremental=True)
+
+        doc.files[0].conc_lics = 'not a license'
+        doc.files[0].checksums = {}
+        doc.packages[0].add_lics_from_file('not a license either')
+        doc.relationships[0].relationship = 'SPDXRef-DOCUMENT NOT_A_TYPE SPDXRef-Package0'
+
+        messages = doc.validate(incremental=True)
+        assert len(messages) == 4
+        assert messages == doc.validate()
+
+        doc.files[0].conc_lics = NoAssert()
+        doc.files[0].set_checksum(Checksum(ChecksumAlgorithm.SHA1, 'd6a770ba38583ed4bb4525bd96e50461655d2758'))
+        doc.packages[0].licenses_from_files.pop()
+        doc.relationships[0].relationship = 'SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package0'
+        assert not doc.validate(incremental=True)
+
+    def test_document_validate_incrementally_after_writing(self):
+        from spdx.writers.tagvalue import write_document
+        doc = create_synthetic_document(packages=2, files_per_package=2, snippets=1, relationships=1, annotations=1)
+        assert not doc.validate(incremental=True)
+
+        # writing reads the lazily created collections of the elements, which is not a change
+        write_document(doc, io.StringIO(), validate=False)
+
+        with mock.patch.object(File, 'validate', autospec=True, side_effect=File.validate) as validate_file, \
+                mock.patch.object(Package, 'validate', autospec=True, side_effect=Package.validate) as validate_package:
+            assert not doc.validate(incremental=True)
+            validate_file.assert_not_called()
+            validate_package.assert_not_called()
+
+
 class TestWriters(TestCase):
     maxDiff = None
 
@@ -608,6 +801,35 @@ class TestLicense(TestCase):
         assert mit.full_name == 'MIT License'
         assert mit.url == 'http://spdx.org/licenses/MIT'
 
+    def test_equal_licenses_are_interned(self):
+        mit = License.from_identifier('MIT')
+        expression = LicenseConjunction(mit, LicenseDisjunction(License.from_identifier('Apache-2.0'),
+                                                                License.from_identifier('LicenseRef-1')))
+
+        assert License(full_name='MIT License', identifier='MIT') is mit
+        assert LicenseConjunction(License.from_full_name('MIT License'), expression.license_2) is expression
+        assert expression.identifier == 'MIT AND (Apache-2.0 OR LicenseRef-1)'
+        assert hash(expression) == hash(expression.identifier)
+        assert pickle.loads(pickle.dumps(expression)) is expression
+
+    def test_licenses_are_immutable(self):
+        mit = License.from_identifier('MIT')
+        expression = LicenseDisjunction(mit, mit)
+
+        with self.assertRaises(AttributeError):
+            mit.identifier = 'Apache-2.0'
+        with self.assertRaises(AttributeError):
+            expression.license_1 = License.from_identifier('Apache-2.0')
+
+    def test_expression_of_extracted_license_follows_its_changes(self):
+        extracted_license = ExtractedLicense('LicenseRef-1')
+        expression = LicenseConjunction(License.from_identifier('MIT'), extracted_license)
+
+        extracted_license.full_name = 'Custom License'
+
+        assert expression.full_name == 'MIT License AND Custom License'
+        assert expression is not LicenseConjunction(License.from_identifier('MIT'), extracted_license)
+
 
 class TestException(TestCase):
 
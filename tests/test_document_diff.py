@@ -0,0 +1,104 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from spdx.synthetic import create_document
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.cli_tools.diff import main
+from spdx.document_diff import diff_documents, diff_files
+from spdx.license import License
+from spdx.package import Package
+from spdx.relationship import Relationship
+from spdx.writers import json as json_writer
+from spdx.writers import xml as xml_writer
+from spdx.writers import yaml as yaml_writer
+from tests import utils_test
+
+
+def create_documents():
+    old_document = create_document(packages=2, files_per_package=3, snippets=2, relationships=1, annotations=2)
+    new_document = create_document(packages=2, files_per_package=3, snippets=2, relationships=1, annotations=2)
+    new_document.packages[0].version = "2.0"
+    new_document.files[1].conc_lics = License.from_identifier("MIT")
+    new_document.files[2].spdx_id = "SPDXRef-Renamed"
+    new_document.files[3].set_checksum(Checksum(ChecksumAlgorithm.SHA1, "0" * 40))
+    new_document.add_package(Package(name="new", spdx_id="SPDXRef-New"))
+    new_document.add_relationship(Relationship("SPDXRef-Package0 DEPENDS_ON SPDXRef-New"))
+    del new_document.snippet[0]
+    new_document.name = "New document"
+    return old_document, new_document
+
+
+def test_same_documents_have_no_differences():
+    old_document, _ = create_documents()
+
+    diff = diff_documents(old_document, old_document)
+
+    assert not diff
+    assert list(diff.iter_lines()) == []
+
+
+def test_diff_documents():
+    old_document, new_document = create_documents()
+
+    diff = diff_documents(old_document, new_document)
+
+    assert diff.added["packages"] == ["SPDXRef-New"]
+    assert diff.added["relationships"] == ["SPDXRef-Package0 DEPENDS_ON SPDXRef-New"]
+    assert diff.removed["snippets"] == ["SPDXRef-Snippet0"]
+    assert diff.changed["document"] == {"document": {"name": ("synthetic-document", "New document")}}
+    assert diff.changed["packages"] == {"SPDXRef-Package0": {"versionInfo": ("1.0.0", "2.0")}}
+    assert list(diff.changed["files"]) == ["SPDXRef-File1", "SPDXRef-Renamed", "SPDXRef-File3"]
+    assert diff.changed["files"]["SPDXRef-File1"]["licenseConcluded"][1] == "MIT"
+    # matched by its checksum
+    assert diff.changed["files"]["SPDXRef-Renamed"] == {"SPDXID": ("SPDXRef-File2", "SPDXRef-Renamed")}
+    assert list(diff.changed["files"]["SPDXRef-File3"]) == ["checksums"]
+    assert not diff.added["files"] and not diff.removed["files"]
+    assert "~ packages SPDXRef-Package0 versionInfo: \"1.0.0\" -> \"2.0\"" in list(diff.iter_lines())
+
+
+@pytest.mark.parametrize("extension, writer", [(".json", json_writer), (".yaml", yaml_writer),
+                                               (".xml", xml_writer)])
+def test_streaming_diff_is_the_same(tmpdir, extension, writer):
+    old_document, new_document = create_documents()
+    file_names = []
+    for name, document in (("old", old_document), ("new", new_document)):
+        file_names.append(os.path.join(str(tmpdir), name + extension))
+        with open(file_names[-1], "w") as out:
+            writer.write_document(document, out, validate=False)
+
+    diff = diff_files(*file_names, streaming=True)
+
+    assert diff.to_dict() == diff_documents(old_document, new_document).to_dict()
+    assert diff_files(*file_names).to_dict() == diff.to_dict()
+
+
+def test_cli():
+    old_file = utils_test.get_test_loc("formats/SPDXJSONExample-v2.2.spdx.json")
+    new_file = utils_test.get_test_loc("formats/SPDXJSONExample-v2.3.spdx.json")
+    runner = CliRunner()
+
+    result = runner.invoke(main, [old_file, old_file])
+    assert result.exit_code == 0
+    assert result.output == ""
+
+    result = runner.invoke(main, [old_file, new_file, "--streaming"])
+    assert result.exit_code == 1
+    assert "+ files SPDXRef-Specification" in result.output.splitlines()
+
+    result = runner.invoke(main, [old_file, new_file, "--json"])
+    assert result.exit_code == 1
+    assert json.loads(result.output)["added"]["files"] == ["SPDXRef-Specification"]
@@ -9,7 +9,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from spdx.parsers.loggers import ErrorMessages
+import os
+
+import pytest
+
+from spdx.synthetic import create_document
+from spdx.parsers.loggers import ErrorLimitReached, ErrorMessages, ErrorRecord
+from spdx.parsers.parse_anything import parse_file
 
 
 def test_error_message_context():
@@ -28,3 +34,76 @@ def test_error_message_context():
         "lone message",
         "package2: file1: more message",
     ]
+
+
+def test_error_messages_are_formatted_lazily():
+    messages = ErrorMessages()
+    messages.push_context("package1")
+    messages.append("bad value: {0}", {"not": "formatted yet"})
+    messages.log("logged {as is}")
+
+    assert messages.records[0] == ErrorRecord(("package1",), "bad value: {0}", ({"not": "formatted yet"},))
+    assert len(messages) == 2
+    assert list(messages) == ["package1: bad value: {'not': 'formatted yet'}", "package1: logged {as is}"]
+
+
+def test_error_messages_max_errors():
+    messages = ErrorMessages(max_errors=2)
+    messages.append("first")
+    with pytest.raises(ErrorLimitReached):
+        messages.append("second")
+    with pytest.raises(ErrorLimitReached):
+        messages.append("third")
+
+    assert messages.limit_reached
+    assert messages.messages == ["first", "second"]
+
+
+def test_error_messages_context_is_a_list():
+    messages = ErrorMessages()
+    messages.context.append("package1")
+    messages.append("bad value: {0}", "foo")
+    messages.context.pop()
+    messages.append("lone message")
+
+    assert messages.context == []
+    assert messages.records[0].context == ("package1",)
+    assert messages.messages == ["package1: bad value: foo", "lone message"]
+
+    # a copy, the messages are added with append or log
+    messages.messages.append("not added")
+    assert len(messages) == 2
+    with pytest.raises(AttributeError):
+        messages.messages = ["replaced message"]
+
+
+def test_document_validate_fail_fast():
+    document = create_document(packages=2, files_per_package=2, snippets=0, relationships=0, annotations=0)
+    document.name = None
+    document.files[0].spdx_id = None
+    messages = ErrorMessages(fail_fast=True)
+    messages.push_context("outer")
+
+    document.validate(messages)
+
+    assert messages.messages == ["outer: Document has no name."]
+    assert messages.context == ["outer"]
+    assert len(document.validate(ErrorMessages(max_errors=2), incremental=True)) == 2
+    assert len(document.validate(ErrorMessages(max_errors=2), max_workers=2)) == 2
+
+
+def test_parse_file_fail_fast(tmp_path):
+    file_path = str(tmp_path / "broken.spdx")
+    with open(os.path.join(os.path.dirname(__file__), "data", "formats", "SPDXTagExample-v2.3.spdx")) as example:
+        lines = example.read().splitlines()
+    # an invalid value for every file checksum
+    lines = ["FileChecksum: broken" if line.startswith("FileChecksum:") else line for line in lines]
+    with open(file_path, "w") as broken_file:
+        broken_file.write("\n".join(lines))
+    all_messages = ErrorMessages()
+    messages = ErrorMessages(fail_fast=True)
+
+    assert parse_file(file_path, logger=all_messages)[1]
+    assert parse_file(file_path, logger=messages)[1]
+    assert len(all_messages) > 1
+    assert messages.messages == all_messages.messages[:1]
@@ -0,0 +1,154 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import pickle
+
+import pytest
+
+from spdx.synthetic import create_document
+from spdx import utils
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.file import File, FileType
+from spdx.file_table import FIELDS, FileTable, FileView, InternedColumn
+from spdx.license import ExtractedLicense, License
+from spdx.parsers.parse_anything import parse_file
+from spdx.writers import json as json_writer
+from spdx.writers import tagvalue as tagvalue_writer
+from tests import utils_test
+
+SHA1 = "d6a770ba38583ed4bb4525bd96e50461655d2758"
+
+
+def create_files():
+    plain = File("./plain.c", spdx_id="SPDXRef-Plain")
+    plain.set_checksum(Checksum(ChecksumAlgorithm.SHA1, SHA1))
+    plain.conc_lics = License.from_identifier("MIT")
+    plain.add_lics(License.from_identifier("MIT"))
+    plain.copyright = utils.NoAssert()
+
+    full = File("./full.c", spdx_id="SPDXRef-Full")
+    full.set_checksum(Checksum(ChecksumAlgorithm.SHA256, "ab" * 32))
+    full.set_checksum(Checksum(ChecksumAlgorithm.SHA1, SHA1.upper()))
+    full.file_types = [FileType.SOURCE, FileType.TEXT]
+    full.conc_lics = ExtractedLicense("LicenseRef-1")
+    full.add_lics(utils.SPDXNone())
+    full.copyright = "Copyright"
+    full.comment = "comment"
+    full.notice = "notice"
+    full.add_contrib("contributor")
+    full.add_depend("./plain.c")
+    full.add_artifact("name", "project")
+    full.add_artifact("home", "http://example.com")
+    full.add_artifact("uri", "http://example.com/project")
+
+    unnamed = File(None)
+    return [plain, full, unnamed]
+
+
+def file_fields(file):
+    return {field: getattr(file, field) for field in FIELDS}
+
+
+def test_files_read_back_unchanged():
+    files = create_files()
+    table = FileTable(files)
+    table.flush()
+
+    assert len(table) == 3
+    for view, file in zip(table, files):
+        assert isinstance(view, FileView)
+        assert file_fields(view) == file_fields(file)
+        assert list(view.checksums) == list(file.checksums)
+    assert table[-1].name is None
+    assert table[0] == files[0] and files[0] == table[0]
+    assert sorted(table[:2])[0].name == "./full.c"
+
+
+def test_last_file_is_filled_in_through_its_view():
+    table = FileTable([File("./first.c")])
+    table.append(File("./second.c"))
+
+    table[-1].file_types.append(FileType.SOURCE)
+    table[-1].spdx_id = "SPDXRef-Second"
+    table.append(File("./third.c"))
+
+    assert table[1].file_types == [FileType.SOURCE]
+    assert table[1].spdx_id == "SPDXRef-Second"
+
+
+def test_packed_file_can_be_changed():
+    table = FileTable(create_files())
+    view = table[0]
+
+    view.name = "./renamed.c"
+    view.conc_lics = License.from_identifier("Apache-2.0")
+    view.add_lics(License.from_identifier("Apache-2.0"))
+    view.set_checksum(Checksum(ChecksumAlgorithm.MD5, "cd" * 16))
+    view.comment = "comment"
+    view.file_types.append(FileType.SOURCE)
+
+    assert view.name == "./renamed.c"
+    assert view.conc_lics == License.from_identifier("Apache-2.0")
+    assert view.licenses_in_file == [License.from_identifier("MIT"), License.from_identifier("Apache-2.0")]
+    assert view.get_checksum(ChecksumAlgorithm.SHA1).value == SHA1
+    assert view.get_checksum(ChecksumAlgorithm.MD5).value == "cd" * 16
+    assert view.comment == "comment"
+    # lists read from a packed file are copies
+    assert view.file_types == []
+
+
+def test_interned_column_widens_its_indexes():
+    column = InternedColumn()
+    for value in range(300):
+        column.append(str(value))
+    column.append("0")
+
+    assert column.indexes.typecode == "H"
+    assert [column[row] for row in (0, 299, 300)] == ["0", "299", "0"]
+    assert len(column.values) == 300
+
+
+def test_view_is_pickled_as_file():
+    table = FileTable(create_files())
+
+    file = pickle.loads(pickle.dumps(table[0]))
+
+    assert isinstance(file, File)
+    assert file.name == "./plain.c"
+    assert file.get_checksum().value == SHA1
+    assert file.licenses_in_file == [License.from_identifier("MIT")]
+    assert isinstance(file.copyright, utils.NoAssert)
+
+
+def test_document_with_file_table_is_written_unchanged():
+    document = create_document(packages=2, files_per_package=3, snippets=2, relationships=1, annotations=2)
+    table_document = create_document(packages=2, files_per_package=3, snippets=2, relationships=1, annotations=2)
+    table_document.files = FileTable(table_document.files)
+
+    for writer in (json_writer, tagvalue_writer):
+        output, table_output = io.StringIO(), io.StringIO()
+        writer.write_document(document, output)
+        writer.write_document(table_document, table_output)
+        assert table_output.getvalue() == output.getvalue()
+    assert table_document.get_element("SPDXRef-File4").name == "./package1/file4.c"
+    assert utils.calc_verif_code(table_document.files) == utils.calc_verif_code(document.files)
+
+
+@pytest.mark.parametrize("test_file", ["formats/SPDXJSONExample-v2.3.spdx.json", "formats/SPDXTagExample-v2.3.spdx",
+                                       "formats/SPDXRdfExample.rdf"])
+def test_parse_file_with_file_table(test_file):
+    document, error = parse_file(utils_test.get_test_loc(test_file))
+    table_document, table_error = parse_file(utils_test.get_test_loc(test_file), file_table=True)
+
+    assert isinstance(table_document.files, FileTable)
+    assert table_error == error
+    assert [file_fields(file) for file in table_document.files] == [file_fields(file) for file in document.files]
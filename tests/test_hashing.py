@@ -0,0 +1,78 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import zlib
+
+import pytest
+
+from spdx import hashing, utils
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.file import File
+
+
+@pytest.fixture
+def test_files(tmp_path):
+    contents = [b"", b"some content", os.urandom(3 * hashing.BUFFER_SIZE + 17)]
+    paths = []
+    for number, content in enumerate(contents):
+        path = tmp_path / "file{}".format(number)
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths, contents
+
+
+def test_calculate_checksums(test_files):
+    paths, contents = test_files
+    algorithms = [ChecksumAlgorithm.SHA1, ChecksumAlgorithm.SHA3_256, ChecksumAlgorithm.BLAKE2B_384,
+                  ChecksumAlgorithm.ADLER32]
+
+    checksums = hashing.calculate_checksums(paths[2], algorithms)
+
+    assert checksums == {
+        ChecksumAlgorithm.SHA1: hashlib.sha1(contents[2]).hexdigest(),
+        ChecksumAlgorithm.SHA3_256: hashlib.sha3_256(contents[2]).hexdigest(),
+        ChecksumAlgorithm.BLAKE2B_384: hashlib.blake2b(contents[2], digest_size=48).hexdigest(),
+        ChecksumAlgorithm.ADLER32: "{:08x}".format(zlib.adler32(contents[2])),
+    }
+
+
+def test_calculate_files_checksums_keeps_order(test_files):
+    paths, contents = test_files
+
+    checksums = hashing.calculate_files_checksums(paths, [ChecksumAlgorithm.SHA256], max_workers=3)
+
+    assert checksums == [{ChecksumAlgorithm.SHA256: hashlib.sha256(content).hexdigest()} for content in contents]
+
+
+def test_unsupported_algorithm():
+    with pytest.raises(ValueError):
+        hashing.new_hasher(ChecksumAlgorithm.MD6)
+
+
+def test_file_calculate_checksum(test_files):
+    paths, contents = test_files
+    file = File(paths[1])
+
+    assert file.calculate_checksum() == hashlib.sha1(contents[1]).hexdigest()
+    assert file.calculate_checksum(ChecksumAlgorithm.MD5) == hashlib.md5(contents[1]).hexdigest()
+    with pytest.raises(ValueError):
+        file.calculate_checksum("SHA0")
+
+
+def test_calc_verif_code(test_files):
+    paths, contents = test_files
+    files = [File(path) for path in paths]
+    files[0].set_checksum(Checksum(ChecksumAlgorithm.SHA1, hashlib.sha1(contents[0]).hexdigest()))
+    file_hashes = sorted(hashlib.sha1(content).hexdigest() for content in contents)
+
+    assert utils.calc_verif_code(files) == hashlib.sha1("".join(file_hashes).encode("utf-8")).hexdigest()
@@ -46,6 +46,24 @@ class TestParser(TestCase):
         expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
         self.check_document(document, expected_loc)
 
+    def test_json_parser_incremental(self):
+        parser = jsonparser.Parser(Builder(), StandardLogger())
+        test_file = utils_test.get_test_loc('formats/SPDXJsonExample.json')
+        with io.open(test_file, encoding='utf-8') as f:
+            document, _ = parser.parse(f, incremental=True)
+        expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
+        self.check_document(document, expected_loc)
+
+    def test_json_stream_across_chunks(self):
+        test_file = utils_test.get_test_loc('formats/SPDXJSONExample-v2.3.spdx.json')
+        with io.open(test_file, encoding='utf-8') as f:
+            expected = json.load(f)
+        with io.open(test_file, 'rb') as f:
+            stream = jsonparser.JsonStream(f, chunk_size=7)
+            fields = {key: list(value) if key in ('packages', 'files', 'snippets', 'relationships') else value
+                      for key, value in jsonparser.iter_document_fields(stream)}
+        assert fields == expected
+
     def test_yaml_parser(self):
         parser = yamlparser.Parser(Builder(), StandardLogger())
         test_file = utils_test.get_test_loc('formats/SPDXYamlExample.yaml')
@@ -54,6 +72,24 @@ class TestParser(TestCase):
         expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
         self.check_document(document, expected_loc)
 
+    def test_yaml_parser_incremental(self):
+        parser = yamlparser.Parser(Builder(), StandardLogger())
+        test_file = utils_test.get_test_loc('formats/SPDXYamlExample.yaml')
+        with io.open(test_file, encoding='utf-8') as f:
+            document, _ = parser.parse(f, incremental=True)
+        expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
+        self.check_document(document, expected_loc)
+
+    def test_yaml_iter_document_fields(self):
+        test_file = utils_test.get_test_loc('formats/SPDXYamlExample.yaml')
+        with io.open(test_file, encoding='utf-8') as f:
+            expected = yamlparser.yaml.load(f, Loader=yamlparser.SafeLoader)["Document"]
+        with io.open(test_file, encoding='utf-8') as f:
+            loader = yamlparser.StreamLoader(f)
+            fields = {key: list(value) if key in ('packages', 'files', 'snippets', 'relationships') else value
+                      for key, value in yamlparser.iter_document_fields(loader)}
+        assert fields == expected
+
     def test_xml_parser(self):
         parser = xmlparser.Parser(Builder(), StandardLogger())
         test_file = utils_test.get_test_loc('formats/SPDXXmlExample.xml')
@@ -62,6 +98,38 @@ class TestParser(TestCase):
         expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
         self.check_document(document, expected_loc)
 
+    def test_xml_parser_incremental(self):
+        parser = xmlparser.Parser(Builder(), StandardLogger())
+        test_file = utils_test.get_test_loc('formats/SPDXXmlExample.xml')
+        with io.open(test_file, encoding='utf-8') as f:
+            document, _ = parser.parse(f, incremental=True)
+        expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
+        self.check_document(document, expected_loc)
+
+    def test_xml_read_document(self):
+        xml = io.StringIO(
+            '<Document><name>doc</name><comment></comment><creationInfo><creators>Tool: a</creators>'
+            '</creationInfo><packages><name>a</name></packages><annotations><comment>x</comment></annotations>'
+            '<packages><name>b</name></packages><packages><name>c</name><checksums k="v">1</checksums>'
+            '</packages></Document>')
+        assert xmlparser.read_document(xml) == {
+            'name': 'doc',
+            'comment': None,
+            'creationInfo': {'creators': ['Tool: a']},
+            'packages': [{'name': 'a'}, {'name': 'b'}, {'name': 'c', 'checksums': [{'@k': 'v', '#text': '1'}]}],
+            'annotations': [{'comment': 'x'}],
+        }
+        assert xmlparser.read_document(io.StringIO('<SpdxDocument><name>doc</name></SpdxDocument>')) is None
+
+    def test_xml_iter_document_fields(self):
+        xml = io.StringIO(
+            '<Document><name>doc</name><packages><name>a</name></packages><packages><name>b</name></packages>'
+            '<annotations><comment>x</comment></annotations><packages><name>c</name></packages></Document>')
+        fields = [(field, list(value) if field == 'packages' else value)
+                  for field, value in xmlparser.iter_document_fields(xml)]
+        assert fields == [('name', 'doc'), ('packages', [{'name': 'a'}, {'name': 'b'}]),
+                          ('annotations', [{'comment': 'x'}]), ('packages', [{'name': 'c'}])]
+
     def test_sbomyaml_parser(self):
         parser = yamlparser.Parser(Builder(), StandardLogger())
         test_file = utils_test.get_test_loc('formats/SPDXSBOMExample.spdx.yml')
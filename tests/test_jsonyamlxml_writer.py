@@ -1,4 +1,6 @@
 import glob
+import io
+import json
 import os
 from datetime import datetime
 from typing import List
@@ -14,7 +16,10 @@ from spdx.parsers.parse_anything import parse_file
 from spdx.relationship import Relationship
 from spdx.snippet import Snippet
 from spdx.utils import update_dict_item_with_new_item
+from spdx.writers import json as json_writer
 from spdx.writers import write_anything
+from spdx.writers import yaml as yaml_writer
+from tests import utils_test
 from tests.test_rdf_writer import minimal_document_with_package
 
 tested_formats: List[str] = ['yaml', 'xml', 'json']
@@ -162,3 +167,37 @@ def test_update_dict_item_with_new_item(key, value, expected_length):
     assert key in current_state
     assert value in current_state[key]
     assert len(current_state[key]) == expected_length
+
+
+@pytest.mark.parametrize("test_file", ["formats/SPDXJsonExample.json", "formats/SPDXJSONExample-v2.3.spdx.json",
+                                       "formats/SPDXTagExample-v2.3.spdx"])
+def test_streaming_json_writer_output_is_unchanged(test_file):
+    document, _ = parse_file(utils_test.get_test_loc(test_file))
+    streamed = io.StringIO()
+    dumped = io.StringIO()
+
+    json_writer.write_document(document, streamed, validate=False)
+    json_writer.write_document(document, dumped, validate=False, streaming=False)
+
+    assert streamed.getvalue() == dumped.getvalue()
+
+
+def test_streaming_json_writer_empty_elements():
+    streamed = io.StringIO()
+
+    json_writer.stream_document(iter([("packages", iter([])), ("name", {})]), streamed)
+
+    assert streamed.getvalue() == json.dumps({"packages": [], "name": {}}, indent=4)
+
+
+@pytest.mark.parametrize("test_file", ["formats/SPDXYamlExample.yaml", "formats/SPDXJSONExample-v2.3.spdx.json",
+                                       "formats/SPDXTagExample-v2.3.spdx"])
+def test_streaming_yaml_writer_output_is_unchanged(test_file):
+    document, _ = parse_file(utils_test.get_test_loc(test_file))
+    streamed = io.BytesIO()
+    dumped = io.BytesIO()
+
+    yaml_writer.write_document(document, streamed, validate=False, streaming=True)
+    yaml_writer.write_document(document, dumped, validate=False)
+
+    assert streamed.getvalue() == dumped.getvalue()
@@ -12,12 +12,20 @@
 
 import io
 import json
+import os
+import tempfile
 import unittest
 from collections import OrderedDict
+from contextlib import redirect_stdout
+
+from rdflib import BNode, Graph, Literal, URIRef
+
+from spdx.synthetic import create_document
 
 from spdx.parsers import rdf
 from spdx.parsers.loggers import StandardLogger
 from spdx.parsers.rdfbuilders import Builder as RDFBuilder
+from spdx.writers.rdf import write_document
 
 from tests import utils_test
 from tests.utils_test import TestParserUtils
@@ -34,6 +42,101 @@ class TestParser(unittest.TestCase):
         expected_loc = utils_test.get_test_loc('doc_parse/spdx-expected.json', test_data_dir=utils_test.test_data_dir)
         self.check_document(document, expected_loc, regen=regen)
 
+    def test_rdf_parser_incremental(self):
+        parser = rdf.Parser(RDFBuilder(), StandardLogger())
+        test_file = utils_test.get_test_loc('formats/SPDXRdfExample.rdf', test_data_dir=utils_test.test_data_dir)
+        with io.open(test_file, 'rb') as f:
+            document, error = parser.parse(f, incremental=True)
+        assert not error
+        expected_loc = utils_test.get_test_loc('doc_parse/spdx-expected.json', test_data_dir=utils_test.test_data_dir)
+        self.check_document(document, expected_loc)
+
+    def test_rdf_parser_incremental_synthetic_document(self):
+        documents = []
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            file_name = os.path.join(temporary_directory, "document.rdf.xml")
+            with open(file_name, "wb") as out:
+                write_document(create_document(packages=2, files_per_package=3, snippets=2, relationships=2,
+                                               annotations=2, license_depth=4), out, validate=False)
+            for incremental in (False, True):
+                parser = rdf.Parser(RDFBuilder(), StandardLogger())
+                with open(file_name) as f, redirect_stdout(io.StringIO()):
+                    documents.append(parser.parse(f, incremental=incremental)[0])
+        document, incremental_document = documents
+
+        assert sorted(file.spdx_id for file in incremental_document.files) == sorted(
+            file.spdx_id for file in document.files)
+        assert sorted(str(file.conc_lics) for file in incremental_document.files) == sorted(
+            str(file.conc_lics) for file in document.files)
+        assert sorted(relationship.relationship for relationship in incremental_document.relationships) == sorted(
+            relationship.relationship for relationship in document.relationships)
+        assert sorted(snippet.spdx_id for snippet in incremental_document.snippet) == sorted(
+            snippet.spdx_id for snippet in document.snippet)
+        assert len(incremental_document.annotations) == len(document.annotations)
+        assert [lic.identifier for lic in incremental_document.extracted_licenses] == [
+            lic.identifier for lic in document.extracted_licenses]
+
+    def test_rdf_xml_stream(self):
+        data = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:s="http://spdx.org/rdf/terms#"
+         xml:base="http://example.com/document">
+  <s:SpdxDocument rdf:about="#SPDXRef-DOCUMENT" s:name="document">
+    <s:dataLicense rdf:resource="http://spdx.org/licenses/CC0-1.0"/>
+    <s:creationInfo rdf:parseType="Resource">
+      <s:created>2022-01-01T00:00:00Z</s:created>
+    </s:creationInfo>
+    <s:referencesFile>
+      <rdf:Description rdf:nodeID="file">
+        <s:fileName xml:lang="en">./file.c</s:fileName>
+      </rdf:Description>
+    </s:referencesFile>
+  </s:SpdxDocument>
+</rdf:RDF>"""
+        spdx = rdf.Namespace("http://spdx.org/rdf/terms#")
+        document = URIRef("http://example.com/document#SPDXRef-DOCUMENT")
+        file = BNode("file")
+
+        events = list(rdf.RdfXmlStream(io.BytesIO(data)).events())
+        creation_info = events[5][1]
+
+        assert events == [
+            ("start", document),
+            ("triple", (document, rdf.RDF.type, spdx["SpdxDocument"])),
+            ("triple", (document, spdx["name"], Literal("document"))),
+            ("triple", (document, spdx["dataLicense"], URIRef("http://spdx.org/licenses/CC0-1.0"))),
+            ("triple", (document, spdx["creationInfo"], creation_info)),
+            ("start", creation_info),
+            ("triple", (creation_info, spdx["created"], Literal("2022-01-01T00:00:00Z"))),
+            ("end", creation_info),
+            ("triple", (document, spdx["referencesFile"], file)),
+            ("start", file),
+            ("triple", (file, spdx["fileName"], Literal("./file.c", lang="en"))),
+            ("end", file),
+            ("end", document),
+        ]
+
+    def test_dispatch_fields(self):
+        parser = rdf.Parser(RDFBuilder(), StandardLogger())
+        parser.graph = Graph()
+        package = URIRef("http://example.com/document#SPDXRef-Package")
+        summary = parser.spdx_namespace["summary"]
+        version_info = parser.spdx_namespace["versionInfo"]
+        parser.graph.add((package, summary, Literal("summary")))
+        parser.graph.add((package, version_info, Literal("1.0")))
+        parser.graph.add((package, version_info, Literal("2.0")))
+        parser.graph.add((package, parser.spdx_namespace["unknown"], Literal("ignored")))
+
+        objects = parser.predicate_objects(package)
+        handled = []
+        parser.dispatch_fields(package, objects, [
+            (version_info, lambda term, values: handled.append(("version", term, sorted(values)))),
+            (parser.spdx_namespace["comment"], lambda term, values: handled.append(("comment", term, values))),
+            (summary, lambda term, values: handled.append(("summary", term, values))),
+        ])
+
+        assert handled == [("version", package, [Literal("1.0"), Literal("2.0")]),
+                           ("summary", package, [Literal("summary")])]
+
     def check_document(self, document, expected_loc, regen=False):
         result = TestParserUtils.to_dict(document)
 
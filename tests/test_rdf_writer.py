@@ -1,8 +1,12 @@
 import os
+import subprocess
+import sys
 
 import pytest
 from rdflib import URIRef
 
+from spdx.synthetic import create_document
+
 from spdx.document import Document
 from spdx.license import License
 from spdx.package import Package, ExternalPackageRef
@@ -11,7 +15,7 @@ from spdx.parsers.parse_anything import parse_file
 from spdx.parsers.rdf import Parser
 from spdx.parsers.rdfbuilders import Builder
 from spdx.utils import NoAssert
-from spdx.writers.rdf import Writer
+from spdx.writers.rdf import Writer, write_document
 
 
 @pytest.fixture
@@ -62,6 +66,53 @@ def test_external_package_references(temporary_file_path) -> None:
     assert second_ref.category in parsed_reference_categories
 
 
+WRITE_SYNTHETIC_DOCUMENT = """
+import sys
+from spdx.synthetic import create_document
+from spdx.writers.rdf import write_document
+write_document(create_document(packages=2, files_per_package=3, snippets=2), sys.stdout.buffer, validate=False)
+"""
+
+
+def test_output_does_not_depend_on_hash_seed() -> None:
+    outputs = []
+    for hash_seed in ("1", "2"):
+        environment = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        outputs.append(subprocess.run([sys.executable, "-c", WRITE_SYNTHETIC_DOCUMENT], env=environment,
+                                      stdout=subprocess.PIPE, check=True,
+                                      cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout)
+
+    assert outputs[0] == outputs[1]
+    assert b"rdf:nodeID=" in outputs[0]
+
+
+def parse_written_document(document, file_path, canonicalize) -> Document:
+    with open(file_path, "wb") as out:
+        write_document(document, out, validate=False, canonicalize=canonicalize)
+    return parse_file(file_path)[0]
+
+
+def test_output_matches_canonicalized_output(temporary_file_path) -> None:
+    document = create_document(packages=2, files_per_package=3, snippets=2)
+
+    parsed_document = parse_written_document(document, temporary_file_path, canonicalize=False)
+    canonical_document = parse_written_document(document, temporary_file_path, canonicalize=True)
+
+    assert [package.name for package in parsed_document.packages] == [package.name for package in
+                                                                       document.packages]
+    assert sorted(file.name for file in parsed_document.files) == sorted(file.name for file in document.files)
+    assert sorted(relationship.relationship for relationship in parsed_document.relationships) == sorted(
+        relationship.relationship for relationship in canonical_document.relationships)
+    assert sorted(snippet.spdx_id for snippet in parsed_document.snippet) == sorted(
+        snippet.spdx_id for snippet in canonical_document.snippet)
+    assert license_words_by_file(parsed_document) == license_words_by_file(canonical_document)
+
+
+def license_words_by_file(document: Document) -> dict:
+    # the parser does not keep the order of the members of license sets
+    return {file.name: sorted(str(file.conc_lics).split()) for file in document.files}
+
+
 def minimal_document_with_package() -> Document:
     document = Document(data_license=License.from_identifier('CC0-1.0'))
     document.creation_info.set_created_now()
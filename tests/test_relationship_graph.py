@@ -0,0 +1,131 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from click.testing import CliRunner
+
+from spdx.synthetic import create_document
+from spdx.cli_tools.graph import main
+from spdx.relationship import Relationship
+from spdx.relationship_graph import RelationshipGraph
+from tests import utils_test
+
+
+def create_graph():
+    return RelationshipGraph(Relationship(relationship) for relationship in [
+        "SPDXRef-A DEPENDS_ON SPDXRef-B",
+        "SPDXRef-B DEPENDS_ON SPDXRef-C",
+        "SPDXRef-D DEPENDENCY_OF SPDXRef-C",
+        "SPDXRef-A DEPENDS_ON SPDXRef-C",
+        "SPDXRef-P CONTAINS SPDXRef-F",
+        "SPDXRef-F CONTAINED_BY SPDXRef-Q",
+        "SPDXRef-A STATIC_LINK SPDXRef-F",
+    ])
+
+
+def test_successors_and_predecessors():
+    graph = create_graph()
+
+    assert graph.successors("SPDXRef-A") == ["SPDXRef-B", "SPDXRef-C", "SPDXRef-F"]
+    assert graph.successors("SPDXRef-C", ["DEPENDS_ON"]) == ["SPDXRef-D"]
+    assert graph.successors("SPDXRef-C", ["DEPENDENCY_OF"]) == ["SPDXRef-B", "SPDXRef-A"]
+    assert graph.predecessors("SPDXRef-F", ["CONTAINS"]) == ["SPDXRef-P", "SPDXRef-Q"]
+    assert graph.predecessors("SPDXRef-F") == ["SPDXRef-P", "SPDXRef-A", "SPDXRef-Q"]
+    assert graph.successors("SPDXRef-Unknown") == []
+
+
+def test_transitive_and_reverse_reachability():
+    graph = create_graph()
+
+    assert graph.reachable("SPDXRef-A", ["DEPENDS_ON"]) == ["SPDXRef-B", "SPDXRef-C", "SPDXRef-D"]
+    assert graph.reachable("SPDXRef-A", ["DEPENDS_ON"], max_depth=1) == ["SPDXRef-B", "SPDXRef-C"]
+    assert graph.reachable("SPDXRef-D", ["DEPENDS_ON"], reverse=True) == ["SPDXRef-C", "SPDXRef-B", "SPDXRef-A"]
+    assert graph.reachable("SPDXRef-D", ["DEPENDENCY_OF"]) == ["SPDXRef-C", "SPDXRef-B", "SPDXRef-A"]
+    assert graph.reachable("SPDXRef-A", ["DESCRIBES"]) == []
+
+
+def test_find_cycles():
+    graph = RelationshipGraph(Relationship(relationship) for relationship in [
+        "SPDXRef-A DEPENDS_ON SPDXRef-B",
+        "SPDXRef-B DEPENDS_ON SPDXRef-C",
+        "SPDXRef-A DEPENDENCY_OF SPDXRef-C",
+        "SPDXRef-C CONTAINS SPDXRef-D",
+        "SPDXRef-D DEPENDS_ON SPDXRef-D",
+        "SPDXRef-E CONTAINS SPDXRef-C",
+    ])
+
+    assert graph.find_cycles(["DEPENDS_ON"]) == [["SPDXRef-A", "SPDXRef-B", "SPDXRef-C"], ["SPDXRef-D"]]
+    assert not graph.has_cycle(["CONTAINS"])
+    assert graph.reachable("SPDXRef-A", ["DEPENDS_ON"]) == ["SPDXRef-B", "SPDXRef-C", "SPDXRef-A"]
+
+
+def test_relationship_and_its_inverse_type():
+    graph = RelationshipGraph([Relationship("SPDXRef-F CONTAINED_BY SPDXRef-P")])
+
+    assert graph.successors("SPDXRef-F", ["CONTAINED_BY"]) == ["SPDXRef-P"]
+    assert graph.successors("SPDXRef-F", ["CONTAINED_BY", "CONTAINS"]) == ["SPDXRef-P"]
+    assert graph.successors("SPDXRef-F") == ["SPDXRef-P"]
+    assert graph.successors("SPDXRef-P", ["CONTAINS"]) == ["SPDXRef-F"]
+    assert graph.successors("SPDXRef-P") == ["SPDXRef-F"]
+    assert graph.predecessors("SPDXRef-P", ["CONTAINED_BY", "CONTAINS"]) == ["SPDXRef-F"]
+
+
+def test_inverse_relationships_are_not_cycles():
+    graph = RelationshipGraph(Relationship(relationship) for relationship in [
+        "SPDXRef-A CONTAINS SPDXRef-B",
+        "SPDXRef-B CONTAINED_BY SPDXRef-A",
+        "SPDXRef-DOCUMENT DESCRIBES SPDXRef-A",
+        "SPDXRef-A DESCRIBED_BY SPDXRef-DOCUMENT",
+    ])
+
+    assert not graph.has_cycle()
+    assert graph.find_cycles(["CONTAINS", "CONTAINED_BY"]) == []
+    assert graph.find_cycles(["CONTAINED_BY"]) == []
+    assert graph.successors("SPDXRef-A", ["CONTAINS"]) == ["SPDXRef-B"]
+    assert graph.successors("SPDXRef-B", ["CONTAINED_BY"]) == ["SPDXRef-A"]
+    assert graph.relationship_types == ["CONTAINS", "CONTAINED_BY", "DESCRIBES", "DESCRIBED_BY"]
+
+
+def test_long_chain_and_malformed_relationships():
+    relationships = [Relationship("SPDXRef-{} DEPENDS_ON SPDXRef-{}".format(number, number + 1))
+                     for number in range(5000)]
+    relationships.append(Relationship("SPDXRef-5000 DEPENDS_ON"))
+    graph = RelationshipGraph(relationships)
+
+    assert len(graph) == 5001
+    assert graph.edge_count == 5000
+    assert graph.skipped_relationships == 1
+    assert graph.reachable("SPDXRef-0")[-1] == "SPDXRef-5000"
+    assert not graph.has_cycle()
+
+
+def test_graph_from_document():
+    document = create_document(packages=2, files_per_package=2, snippets=0, relationships=1, annotations=0)
+
+    graph = RelationshipGraph.from_document(document)
+
+    assert graph.reachable("SPDXRef-Package0", ["DEPENDS_ON", "CONTAINS"]) == \
+           ["SPDXRef-File0", "SPDXRef-File1", "SPDXRef-Package1", "SPDXRef-File2", "SPDXRef-File3"]
+
+
+def test_cli():
+    file_name = utils_test.get_test_loc("formats/SPDXJSONExample-v2.3.spdx.json")
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["--file", file_name, "--id", "SPDXRef-JenaLib", "--type", "CONTAINS",
+                                  "--reverse", "--max-depth", "1"])
+    assert result.exit_code == 0
+    assert result.output.split() == ["SPDXRef-Package"]
+
+    result = runner.invoke(main, ["--file", file_name, "--cycles"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["SPDXRef-Package SPDXRef-JenaLib"]
+
+    assert runner.invoke(main, ["--file", file_name]).exit_code != 0
@@ -9,6 +9,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
+import re
 import sys
 from datetime import datetime
 from unittest import TestCase
@@ -16,11 +19,13 @@ from unittest import TestCase
 import spdx
 from spdx import utils
 from spdx.package import PackagePurpose
-from spdx.parsers.tagvalue import Parser
-from spdx.parsers.lexers.tagvalue import Lexer
+from spdx.parsers import _build_tables
+from spdx.parsers.tagvalue import Parser, PARSETAB_MODULE
+from spdx.parsers.lexers.tagvalue import Lexer, LineLexer
 from spdx.parsers.tagvaluebuilders import Builder
 from spdx.parsers.loggers import StandardLogger
 from spdx.version import Version
+from spdx.writers.tagvalue import write_document
 
 document_str = '\n'.join([
         'SPDXVersion: SPDX-2.1',
@@ -116,6 +121,12 @@ annotation_str = '\n'.join([
 ])
 
 
+def write_tag_value(document):
+    out = io.StringIO()
+    write_document(document, out, validate=False)
+    return out.getvalue()
+
+
 class TestLexer(TestCase):
     maxDiff = None
 
@@ -297,6 +308,62 @@ class TestLexer(TestCase):
         assert token.lineno == line
 
 
+class TestLineLexer(TestLexer):
+
+    def setUp(self):
+        self.l = LineLexer()
+        self.l.build()
+
+    def tokens(self, lexer, data):
+        lexer.input(data)
+        return [(token.type, token.value, token.lineno, token.lexpos) for token in iter(lexer.token, None)]
+
+    def assert_same_tokens(self, data):
+        lexer = Lexer()
+        lexer.build(reflags=re.UNICODE)
+        self.assertEqual(self.tokens(self.l, data), self.tokens(lexer, data))
+
+    def test_same_tokens_as_lexer(self):
+        data_dir = os.path.join(os.path.dirname(__file__), 'data', 'formats')
+        for file_name in ['SPDXTagExample.tag', 'SPDXTagExample-v2.2.spdx', 'SPDXTagExample-v2.3.spdx',
+                          'SPDXSBOMExample.tag', 'SPDXSimpleTag.tag']:
+            with open(os.path.join(data_dir, file_name)) as file:
+                self.assert_same_tokens(file.read())
+
+    def test_same_tokens_as_lexer_for_irregular_lines(self):
+        self.assert_same_tokens('\n'.join([
+            '  # comment',
+            '  PackageName : Test',
+            '',
+            '   ',
+            'PackageComment:',
+            '<text>A comment',
+            '',
+            'on three lines</text>  FileType: SOURCE',
+            'PackageSummary: ',
+            'PackageName: Test',
+            'Created:',
+            'Tag: <text>unused</text>  # comment',
+            'Created: 2010-02-03T00:00:00Z trailing',
+            'SnippetByteRange: 310:420 ',
+            '123 : value',
+            'FileComment:',
+        ]))
+
+    def test_unclosed_text(self):
+        self.assert_same_tokens('PackageName: Test\nPackageComment: <text>not closed\nPackageVersion: 1\n')
+
+    def test_value_continued_on_next_line(self):
+        self.assert_same_tokens('PackageChecksum: SHA1:\n 85ed0817af83a24ad8da68c2b5094de69833983c\n'
+                                'PackageVersion: 1\nCreated: 2010-02-03T00:00:00Z')
+
+    def test_file_input(self):
+        self.l.input(io.StringIO(document_str))
+        self.token_assert_helper(self.l.token(), 'DOC_VERSION', 'SPDXVersion', 1)
+        self.token_assert_helper(self.l.token(), 'LINE', 'SPDX-2.1', 1)
+        assert len(list(iter(self.l.token, None))) == 10
+
+
 class TestParser(TestCase):
     maxDiff = None
     complete_str = '{0}\n{1}\n{2}\n{3}\n{4}\n{5}\n{6}'.format(document_str, creation_str, review_str, package_str,
@@ -306,6 +373,10 @@ class TestParser(TestCase):
         self.p = Parser(Builder(), StandardLogger())
         self.p.build()
 
+    def test_packaged_parse_tables_are_current(self):
+        assert _build_tables.tables_are_current(self.p, PARSETAB_MODULE)
+        assert _build_tables.tables_are_current(utils.LicenseListParser(), utils.LICENSE_PARSETAB_MODULE)
+
     def test_doc(self):
         document, error = self.p.parse(self.complete_str)
         assert document is not None
@@ -409,3 +480,14 @@ class TestParser(TestCase):
         assert document.snippet[-1].byte_range[1] == 420
         assert document.snippet[-1].line_range[0] == 5
         assert document.snippet[-1].line_range[1] == 23
+
+    def test_parse_file_object(self):
+        document, error = self.p.parse(io.StringIO(self.complete_str))
+        assert not error
+        assert document.snippet[-1].spdx_id == 'SPDXRef-Snippet'
+
+        parser = Parser(Builder(), StandardLogger())
+        parser.build(line_lexer=False)
+        ply_document, ply_error = parser.parse(io.StringIO(self.complete_str))
+        assert not ply_error
+        assert write_tag_value(ply_document) == write_tag_value(document)
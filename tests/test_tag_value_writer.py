@@ -0,0 +1,60 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import StringIO
+
+from spdx.synthetic import create_document
+from spdx.writers import tagvalue
+
+
+def write_tag_value(document, streaming=True):
+    out = StringIO()
+    tagvalue.write_document(document, out, validate=False, streaming=streaming)
+    return out.getvalue()
+
+
+def test_all_files_of_a_package_with_snippets_are_written():
+    document = create_document(packages=2, files_per_package=3, snippets=6, relationships=0, annotations=0)
+
+    output = write_tag_value(document)
+
+    file_ids = [line.split(": ")[1] for line in output.splitlines() if line.startswith("SPDXID: SPDXRef-File")]
+    assert file_ids == ["SPDXRef-File{}".format(number) for number in range(6)]
+    assert output.count("# Snippet\n") == 6
+    # each snippet follows the file it is from
+    assert output.index("SnippetSPDXID: SPDXRef-Snippet4") > output.index("SPDXID: SPDXRef-File4") > \
+           output.index("SnippetSPDXID: SPDXRef-Snippet3")
+
+
+def test_streaming_and_buffered_output_are_equal():
+    document = create_document(packages=3, files_per_package=2, snippets=4, relationships=2, annotations=2)
+
+    assert write_tag_value(document, streaming=True) == write_tag_value(document, streaming=False)
+
+
+def test_iter_document_chunks_writes_one_chunk_per_package():
+    document = create_document(packages=3, files_per_package=2, snippets=0, relationships=0, annotations=0)
+
+    chunks = list(tagvalue.iter_document_chunks(document))
+
+    # the document information, the packages and the extracted licenses
+    assert len(chunks) == 5
+    assert [chunk.startswith("# Package\n") for chunk in chunks] == [False, True, True, True, False]
+    assert chunks[1].count("# File\n") == 2
+
+
+def test_determine_files_containing_snippets():
+    document = create_document(packages=1, files_per_package=2, snippets=3, relationships=0, annotations=0)
+    document.snippet[2].snip_from_file_spdxid = "SPDXRef-Unknown"
+
+    snippets_by_file_id = tagvalue.determine_files_containing_snippets(document.snippet, document.files)
+
+    assert snippets_by_file_id == {"SPDXRef-File0": [document.snippet[0]], "SPDXRef-File1": [document.snippet[1]]}
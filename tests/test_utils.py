@@ -0,0 +1,96 @@
+# Copyright (c) 2022 spdx contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+from unittest import TestCase
+
+from spdx import utils
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.file import File, FileType
+from spdx.license import License, LicenseConjunction, LicenseDisjunction
+from spdx.package import Package
+from spdx.parsers.loggers import ErrorMessages
+from spdx.relationship import Relationship
+
+
+class TestLicenseExpressionParsing(TestCase):
+    maxDiff = None
+
+    def test_parse_license_expression(self):
+        lic = utils.parse_license_expression("MIT AND (Apache-2.0 OR LicenseRef-1)")
+
+        assert isinstance(lic, LicenseConjunction)
+        assert lic.license_1 == License.from_identifier("MIT")
+        assert isinstance(lic.license_2, LicenseDisjunction)
+        assert lic.identifier == "MIT AND (Apache-2.0 OR LicenseRef-1)"
+
+    def test_parse_license_expression_is_memoized(self):
+        first = utils.parse_license_expression("GPL-2.0-only OR MIT")
+        second = utils.parse_license_expression("GPL-2.0-only OR MIT")
+
+        assert first is second
+
+    def test_license_list_parser_is_shared(self):
+        assert utils.get_license_list_parser() is utils.get_license_list_parser()
+
+    def test_parse_invalid_license_expression(self):
+        assert utils.parse_license_expression("MIT AND") is None
+
+
+class TestContainmentIndex(TestCase):
+    maxDiff = None
+
+    def test_containment_index(self):
+        package1 = Package(name="package1", spdx_id="SPDXRef-Package1")
+        package2 = Package(name="package2", spdx_id="SPDXRef-Package2")
+        file1 = File("file1", spdx_id="SPDXRef-File1")
+        file2 = File("file2", spdx_id="SPDXRef-File2")
+        commented = Relationship("SPDXRef-File2 CONTAINED_BY SPDXRef-Package1", "some comment")
+        describes = Relationship("SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package1")
+        unknown_file = Relationship("SPDXRef-Package2 CONTAINS SPDXRef-File3")
+        relationships = [Relationship("SPDXRef-Package1 CONTAINS SPDXRef-File1"), commented, describes,
+                         Relationship("SPDXRef-Package2 CONTAINS SPDXRef-File1"), unknown_file,
+                         Relationship("SPDXRef-Package1 CONTAINS SPDXRef-File1")]
+
+        index = utils.ContainmentIndex([package1, package2], [file1, file2], relationships)
+
+        assert index.files_in_package("SPDXRef-Package1") == [file1, file2]
+        assert index.files_in_package("SPDXRef-Package2") == [file1]
+        assert index.package_ids_of_file("SPDXRef-File1") == ["SPDXRef-Package1", "SPDXRef-Package2"]
+        assert index.package_ids_of_file("SPDXRef-File3") == []
+        assert index.relationships_to_write == [commented, describes, unknown_file]
+        assert utils.get_files_in_package(package2, [file1, file2], relationships) == [file1]
+
+
+class TestLazyCollection(TestCase):
+
+    def test_collections_are_created_on_first_access(self):
+        file = File("file1", spdx_id="SPDXRef-File1")
+
+        assert not hasattr(file, "__dict__")
+        file.validate(ErrorMessages())
+        assert not hasattr(file, "_contributors")
+        assert file.contributors == []
+        file.add_contrib("contributor")
+        assert file.contributors == ["contributor"]
+        file.file_types.append(FileType.SOURCE)
+        assert file.file_types == [FileType.SOURCE]
+
+    def test_slotted_elements_can_be_pickled(self):
+        file = File("file1", spdx_id="SPDXRef-File1")
+        file.set_checksum(Checksum(ChecksumAlgorithm.SHA1, "85ed0817af83a24ad8da68c2b5094de69833983c"))
+        relationship = Relationship("SPDXRef-Package1 CONTAINS SPDXRef-File1", "some comment")
+
+        copied_file, copied_relationship = pickle.loads(pickle.dumps((file, relationship)))
+
+        assert copied_file.get_checksum() == file.get_checksum()
+        assert copied_file.dependencies == []
+        assert copied_relationship.relationship_comment == "some comment"